@@ -12,10 +12,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
-from copy import copy
+from copy import copy, deepcopy
 
 import json
-import requests
 from requests import HTTPError, RequestException
 import os
 import time
@@ -28,6 +27,8 @@ from mycroft.identity import IdentityManager, identity_lock
 from mycroft.version import VersionManager
 from mycroft.util import get_arch, connected, LOG
 
+from .pool import get_caches, get_session
+
 
 _paired_cache = False
 
@@ -42,9 +43,6 @@ class InternetDown(RequestException):
 
 class Api:
     """ Generic class to wrap web APIs """
-    params_to_etag = {}
-    etag_to_response = {}
-
     def __init__(self, path):
         self.path = path
 
@@ -57,6 +55,12 @@ class Api:
         config_server = config.get("server")
         self.url = config_server.get("url")
         self.version = config_server.get("version")
+        self.session = get_session(config_server.get("pool"))
+        cache_config = config_server.get("cache") or {}
+        self.cache_ttl = cache_config.get("ttl") or {}
+        # Process wide caches, (path, query): (etag, response) and
+        # (url, path): data from the read mostly endpoints
+        self.etag_cache, self.response_cache = get_caches(cache_config)
         self.identity = IdentityManager.get()
 
     def request(self, params):
@@ -65,6 +69,32 @@ class Api:
         self.old_params = copy(params)
         return self.send(params)
 
+    def cached_request(self, params, name):
+        """Request data, reusing a recent response for the same request.
+
+        Responses are cached process wide for the TTL configured for the
+        endpoint name in server.cache.ttl, no TTL disables caching.
+
+        Arguments:
+            params (dict): request parameters
+            name (str): endpoint name used to look up the TTL
+
+        Returns:
+            data fetched from server
+        """
+        ttl = self.cache_ttl.get(name)
+        if not ttl:
+            return self.request(params)
+
+        key = (self.url, self.version, self.path + params.get("path", ""))
+        data = self.response_cache.get(key)
+        if data is None:
+            data = self.request(params)
+            self.response_cache.put(key, deepcopy(data), ttl)
+            return data
+        # Callers are free to modify the data, don't hand out the cached copy
+        return deepcopy(data)
+
     def check_token(self):
         # If the identity hasn't been loaded, load it
         if not self.identity.has_refresh():
@@ -119,7 +149,7 @@ class Api:
         """
         query_data = frozenset(params.get('query', {}).items())
         params_key = (params.get('path'), query_data)
-        etag = self.params_to_etag.get(params_key)
+        etag, cached_response = self.etag_cache.get(params_key, (None, None))
 
         method = params.get("method", "GET")
         headers = self.build_headers(params)
@@ -133,18 +163,17 @@ class Api:
         if etag:
             headers['If-None-Match'] = etag
 
-        response = requests.request(
+        response = self.session.request(
             method, url, headers=headers, params=query,
             data=data, json=json_body, timeout=(3.05, 15)
         )
-        if response.status_code == 304:
+        if response.status_code == 304 and cached_response is not None:
             # Etag matched, use response previously cached
-            response = self.etag_to_response[etag]
+            response = cached_response
         elif 'ETag' in response.headers:
             etag = response.headers['ETag'].strip('"')
             # Cache response for future lookup when we receive a 304
-            self.params_to_etag[params_key] = etag
-            self.etag_to_response[etag] = response
+            self.etag_cache.put(params_key, (etag, response))
 
         return self.get_response(response, no_refresh)
 
@@ -303,9 +332,9 @@ class DeviceApi(Api):
         Returns:
             str: JSON string with user configuration information.
         """
-        return self.request({
+        return self.cached_request({
             "path": "/" + self.identity.uuid + "/setting"
-        })
+        }, "settings")
 
     def get_location(self):
         """ Retrieve device location information from the web backend
@@ -313,9 +342,9 @@ class DeviceApi(Api):
         Returns:
             str: JSON string with user location.
         """
-        return self.request({
+        return self.cached_request({
             "path": "/" + self.identity.uuid + "/location"
-        })
+        }, "location")
 
     def get_subscription(self):
         """
@@ -324,8 +353,9 @@ class DeviceApi(Api):
 
             Returns: dictionary with subscription information
         """
-        return self.request({
-            'path': '/' + self.identity.uuid + '/subscription'})
+        return self.cached_request({
+            'path': '/' + self.identity.uuid + '/subscription'},
+            'subscription')
 
     @property
     def is_subscriber(self):
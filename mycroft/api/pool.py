@@ -0,0 +1,162 @@
+# Copyright 2019 Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Connection pool and response cache shared by all backend API calls."""
+import time
+from collections import OrderedDict
+from threading import Lock
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+_session = None
+_session_lock = Lock()
+_caches = None  # (ETag cache, response cache)
+_caches_lock = Lock()
+
+
+def create_session(connections=4, max_size=10, retries=3, backoff=0.3):
+    """Create a session keeping connections to the backend alive.
+
+    Failed connections are retried for all requests. Idempotent requests
+    are also retried on read errors and server errors. The delay between
+    retries grows exponentially from backoff seconds.
+
+    Arguments:
+        connections (int): number of hosts to keep connection pools for
+        max_size (int): max number of connections kept per host
+        retries (int): max number of retries of a request
+        backoff (float): backoff factor between retries in seconds
+
+    Returns:
+        requests.Session
+    """
+    retry = Retry(total=retries, backoff_factor=backoff,
+                  status_forcelist=(500, 502, 503, 504),
+                  raise_on_status=False)
+    adapter = HTTPAdapter(pool_connections=connections,
+                          pool_maxsize=max_size, max_retries=retry)
+    session = requests.Session()
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+def get_session(config=None):
+    """Get the session shared by all API calls of the process.
+
+    Arguments:
+        config (dict): "pool" section of the server config, only used when
+                       the session is created
+
+    Returns:
+        requests.Session
+    """
+    global _session
+    with _session_lock:
+        if _session is None:
+            config = config or {}
+            _session = create_session(config.get('connections', 4),
+                                      config.get('max_size', 10),
+                                      config.get('retries', 3),
+                                      config.get('backoff', 0.3))
+        return _session
+
+
+def reset_session():
+    """Close the shared session, a new one is created on next use."""
+    global _session
+    with _session_lock:
+        if _session is not None:
+            _session.close()
+            _session = None
+
+
+def get_caches(config=None):
+    """Get the response caches shared by all API calls of the process.
+
+    Arguments:
+        config (dict): "cache" section of the server config, only used when
+                       the caches are created
+
+    Returns:
+        (ResponseCache, ResponseCache): cache of responses by ETag and
+                                        cache of the read mostly endpoints
+    """
+    global _caches
+    with _caches_lock:
+        if _caches is None:
+            config = config or {}
+            _caches = (ResponseCache(config.get('etag_max_size', 64)),
+                       ResponseCache(config.get('max_size', 64)))
+        return _caches
+
+
+def clear_response_cache():
+    """Drop the cached responses of the read mostly endpoints."""
+    with _caches_lock:
+        if _caches is not None:
+            _caches[1].clear()
+
+
+class ResponseCache:
+    """Size bounded cache of responses.
+
+    The least recently used entries are dropped when the cache is full.
+
+    Arguments:
+        max_size (int): max number of cached responses
+    """
+    def __init__(self, max_size=64):
+        self.max_size = max_size
+        self.entries = OrderedDict()  # key: (value, expiry time or None)
+        self.lock = Lock()
+
+    def get(self, key, default=None):
+        """Get a cached value, default if missing or expired."""
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                return default
+            value, expires = entry
+            if expires is not None and time.monotonic() >= expires:
+                del self.entries[key]
+                return default
+            self.entries.move_to_end(key)
+            return value
+
+    def put(self, key, value, ttl=None):
+        """Cache a value.
+
+        Arguments:
+            key: hashable key
+            value: value to cache
+            ttl (float): seconds the value is valid, None for no expiry
+        """
+        if self.max_size <= 0:
+            return
+        expires = None if ttl is None else time.monotonic() + ttl
+        with self.lock:
+            self.entries[key] = (value, expires)
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_size:
+                self.entries.popitem(last=False)
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+
+    def __len__(self):
+        return len(self.entries)
@@ -0,0 +1,135 @@
+# Copyright 2019 Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""In-process audio output for TTS playback.
+
+Starting a player process and opening the audio device for every sentence
+leaves a noticeable silence between sentences. The sink keeps one output
+stream open and writes the PCM frames of queued wav files back to back.
+"""
+import wave
+from threading import Event
+
+import pyaudio
+
+from mycroft.util.log import LOG
+
+
+class AudioSink:
+    """Long-lived audio output stream playing PCM wav files.
+
+    The stream is opened on first use and kept open between files until
+    drain() is called. It is also reopened when the sample format changes.
+
+    Arguments:
+        device_index (int): PortAudio output device, None for the default
+        frames_per_buffer (int): frames written at a time, playback can
+                                 only be stopped between writes
+    """
+    def __init__(self, device_index=None, frames_per_buffer=1024):
+        self.device_index = device_index
+        self.frames_per_buffer = frames_per_buffer
+        self.available = True
+        self._audio = None
+        self._stream = None
+        self._format = None  # (sample width, channels, rate) of the stream
+        self._stopped = Event()
+
+    def play_wav(self, path):
+        """Play a wav file, returning once all frames are written.
+
+        Frames still buffered by the device keep playing, so a following
+        call continues without a gap. Writing errors are raised.
+
+        Arguments:
+            path (str): path of the wav file
+
+        Returns:
+            bool: False if nothing was played because the file is not a PCM
+                  wav file or the output device can't be opened, the file
+                  should then be played in another way.
+        """
+        if not self.available:
+            return False
+        self._stopped.clear()
+        try:
+            wav = wave.open(path, 'rb')
+        except (wave.Error, EOFError, OSError) as e:
+            LOG.debug('Can not stream {}: {}'.format(path, repr(e)))
+            return False
+
+        with wav:
+            stream = self._get_stream((wav.getsampwidth(),
+                                       wav.getnchannels(),
+                                       wav.getframerate()))
+            if stream is None:
+                return False
+            frames = wav.readframes(self.frames_per_buffer)
+            while frames and not self._stopped.is_set():
+                stream.write(frames)
+                frames = wav.readframes(self.frames_per_buffer)
+        return True
+
+    def _get_stream(self, sample_format):
+        """Get the output stream for the format, opening it if needed."""
+        if self._stream and self._format != sample_format:
+            self._close_stream()
+        try:
+            if self._stream is None:
+                if self._audio is None:
+                    self._audio = pyaudio.PyAudio()
+                width, channels, rate = sample_format
+                self._stream = self._audio.open(
+                    format=self._audio.get_format_from_width(width),
+                    channels=channels, rate=rate, output=True,
+                    output_device_index=self.device_index,
+                    frames_per_buffer=self.frames_per_buffer)
+                self._format = sample_format
+        except (OSError, ValueError) as e:
+            # ValueError: unsupported sample width
+            LOG.warning('Could not open audio output, falling back to the '
+                        'play commands: {}'.format(repr(e)))
+            self.close()
+            self.available = False
+            return None
+        return self._stream
+
+    def drain(self):
+        """Wait until the buffered audio has played and release the device.
+
+        Other programs can use the device until the next file is played,
+        which matters for audio devices that can't be shared.
+        """
+        self._close_stream()
+
+    def stop(self):
+        """Stop the file being played after the current write."""
+        self._stopped.set()
+
+    def _close_stream(self):
+        if self._stream:
+            try:
+                self._stream.stop_stream()
+                self._stream.close()
+            except OSError as e:
+                LOG.debug('Error closing audio output: {}'.format(repr(e)))
+            self._stream = None
+            self._format = None
+
+    def close(self):
+        """Close the output stream, it is reopened on next use."""
+        self._close_stream()
+        if self._audio:
+            self._audio.terminate()
+            self._audio = None
@@ -24,6 +24,7 @@ from mycroft.util.log import LOG
 from mycroft.messagebus.message import Message
 from mycroft.tts.remote_tts import RemoteTTSTimeoutException
 from mycroft.tts.mimic_tts import Mimic
+from .synthesis import SynthesisPipeline, create_executor
 
 bus = None  # Mycroft messagebus connection
 config = None
@@ -31,6 +32,9 @@ tts = None
 tts_hash = None
 lock = Lock()
 mimic_fallback_obj = None
+synthesis_executor = None
+lookahead = 0
+pipeline = None  # Pipeline of the utterance currently being spoken
 
 _last_stop_signal = 0
 
@@ -83,6 +87,10 @@ def handle_speak(event):
             utterance = re.sub(r'\b([A-za-z][\.])(\s+)', r'\g<1>', utterance)
             chunks = re.split(r'(?<!\w\.\w.)(?<![A-Z][a-z]\.)(?<=\.|\;|\?)\s',
                               utterance)
+            update_tts()
+            if lookahead and len(chunks) > 1 and tts.can_synthesize:
+                speak_pipelined(chunks, ident, start)
+                chunks = []
             for chunk in chunks:
                 # Check if somthing has aborted the speech
                 if (_last_stop_signal > start or
@@ -104,19 +112,49 @@ def handle_speak(event):
                                                'tts': tts.__class__.__name__})
 
 
-def mute_and_speak(utterance, ident):
+def speak_pipelined(chunks, ident, start):
     """
-        Mute mic and start speaking the utterance using selected tts backend.
+        Speak the chunks of an utterance, synthesizing upcoming chunks while
+        the current one is playing.
 
         Args:
-            utterance:  The sentence to be spoken
+            chunks:     Sentences to be spoken
             ident:      Ident tying the utterance to the source query
+            start:      Time of the speech request
+    """
+    global pipeline
+
+    def should_stop():
+        return _last_stop_signal > start or check_for_signal('buttonPress')
+
+    def on_error(chunk, error):
+        if isinstance(error, RemoteTTSTimeoutException):
+            LOG.error(error)
+            mimic_fallback_tts(chunk, ident)
+        else:
+            LOG.error('TTS execution failed ({})'.format(repr(error)))
+
+    for chunk in chunks:
+        LOG.info("Speak: " + chunk)
+    create_signal('isSpeaking')
+    pipeline = SynthesisPipeline(tts, synthesis_executor, lookahead)
+    try:
+        pipeline.speak(chunks, ident, on_error, should_stop)
+        if pipeline.cancelled:
+            # Clear any newly queued speech
+            tts.playback.clear()
+    finally:
+        pipeline = None
+
+
+def update_tts():
+    """
+        Recreate the TTS object if the configuration has changed.
     """
+    global tts
     global tts_hash
 
-    # update TTS object if configuration has changed
     if tts_hash != hash(str(config.get('tts', ''))):
-        global tts
         # Stop tts playback thread
         tts.playback.stop()
         tts.playback.join()
@@ -125,6 +163,17 @@ def mute_and_speak(utterance, ident):
         tts.init(bus)
         tts_hash = hash(str(config.get('tts', '')))
 
+
+def mute_and_speak(utterance, ident):
+    """
+        Mute mic and start speaking the utterance using selected tts backend.
+
+        Args:
+            utterance:  The sentence to be spoken
+            ident:      Ident tying the utterance to the source query
+    """
+    update_tts()
+
     LOG.info("Speak: " + utterance)
     try:
         tts.execute(utterance, ident)
@@ -156,6 +205,8 @@ def handle_stop(event):
     global _last_stop_signal
     if check_for_signal("isSpeaking", -1):
         _last_stop_signal = time.time()
+        if pipeline:
+            pipeline.cancel()  # Drop the synthesis lookahead
         tts.playback.clear()  # Clear here to get instant stop
         bus.emit(Message("mycroft.stop.handled", {"by": "TTS"}))
 
@@ -171,10 +222,15 @@ def init(messagebus):
     global tts
     global tts_hash
     global config
+    global synthesis_executor
+    global lookahead
 
     bus = messagebus
     Configuration.set_config_update_handlers(bus)
     config = Configuration.get()
+    lookahead = config.get('tts', {}).get('lookahead', 0)
+    if lookahead:
+        synthesis_executor = create_executor(lookahead)
     bus.on('mycroft.stop', handle_stop)
     bus.on('mycroft.audio.speech.stop', handle_stop)
     bus.on('speak', handle_speak)
@@ -186,6 +242,8 @@ def init(messagebus):
 
 
 def shutdown():
+    if synthesis_executor:
+        synthesis_executor.shutdown(wait=False)
     if tts:
         tts.playback.stop()
         tts.playback.join()
@@ -0,0 +1,135 @@
+# Copyright 2019 Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Synthesis of upcoming sentences while the current one is playing.
+
+The sentences of an utterance are submitted to a worker pool, up to
+"lookahead" sentences ahead of the one being played. The synthesized audio
+is handed to the playback queue strictly in order, so the time until the
+first audio is only bounded by the synthesis of the first sentence.
+"""
+from collections import deque
+from concurrent.futures import CancelledError, ThreadPoolExecutor
+from threading import Event
+
+from mycroft.util.log import LOG
+
+
+class SynthesisPipeline:
+    """Synthesize the sentences of an utterance ahead of playback.
+
+    Arguments:
+        tts (TTS): engine used to synthesize, must support synthesize()
+        executor (Executor): worker pool running the synthesis
+        lookahead (int): number of sentences to synthesize ahead of the
+                         one being queued for playback
+    """
+    def __init__(self, tts, executor, lookahead=2):
+        self.tts = tts
+        self.executor = executor
+        self.lookahead = max(lookahead, 0)
+        self._pending = deque()
+        self._changed = Event()
+        self._cancelled = False
+
+    @property
+    def cancelled(self):
+        return self._cancelled
+
+    def cancel(self):
+        """Stop the pipeline, pending synthesis is dropped."""
+        self._cancelled = True
+        for _, future in list(self._pending):
+            future.cancel()
+        self._changed.set()
+
+    def speak(self, sentences, ident, on_error=None, should_stop=None):
+        """Synthesize and queue the sentences for playback.
+
+        Blocks until every sentence is queued or the pipeline is cancelled.
+
+        Arguments:
+            sentences (list): sentences in playback order
+            ident (str): ident of the interaction
+            on_error (callable): called with (sentence, exception) if the
+                                 synthesis of a sentence fails
+            should_stop (callable): checked before each sentence is queued,
+                                    cancels the pipeline when returning True
+        """
+        sentences = iter(sentences)
+        for _ in range(self.lookahead + 1):
+            if not self._submit(sentences):
+                break
+
+        while self._pending and not self._cancelled:
+            if should_stop and should_stop():
+                self.cancel()
+                break
+            sentence, future = self._pending[0]
+            try:
+                audio = self._result(future)
+            except CancelledError:
+                break
+            except Exception as e:
+                if on_error:
+                    on_error(sentence, e)
+                else:
+                    LOG.error('TTS synthesis failed ({})'.format(repr(e)))
+                audio = []
+            self._pending.popleft()
+            if audio is None:  # Cancelled while waiting
+                break
+            for audio_ext, audio_file, visemes in audio:
+                self.tts.queue.put((audio_ext, audio_file, visemes, ident))
+            self._submit(sentences)
+
+        if self._cancelled:
+            self.cancel()  # Drop anything submitted after the cancel
+
+    def _submit(self, sentences):
+        """Start synthesis of the next sentence.
+
+        Returns:
+            bool: False if there are no more sentences
+        """
+        sentence = next(sentences, None)
+        if sentence is None or self._cancelled:
+            return False
+        future = self.executor.submit(self._synthesize, sentence)
+        future.add_done_callback(lambda _: self._changed.set())
+        self._pending.append((sentence, future))
+        return True
+
+    def _synthesize(self, sentence):
+        if self._cancelled:
+            return []
+        return list(self.tts.synthesize(sentence))
+
+    def _result(self, future):
+        """Wait for a synthesis result.
+
+        Returns:
+            list of synthesized audio, None if cancelled while waiting.
+        """
+        while not future.done():
+            if self._cancelled:
+                return None
+            self._changed.wait()
+            self._changed.clear()
+        return future.result()
+
+
+def create_executor(lookahead):
+    """Create the worker pool used by SynthesisPipelines."""
+    return ThreadPoolExecutor(max_workers=max(lookahead, 0) + 1)
@@ -0,0 +1,91 @@
+# Copyright 2019 Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Fixed size buffer holding the most recent audio."""
+
+
+class CyclicAudioBuffer:
+    """Preallocated circular buffer of raw audio.
+
+    Every byte is stored twice, at its ring position and one ring length
+    further, so the latest audio is always available as one contiguous
+    region. Windows are returned as memoryviews into the buffer, reading the
+    latest audio never copies it.
+
+    Arguments:
+        size (int): number of bytes of audio to keep
+        initial_data (bytes): audio to start with
+        padding (int): max number of bytes of silence that can be appended
+                       to a window, see window()
+    """
+    def __init__(self, size, initial_data=b'', padding=0):
+        self.size = size
+        self.padding = padding
+        self._capacity = size + padding
+        self._data = bytearray(2 * self._capacity + padding)
+        self._view = memoryview(self._data)
+        self._silence = bytes(padding)
+        self._pos = 0  # Ring position of the next write
+        self._len = 0  # Bytes of valid audio, at most size
+        self.append(initial_data)
+
+    def __len__(self):
+        return self._len
+
+    def append(self, chunk):
+        """Add audio at the end, dropping the oldest audio if full.
+
+        Arguments:
+            chunk (bytes): raw audio
+        """
+        chunk = memoryview(chunk).cast('B')
+        if len(chunk) > self.size:
+            chunk = chunk[-self.size:]
+        cap = self._capacity
+        pos = self._pos
+        first = min(len(chunk), cap - pos)
+        self._data[pos:pos + first] = chunk[:first]
+        self._data[pos + cap:pos + cap + first] = chunk[:first]
+        rest = len(chunk) - first
+        if rest:
+            self._data[:rest] = chunk[first:]
+            self._data[cap:cap + rest] = chunk[first:]
+        self._pos = (pos + len(chunk)) % cap
+        self._len = min(self._len + len(chunk), self.size)
+
+    def window(self, num_bytes=None, padding=0):
+        """Get the most recent audio without copying it.
+
+        The view is only valid until the next append().
+
+        Arguments:
+            num_bytes (int): number of bytes to get, defaults to all audio
+            padding (int): bytes of silence to append to the audio
+
+        Returns:
+            memoryview: view of the audio, must not be modified
+        """
+        if padding > self.padding:
+            raise ValueError('padding larger than {}'.format(self.padding))
+        if num_bytes is None or num_bytes > self._len:
+            num_bytes = self._len
+        end = self._pos + self._capacity
+        if padding:
+            # Overwrites the mirror of audio older than the buffer size
+            self._data[end:end + padding] = self._silence[:padding]
+        return self._view[end - num_bytes:end + padding]
+
+    def get(self):
+        """Copy of all buffered audio as bytes."""
+        return self.window().tobytes()
@@ -56,6 +56,21 @@ class HotWordEngine:
     def found_wake_word(self, frame_data):
         return False
 
+    def found_wake_word_view(self, audio):
+        """Check the most recent audio for the wake word.
+
+        Called by the listening loop with a view into its audio buffer,
+        engines that can process the view directly, or don't need the audio
+        at all, can override this to avoid copying it.
+
+        Arguments:
+            audio (memoryview): latest audio, only valid during the call
+
+        Returns:
+            bool: True if the wake word was heard
+        """
+        return self.found_wake_word(audio.tobytes())
+
     def update(self, chunk):
         pass
 
@@ -265,6 +280,10 @@ class PreciseHotword(HotWordEngine):
             return True
         return False
 
+    def found_wake_word_view(self, audio):
+        # Audio is fed through update(), the window isn't needed
+        return self.found_wake_word(None)
+
     def stop(self):
         if self.runner:
             self.runner.stop()
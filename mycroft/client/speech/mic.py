@@ -43,6 +43,7 @@ from mycroft.util import (
     play_wav
 )
 from mycroft.util.log import LOG
+from .audio_buffer import CyclicAudioBuffer
 
 
 class MutableStream:
@@ -403,18 +404,19 @@ class ResponsiveRecognizer(speech_recognition.Recognizer):
         num_silent_bytes = int(self.SILENCE_SEC * source.SAMPLE_RATE *
                                source.SAMPLE_WIDTH)
 
-        silence = get_silence(num_silent_bytes)
+        # Max bytes for byte_data before audio is removed from the front
+        max_size = self.sec_to_bytes(self.SAVED_WW_SEC, source)
+        test_size = self.sec_to_bytes(self.TEST_WW_SEC, source)
 
-        # bytearray to store audio in
-        byte_data = silence
+        # Preallocated buffer to store audio in, the silence is appended to
+        # the checked audio in place
+        byte_data = CyclicAudioBuffer(max_size,
+                                      get_silence(num_silent_bytes),
+                                      padding=num_silent_bytes)
 
         buffers_per_check = self.SEC_BETWEEN_WW_CHECKS / sec_per_buffer
         buffers_since_check = 0.0
 
-        # Max bytes for byte_data before audio is removed from the front
-        max_size = self.sec_to_bytes(self.SAVED_WW_SEC, source)
-        test_size = self.sec_to_bytes(self.TEST_WW_SEC, source)
-
         said_wake_word = False
 
         # Rolling buffer to track the audio energy (loudness) heard on
@@ -459,29 +461,23 @@ class ResponsiveRecognizer(speech_recognition.Recognizer):
 
             # Periodically output energy level stats.  This can be used to
             # visualize the microphone input, e.g. a needle on a meter.
-            if counter % 3:
+            if counter % 3 == 0:
                 with open(self.mic_level_file, 'w') as f:
                     f.write("Energy:  cur=" + str(energy) + " thresh=" +
                             str(self.energy_threshold))
             counter += 1
 
-            # At first, the buffer is empty and must fill up.  After that
-            # just drop the first chunk bytes to keep it the same size.
-            needs_to_grow = len(byte_data) < max_size
-            if needs_to_grow:
-                byte_data += chunk
-            else:  # Remove beginning of audio and add new chunk to end
-                byte_data = byte_data[len(chunk):] + chunk
+            # The buffer drops the oldest audio once it's full
+            byte_data.append(chunk)
 
             buffers_since_check += 1.0
             self.wake_word_recognizer.update(chunk)
             if buffers_since_check > buffers_per_check:
                 buffers_since_check -= buffers_per_check
-                chopped = byte_data[-test_size:] \
-                    if test_size < len(byte_data) else byte_data
-                audio_data = chopped + silence
+                audio_data = byte_data.window(test_size,
+                                              padding=num_silent_bytes)
                 said_wake_word = \
-                    self.wake_word_recognizer.found_wake_word(audio_data)
+                    self.wake_word_recognizer.found_wake_word_view(audio_data)
 
                 # Save positive wake words as appropriate
                 if said_wake_word:
@@ -489,7 +485,8 @@ class ResponsiveRecognizer(speech_recognition.Recognizer):
                     mtd = None
                     if self.save_wake_words:
                         # Save wake word locally
-                        audio = self._create_audio_data(byte_data, source)
+                        audio = self._create_audio_data(byte_data.get(),
+                                                        source)
                         mtd = self._compile_metadata()
                         if not isdir(self.saved_wake_words_dir):
                             os.mkdir(self.saved_wake_words_dir)
@@ -507,7 +504,8 @@ class ResponsiveRecognizer(speech_recognition.Recognizer):
                         Thread(
                             target=self._upload_wake_word, daemon=True,
                             args=[audio or
-                                  self._create_audio_data(byte_data, source),
+                                  self._create_audio_data(byte_data.get(),
+                                                          source),
                                   mtd or self._compile_metadata()]
                         ).start()
         return ww_frames
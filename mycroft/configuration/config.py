@@ -245,6 +245,10 @@ class Configuration:
             handler for configuration.updated, triggers an update
             of cached config.
         """
+        # Here to avoid cyclic import
+        from mycroft.api.pool import clear_response_cache
+        # Remote settings have changed, fetch them instead of reusing
+        clear_response_cache()
         Configuration.load_config_stack(cache=True)
 
     @staticmethod
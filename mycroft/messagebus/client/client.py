@@ -12,12 +12,17 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
+import asyncio
 import json
 import time
 import traceback
-from threading import Event
+from collections import OrderedDict
+from concurrent.futures import Future, TimeoutError as FutureTimeout
+from threading import Event, Lock
+from uuid import uuid4
 
 from websocket import (
+    ABNF,
     WebSocketApp,
     WebSocketConnectionClosedException,
     WebSocketException
@@ -25,20 +30,87 @@ from websocket import (
 
 from mycroft.messagebus.load_config import load_message_bus_config
 from mycroft.messagebus.message import Message
+from mycroft.messagebus.serialization import (
+    WIRE_FORMAT, DEFAULT_FORMAT, deserialize, get_serializer
+)
+from mycroft.messagebus.service.router import SUBSCRIBE, UNSUBSCRIBE
 from mycroft.util import create_echo_function
 from mycroft.util.log import LOG
 from .threaded_event_emitter import ThreadedEventEmitter
 
+# Context key used to match replies with requests
+REQUEST_ID = 'request_id'
+
+
+class PendingRequests:
+    """Futures waiting for replies, indexed on reply type and request id."""
+    def __init__(self):
+        self._requests = {}  # reply type -> OrderedDict(request id: future)
+        self._lock = Lock()
+
+    def add(self, reply_type, request_id):
+        """Create a future for a request awaiting a reply."""
+        future = Future()
+        future.reply_type = reply_type
+        future.request_id = request_id
+        with self._lock:
+            self._requests.setdefault(reply_type,
+                                      OrderedDict())[request_id] = future
+        return future
+
+    def discard(self, future):
+        """Stop waiting for a reply."""
+        with self._lock:
+            requests = self._requests.get(future.reply_type, {})
+            requests.pop(future.request_id, None)
+            if not requests:
+                self._requests.pop(future.reply_type, None)
+
+    def resolve(self, message):
+        """Resolve the request matching a received message, if any.
+
+        Returns:
+            bool: True if a pending request was resolved
+        """
+        if message.msg_type not in self._requests:
+            return False
+        with self._lock:
+            requests = self._requests.get(message.msg_type)
+            if not requests:
+                return False
+            request_id = message.context.get(REQUEST_ID)
+            if request_id is None:
+                # Reply without correlation, use the oldest request
+                _, future = requests.popitem(last=False)
+            elif request_id in requests:
+                future = requests.pop(request_id)
+            else:
+                # Reply to a request made by someone else
+                return False
+            if not requests:
+                del self._requests[message.msg_type]
+        future.set_result(message)
+        return True
+
 
 class MessageBusClient:
-    def __init__(self, host=None, port=None, route=None, ssl=None):
-        config_overrides = dict(host=host, port=port, route=route, ssl=ssl)
+    def __init__(self, host=None, port=None, route=None, ssl=None,
+                 wire_format=None):
+        config_overrides = dict(host=host, port=port, route=route, ssl=ssl,
+                                wire_format=wire_format)
         self.config = load_message_bus_config(**config_overrides)
+        # Format used for sending, switched when the service accepts the
+        # requested format in self.config.wire_format
+        self.wire_format = DEFAULT_FORMAT
         self.emitter = ThreadedEventEmitter()
         self.client = self.create_client()
         self.retry = 5
         self.connected_event = Event()
         self.started_running = False
+        # Message types and prefixes this client has asked the service for
+        self.subscribed_types = set()
+        self.subscribed_prefixes = set()
+        self.pending = PendingRequests()
 
     @staticmethod
     def build_url(host, port, route, ssl):
@@ -65,7 +137,18 @@ class MessageBusClient:
 
     def on_open(self):
         LOG.info("Connected")
+        self.wire_format = DEFAULT_FORMAT
+        if self.config.wire_format not in (None, DEFAULT_FORMAT):
+            self.client.send(Message(WIRE_FORMAT, {
+                'formats': [self.config.wire_format]
+            }).serialize())
         self.connected_event.set()
+        if self.subscribed_types or self.subscribed_prefixes:
+            # Restore subscriptions on the (re)opened connection
+            self.client.send(Message(SUBSCRIBE, {
+                'types': list(self.subscribed_types),
+                'prefixes': list(self.subscribed_prefixes)
+            }).serialize())
         self.emitter.emit("open")
         # Restore reconnect timer to 5 seconds on sucessful connect
         self.retry = 5
@@ -100,7 +183,14 @@ class MessageBusClient:
             pass
 
     def on_message(self, message):
-        parsed_message = Message.deserialize(message)
+        parsed_message = deserialize(message)
+        self.pending.resolve(parsed_message)
+        if parsed_message.msg_type == WIRE_FORMAT + '.response':
+            self.wire_format = parsed_message.data.get('format',
+                                                       DEFAULT_FORMAT)
+        if not isinstance(message, str) and self.emitter.listeners('message'):
+            # 'message' listeners expect the json representation
+            message = parsed_message.serialize()
         self.emitter.emit('message', message)
         self.emitter.emit(parsed_message.msg_type, parsed_message)
 
@@ -113,13 +203,46 @@ class MessageBusClient:
 
         try:
             if hasattr(message, 'serialize'):
-                self.client.send(message.serialize())
+                data = get_serializer(self.wire_format).serialize(message)
+                if isinstance(data, bytes):
+                    self.client.send(data, opcode=ABNF.OPCODE_BINARY)
+                else:
+                    self.client.send(data)
             else:
                 self.client.send(json.dumps(message.__dict__))
         except WebSocketConnectionClosedException:
             LOG.warning('Could not send {} message because connection '
                         'has been closed'.format(message.msg_type))
 
+    def request(self, message, reply_type=None):
+        """Send a message and return a future for the reply.
+
+        The request is tagged with a unique request id in the context.
+        Replies created with Message.reply() / Message.response() carry the
+        id back, so concurrent requests of the same type, from this or other
+        processes, each get their own reply. Replies without a request id
+        resolve the oldest pending request of the reply type.
+
+        Args:
+            message (Message): message to send
+            reply_type (str): the message type of the expected reply.
+                              Defaults to "<message.msg_type>.response".
+        Returns:
+            concurrent.futures.Future resolved with the reply Message
+        """
+        request_id = str(uuid4())
+        context = dict(message.context)
+        context[REQUEST_ID] = request_id
+        request = Message(message.msg_type, message.data, context)
+        future = self.pending.add(reply_type or message.msg_type +
+                                  '.response', request_id)
+        try:
+            self.emit(request)
+        except Exception as e:
+            self.pending.discard(future)
+            future.set_exception(e)
+        return future
+
     def wait_for_response(self, message, reply_type=None, timeout=None):
         """Send a message and wait for a response.
 
@@ -131,31 +254,73 @@ class MessageBusClient:
         Returns:
             The received message or None if the response timed out
         """
-        response = []
-
-        def handler(message):
-            """Receive response data."""
-            response.append(message)
-
-        # Setup response handler
-        self.once(reply_type or message.msg_type + '.response', handler)
-        # Send request
-        self.emit(message)
-        # Wait for response
-        start_time = time.monotonic()
-        while len(response) == 0:
-            time.sleep(0.2)
-            if time.monotonic() - start_time > (timeout or 3.0):
-                try:
-                    self.remove(reply_type, handler)
-                except (ValueError, KeyError):
-                    # ValueError occurs on pyee 1.0.1 removing handlers
-                    # registered with once.
-                    # KeyError may theoretically occur if the event occurs as
-                    # the handler is removed
-                    pass
-                return None
-        return response[0]
+        future = self.request(message, reply_type)
+        try:
+            return future.result(timeout or 3.0)
+        except FutureTimeout:
+            self.pending.discard(future)
+            return None
+
+    @asyncio.coroutine
+    def async_wait_for_response(self, message, reply_type=None,
+                                timeout=None):
+        """Asyncio version of wait_for_response().
+
+        Args:
+            message (Message): message to send
+            reply_type (str): the message type of the expected reply.
+                              Defaults to "<message.msg_type>.response".
+            timeout: seconds to wait before timeout, defaults to 3
+        Returns:
+            The received message or None if the response timed out
+        """
+        loop = asyncio.get_event_loop()
+        future = yield from loop.run_in_executor(None, self.request,
+                                                 message, reply_type)
+        try:
+            return (yield from asyncio.wait_for(asyncio.wrap_future(future),
+                                                timeout or 3.0))
+        except asyncio.TimeoutError:
+            self.pending.discard(future)
+            return None
+
+    def subscribe(self, types=None, prefixes=None):
+        """Only receive messages matching the given types or prefixes.
+
+        By default a client receives every message on the bus. After the
+        first subscription the message bus service only forwards messages
+        with a subscribed type or a type starting with a subscribed prefix.
+        Subscriptions are additive and restored after reconnecting.
+
+        Args:
+            types (list): exact message types to receive
+            prefixes (list): message type prefixes to receive
+        """
+        self.subscribed_types.update(types or [])
+        self.subscribed_prefixes.update(prefixes or [])
+        self.emit(Message(SUBSCRIBE, {'types': list(types or []),
+                                      'prefixes': list(prefixes or [])}))
+
+    def unsubscribe(self, types=None, prefixes=None):
+        """Remove subscriptions.
+
+        Without arguments all subscriptions are removed and the client will
+        receive every message on the bus again.
+
+        Args:
+            types (list): message types to stop receiving
+            prefixes (list): message type prefixes to stop receiving
+        """
+        if types is None and prefixes is None:
+            self.subscribed_types.clear()
+            self.subscribed_prefixes.clear()
+            self.emit(Message(UNSUBSCRIBE))
+        else:
+            self.subscribed_types.difference_update(types or [])
+            self.subscribed_prefixes.difference_update(prefixes or [])
+            self.emit(Message(UNSUBSCRIBE,
+                              {'types': list(types or []),
+                               'prefixes': list(prefixes or [])}))
 
     def on(self, event_name, func):
         self.emitter.on(event_name, func)
@@ -24,7 +24,7 @@ from mycroft.util.log import LOG
 
 MessageBusConfig = namedtuple(
     'MessageBusConfig',
-    ['host', 'port', 'route', 'ssl']
+    ['host', 'port', 'route', 'ssl', 'wire_format']
 )
 
 
@@ -43,7 +43,9 @@ def load_message_bus_config(**overrides):
             host=overrides.get('host') or websocket_configs.get('host'),
             port=overrides.get('port') or websocket_configs.get('port'),
             route=overrides.get('route') or websocket_configs.get('route'),
-            ssl=overrides.get('ssl') or config.get('ssl')
+            ssl=overrides.get('ssl') or config.get('ssl'),
+            wire_format=(overrides.get('wire_format') or
+                         websocket_configs.get('wire_format'))
         )
         if not all([mb_config.host, mb_config.port, mb_config.route]):
             error_msg = 'Missing one or more websocket configs'
@@ -163,3 +163,62 @@ class Message:
                 # Substitute only whole words matching the token
                 utt = re.sub(r'\b' + token.get("key", "") + r"\b", "", utt)
         return normalize(utt)
+
+
+class LazyMessage(Message):
+    """Message with a data payload that is decoded on first access.
+
+    Used for messages received in one of the framed wire formats where the
+    envelope (type and context) is encoded separately from the data. Routing
+    and relaying such messages never needs to decode the data, which may be
+    large (GUI page data, STT results, etc.).
+
+    Attributes:
+        payload_format (str): encoding of the raw payload, "json" or "msgpack"
+    """
+    def __init__(self, msg_type, raw_data, context=None,
+                 loads=json.loads, payload_format='json'):
+        self.msg_type = msg_type
+        self.context = context or {}
+        self.payload_format = payload_format
+        self._raw_data = raw_data
+        self._loads = loads
+        self._data = None
+
+    @property
+    def data(self):
+        """The message data, decoded from the raw payload when needed."""
+        if self._data is None:
+            self._data = self._loads(self._raw_data) if self._raw_data else {}
+            self._data = self._data or {}
+            # The decoded data may be modified so the payload can't be reused
+            self._raw_data = None
+        return self._data
+
+    @data.setter
+    def data(self, value):
+        self._data = value or {}
+        self._raw_data = None
+
+    @property
+    def raw_data(self):
+        """The undecoded payload or None if the data has been accessed."""
+        return self._raw_data
+
+    def serialize(self):
+        """Serialize to the standard JSON format.
+
+        If the payload is undecoded JSON it's inserted as is, producing the
+        same string as Message.serialize() without parsing the data.
+
+        Returns:
+            str: a json string representation of the message.
+        """
+        raw = self._raw_data
+        if raw is None or self.payload_format != 'json':
+            return super().serialize()
+
+        if isinstance(raw, bytes):
+            raw = raw.decode('utf-8')
+        return '{{"type": {}, "data": {}, "context": {}}}'.format(
+            json.dumps(self.msg_type), raw or '{}', json.dumps(self.context))
@@ -0,0 +1,180 @@
+# Copyright 2019 Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Wire formats used to transfer messages over the message bus.
+
+"json" is the classic format, a websocket text frame with the whole message
+as a json object. It's the default and what every client understands.
+
+The framed formats are sent as binary websocket frames:
+
+    2 bytes   magic, identifies the format
+    4 bytes   big endian length of the envelope
+    n bytes   envelope, the encoded [type, context] pair
+    rest      payload, the encoded message data
+
+Since the envelope is encoded separately, a message can be routed and relayed
+without decoding the data, see LazyMessage.
+
+"framed" uses json for both envelope and payload and requires no extra
+packages, "msgpack" is available when the msgpack package is installed.
+
+A client selects a format by sending a mycroft.bus.wire_format message with
+a list of formats in order of preference. The service replies with the
+selected format in mycroft.bus.wire_format.response. Until the reply arrives
+the client keeps sending json. Receiving is format agnostic on both sides.
+"""
+import json
+import struct
+
+from .message import Message, LazyMessage
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+WIRE_FORMAT = 'mycroft.bus.wire_format'
+DEFAULT_FORMAT = 'json'
+
+_HEADER = struct.Struct('>2sI')
+
+
+class JsonSerializer:
+    """The default json text format."""
+    name = 'json'
+    binary = False
+
+    @staticmethod
+    def serialize(message):
+        return message.serialize()
+
+    @staticmethod
+    def deserialize(value):
+        if isinstance(value, bytes):
+            value = value.decode('utf-8')
+        return Message.deserialize(value)
+
+
+class FramedSerializer:
+    """Binary frame with separately json encoded envelope and payload."""
+    name = 'framed'
+    binary = True
+    magic = b'MJ'
+    payload = 'json'
+
+    @staticmethod
+    def dumps(obj):
+        return json.dumps(obj).encode('utf-8')
+
+    @staticmethod
+    def loads(value):
+        if isinstance(value, (bytes, memoryview)):
+            value = bytes(value).decode('utf-8')
+        return json.loads(value)
+
+    @classmethod
+    def serialize(cls, message):
+        raw = getattr(message, 'raw_data', None)
+        if (raw is not None and
+                getattr(message, 'payload_format', None) == cls.payload):
+            # Relay the undecoded payload
+            payload = raw if isinstance(raw, bytes) else raw.encode('utf-8')
+        else:
+            payload = cls.dumps(message.data)
+        envelope = cls.dumps([message.msg_type, message.context])
+        return b''.join((_HEADER.pack(cls.magic, len(envelope)),
+                         envelope, payload))
+
+    @classmethod
+    def deserialize(cls, value):
+        _, envelope_len = _HEADER.unpack_from(value)
+        start = _HEADER.size
+        end = start + envelope_len
+        msg_type, context = cls.loads(value[start:end])
+        return LazyMessage(msg_type or '', value[end:], context,
+                           loads=cls.loads, payload_format=cls.payload)
+
+
+class MsgpackSerializer(FramedSerializer):
+    """Binary frame with msgpack encoded envelope and payload."""
+    name = 'msgpack'
+    magic = b'MP'
+    payload = 'msgpack'
+
+    @staticmethod
+    def dumps(obj):
+        return msgpack.packb(obj, use_bin_type=True)
+
+    @staticmethod
+    def loads(value):
+        return msgpack.unpackb(bytes(value), raw=False)
+
+
+_serializers = {s.name: s for s in (JsonSerializer, FramedSerializer)}
+if msgpack is not None:
+    _serializers[MsgpackSerializer.name] = MsgpackSerializer
+
+_by_magic = {s.magic: s for s in _serializers.values() if s.binary}
+
+
+def available_formats():
+    """Names of the wire formats supported by this installation."""
+    return list(_serializers)
+
+
+def get_serializer(name):
+    """Get the serializer for a wire format.
+
+    Arguments:
+        name (str): wire format name
+
+    Returns:
+        serializer for the format, falls back to json for unknown formats.
+    """
+    return _serializers.get(name or DEFAULT_FORMAT, JsonSerializer)
+
+
+def detect_serializer(value):
+    """Find the serializer matching a received websocket frame.
+
+    Arguments:
+        value (str/bytes): frame contents
+
+    Returns:
+        serializer able to decode the frame
+    """
+    if isinstance(value, str):
+        return JsonSerializer
+    return _by_magic.get(bytes(value[:2]), JsonSerializer)
+
+
+def deserialize(value):
+    """Create a Message from a frame in any supported wire format."""
+    return detect_serializer(value).deserialize(value)
+
+
+def select_format(requested):
+    """Select the first supported format from a list of requested formats.
+
+    Arguments:
+        requested (list): wire format names in order of preference
+
+    Returns:
+        str: name of the selected format, "json" if none is supported
+    """
+    for name in requested or []:
+        if name in _serializers:
+            return name
+    return DEFAULT_FORMAT
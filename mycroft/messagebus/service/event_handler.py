@@ -21,15 +21,21 @@ from tornado.websocket import WebSocketHandler
 from pyee import EventEmitter
 
 from mycroft.messagebus.message import Message
+from mycroft.messagebus.serialization import (
+    WIRE_FORMAT, DEFAULT_FORMAT, detect_serializer, get_serializer,
+    select_format
+)
 from mycroft.util.log import LOG
+from .router import MessageRouter, SUBSCRIBE, UNSUBSCRIBE
 
-client_connections = []
+router = MessageRouter()
 
 
 class MessageBusEventHandler(WebSocketHandler):
     def __init__(self, application, request, **kwargs):
         super().__init__(application, request, **kwargs)
         self.emitter = EventEmitter()
+        self.wire_format = DEFAULT_FORMAT
 
     def on(self, event_name, handler):
         self.emitter.on(event_name, handler)
@@ -37,10 +43,18 @@ class MessageBusEventHandler(WebSocketHandler):
     def on_message(self, message):
         LOG.debug(message)
         try:
-            deserialized_message = Message.deserialize(message)
+            serializer = detect_serializer(message)
+            deserialized_message = serializer.deserialize(message)
         except Exception:
             return
 
+        if deserialized_message.msg_type in (SUBSCRIBE, UNSUBSCRIBE):
+            self.handle_subscription(deserialized_message)
+            return
+        elif deserialized_message.msg_type == WIRE_FORMAT:
+            self.handle_wire_format(deserialized_message)
+            return
+
         try:
             self.emitter.emit(deserialized_message.msg_type,
                               deserialized_message)
@@ -49,20 +63,54 @@ class MessageBusEventHandler(WebSocketHandler):
             traceback.print_exc(file=sys.stdout)
             pass
 
-        for client in client_connections:
-            client.write_message(message)
+        # Encode at most once per wire format, reusing the received frame
+        encoded = {serializer.name: message}
+        for client in router.recipients(deserialized_message.msg_type):
+            if client.wire_format not in encoded:
+                encoded[client.wire_format] = get_serializer(
+                    client.wire_format).serialize(deserialized_message)
+            client.send(encoded[client.wire_format])
+
+    def send(self, data):
+        """Write an encoded message using the matching websocket frame."""
+        self.write_message(data, binary=isinstance(data, bytes))
+
+    def handle_subscription(self, message):
+        """Update the message types this connection should receive.
+
+        The message data may contain a list of exact message 'types' and a
+        list of message type 'prefixes'. An unsubscribe without data resets
+        the connection to receive all messages.
+        """
+        types = message.data.get('types')
+        prefixes = message.data.get('prefixes')
+        if message.msg_type == SUBSCRIBE:
+            router.subscribe(self, types, prefixes)
+        else:
+            router.unsubscribe(self, types, prefixes)
+
+    def handle_wire_format(self, message):
+        """Select the wire format used when sending to this connection.
+
+        The reply is sent as json, all following messages use the selected
+        format.
+        """
+        selected = select_format(message.data.get('formats'))
+        self.write_message(message.response({'format': selected}).serialize())
+        self.wire_format = selected
 
     def open(self):
         self.write_message(Message("connected").serialize())
-        client_connections.append(self)
+        router.add_client(self)
 
     def on_close(self):
-        client_connections.remove(self)
+        router.remove_client(self)
 
     def emit(self, channel_message):
         if (hasattr(channel_message, 'serialize') and
                 callable(getattr(channel_message, 'serialize'))):
-            self.write_message(channel_message.serialize())
+            self.send(get_serializer(self.wire_format).serialize(
+                channel_message))
         else:
             self.write_message(json.dumps(channel_message))
 
@@ -0,0 +1,180 @@
+# Copyright 2019 Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Subscription based routing of messages to message bus clients.
+
+Clients that never subscribe receive every message on the bus, exactly as
+before. A client that sends a subscribe message only receives messages whose
+type matches one of its registered types or starts with one of its registered
+prefixes.
+
+The subscriptions are kept in a character trie. The list of recipients for a
+message type is resolved once and cached until the subscriptions change, so
+the steady state cost of routing a message is a single dict lookup.
+"""
+from threading import Lock
+
+SUBSCRIBE = 'mycroft.bus.subscribe'
+UNSUBSCRIBE = 'mycroft.bus.unsubscribe'
+
+# Upper bound for the number of resolved message types kept in the cache
+MAX_CACHED_TYPES = 4096
+
+
+class _TrieNode:
+    __slots__ = ('children', 'prefix_subscribers', 'exact_subscribers')
+
+    def __init__(self):
+        self.children = {}
+        self.prefix_subscribers = set()
+        self.exact_subscribers = set()
+
+
+class MessageRouter:
+    """Keep track of client subscriptions and resolve message recipients.
+
+    Clients are any hashable object, usually the websocket connection.
+    """
+    def __init__(self):
+        self._root = _TrieNode()
+        self._clients = []  # All connected clients in connection order
+        self._subscriptions = {}  # client -> (set of types, set of prefixes)
+        self._cache = {}
+        self._lock = Lock()
+
+    @property
+    def clients(self):
+        """All connected clients."""
+        return list(self._clients)
+
+    def add_client(self, client):
+        """Register a new client receiving all messages."""
+        with self._lock:
+            if client not in self._clients:
+                self._clients.append(client)
+                self._cache = {}
+
+    def remove_client(self, client):
+        """Remove a client and all its subscriptions."""
+        with self._lock:
+            if client in self._clients:
+                self._clients.remove(client)
+            types, prefixes = self._subscriptions.pop(client, (set(), set()))
+            for msg_type in types:
+                self._discard(client, msg_type, exact=True)
+            for prefix in prefixes:
+                self._discard(client, prefix, exact=False)
+            self._cache = {}
+
+    def subscribe(self, client, types=None, prefixes=None):
+        """Limit the messages sent to a client.
+
+        Subscriptions are additive, the client will receive messages matching
+        any of the types or prefixes registered so far.
+
+        Arguments:
+            client: client to subscribe
+            types (list): exact message types to receive
+            prefixes (list): message type prefixes to receive
+        """
+        with self._lock:
+            sub_types, sub_prefixes = self._subscriptions.setdefault(
+                client, (set(), set()))
+            for msg_type in types or []:
+                self._node(msg_type, create=True).exact_subscribers.add(client)
+                sub_types.add(msg_type)
+            for prefix in prefixes or []:
+                self._node(prefix, create=True).prefix_subscribers.add(client)
+                sub_prefixes.add(prefix)
+            self._cache = {}
+
+    def unsubscribe(self, client, types=None, prefixes=None):
+        """Remove subscriptions from a client.
+
+        If neither types nor prefixes are given all subscriptions are removed
+        and the client goes back to receiving every message.
+
+        Arguments:
+            client: client to unsubscribe
+            types (list): exact message types to stop receiving
+            prefixes (list): message type prefixes to stop receiving
+        """
+        with self._lock:
+            if client not in self._subscriptions:
+                return
+            sub_types, sub_prefixes = self._subscriptions[client]
+            if types is None and prefixes is None:
+                types = list(sub_types)
+                prefixes = list(sub_prefixes)
+            for msg_type in types or []:
+                self._discard(client, msg_type, exact=True)
+                sub_types.discard(msg_type)
+            for prefix in prefixes or []:
+                self._discard(client, prefix, exact=False)
+                sub_prefixes.discard(prefix)
+            if not sub_types and not sub_prefixes:
+                del self._subscriptions[client]
+            self._cache = {}
+
+    def recipients(self, msg_type):
+        """Get the clients that should receive a message type.
+
+        Arguments:
+            msg_type (str): message type to route
+
+        Returns:
+            list: clients interested in the message in connection order
+        """
+        cached = self._cache.get(msg_type)
+        if cached is not None:
+            return cached
+
+        with self._lock:
+            interested = set()
+            node = self._root
+            interested.update(node.prefix_subscribers)
+            for char in msg_type:
+                node = node.children.get(char)
+                if node is None:
+                    break
+                interested.update(node.prefix_subscribers)
+            else:
+                interested.update(node.exact_subscribers)
+
+            result = [c for c in self._clients
+                      if c not in self._subscriptions or c in interested]
+            if len(self._cache) >= MAX_CACHED_TYPES:
+                self._cache = {}
+            self._cache[msg_type] = result
+        return result
+
+    def _node(self, key, create=False):
+        node = self._root
+        for char in key:
+            child = node.children.get(char)
+            if child is None:
+                if not create:
+                    return None
+                child = _TrieNode()
+                node.children[char] = child
+            node = child
+        return node
+
+    def _discard(self, client, key, exact):
+        node = self._node(key)
+        if node is not None:
+            if exact:
+                node.exact_subscribers.discard(client)
+            else:
+                node.prefix_subscribers.discard(client)
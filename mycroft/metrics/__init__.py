@@ -15,6 +15,7 @@
 import json
 import threading
 import time
+from bisect import bisect_left
 
 import requests
 
@@ -110,6 +111,52 @@ class Stopwatch:
             return 'Not started'
 
 
+class LatencyHistogram:
+    """
+        Distribution of measured durations.
+
+        Durations are counted in buckets by their upper bound in seconds,
+        the last bucket counts everything above the largest bound.
+    """
+    default_bounds = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0,
+                      10.0, 30.0)
+
+    def __init__(self, bounds=None):
+        self.bounds = tuple(bounds or self.default_bounds)
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.total = 0.0
+        self.max = 0.0
+        self.lock = threading.Lock()
+
+    @property
+    def count(self):
+        return sum(self.counts)
+
+    def add(self, duration):
+        """
+            Add a measured duration in seconds
+        """
+        with self.lock:
+            self.counts[bisect_left(self.bounds, duration)] += 1
+            self.total += duration
+            self.max = max(self.max, duration)
+
+    def to_dict(self):
+        with self.lock:
+            counts = list(self.counts)
+            total = self.total
+            maximum = self.max
+        labels = ['<={}'.format(b) for b in self.bounds]
+        labels.append('>{}'.format(self.bounds[-1]))
+        count = sum(counts)
+        return {
+            'buckets': dict(zip(labels, counts)),
+            'count': count,
+            'mean': total / count if count else 0.0,
+            'max': maximum
+        }
+
+
 class MetricsAggregator:
     """
     MetricsAggregator is not threadsafe, and multiple clients writing the
@@ -16,9 +16,12 @@
 times.
 """
 import json
+import os
 import time
 from datetime import datetime, timedelta
-from threading import Thread, Lock
+from heapq import heapify, heappop, heappush
+from itertools import count
+from threading import Condition, Thread, Lock
 from os.path import isfile, join, expanduser
 
 from mycroft.configuration import Configuration
@@ -26,6 +29,11 @@ from mycroft.messagebus.message import Message
 from mycroft.util.log import LOG
 from .mycroft_skill.event_container import EventContainer, create_basic_wrapper
 
+# Max seconds between checks of the schedule
+MAX_WAIT = 10
+# Number of journal entries triggering a rewrite of the schedule file
+JOURNAL_MAX_ENTRIES = 1000
+
 
 def repeat_time(sched_time, repeat):
     """Next scheduled time for repeating event. Guarantees that the
@@ -48,6 +56,17 @@ class EventScheduler(Thread):
     """Create an event scheduler thread. Will send messages at a
      predetermined time to the registered targets.
 
+    The pending events are stored in a dict mapping event names to lists of
+    (time, repeat, data) tuples. A heap of (time, sequence, name) entries
+    keeps track of the next trigger time so the thread can sleep until the
+    next event is due or the schedule changes.
+
+    Changes to single-shot events are appended to a journal next to the
+    schedule file as they happen. The journal is replayed on load and folded
+    into the schedule file when it grows too large and on shutdown, so a
+    crash doesn't lose the events scheduled since boot. Repeating events
+    aren't persisted, skills schedule them again when loaded.
+
     Arguments:
         bus:            Mycroft messagebus (mycroft.messagebus)
         schedule_file:  File to store pending events to on shutdown
@@ -58,10 +77,19 @@ class EventScheduler(Thread):
 
         self.events = {}
         self.event_lock = Lock()
+        # Signalled when the schedule changes or the scheduler is stopped
+        self.schedule_changed = Condition(self.event_lock)
+        self._heap = []  # [time, sequence, event name, active]
+        self._heap_entries = {}  # event name -> heap entries
+        self._inactive_entries = 0
+        self._sequence = count()
 
         self.bus = bus
         self.is_running = True
         self.schedule_file = join(data_dir, schedule_file)
+        self.journal_file = self.schedule_file + '.journal'
+        self._journal = None
+        self._journal_entries = 0
         if self.schedule_file:
             self.load()
 
@@ -76,35 +104,148 @@ class EventScheduler(Thread):
         self.start()
 
     def load(self):
-        """Load json data with active events from json file."""
+        """Load json data with active events from the schedule file and
+        replay the journal of changes made since it was written."""
+        json_data = {}
         if isfile(self.schedule_file):
-            json_data = {}
             with open(self.schedule_file) as f:
                 try:
                     json_data = json.load(f)
                 except Exception as e:
                     LOG.error(e)
-            current_time = time.time()
-            with self.event_lock:
-                for key in json_data:
-                    event_list = json_data[key]
-                    # discard non repeating events that has already happened
-                    self.events[key] = [tuple(e) for e in event_list
-                                        if e[0] > current_time or e[1]]
+        current_time = time.time()
+        with self.event_lock:
+            for key in json_data:
+                self.events[key] = [tuple(e) for e in json_data[key]]
+            self._replay_journal()
+            for key in list(self.events):
+                # discard non repeating events that has already happened
+                self.events[key] = [e for e in self.events[key]
+                                    if e[0] > current_time or e[1]]
+                if not self.events[key]:
+                    del self.events[key]
+                for sched_time, _, _ in self.events.get(key, []):
+                    self._push(key, sched_time)
+            if self._journal_entries:
+                self._compact()
+
+    def _replay_journal(self):
+        """Apply the journaled changes, called with the lock held."""
+        if not isfile(self.journal_file):
+            return
+        with open(self.journal_file) as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                    event = entry['event']
+                    if entry['op'] == 'schedule':
+                        self.events.setdefault(event, []).append(
+                            (entry['time'], None, entry['data']))
+                    elif entry['op'] == 'remove':
+                        self.events.pop(event, None)
+                    elif entry['op'] == 'update' and self.events.get(event):
+                        sched_time, repeat, _ = self.events[event][0]
+                        self.events[event][0] = (sched_time, repeat,
+                                                 entry['data'])
+                except (ValueError, KeyError, TypeError):
+                    # Most likely a partially written line from a crash
+                    LOG.warning('Skipping invalid schedule journal entry')
+                    continue
+                self._journal_entries += 1
+
+    def _write_journal(self, entry):
+        """Append a change to the journal, called with the lock held."""
+        try:
+            if self._journal is None:
+                self._journal = open(self.journal_file, 'a')
+            self._journal.write(json.dumps(entry) + '\n')
+            self._journal.flush()
+            self._journal_entries += 1
+        except (OSError, TypeError) as e:
+            LOG.error('Could not write schedule journal ({})'.format(repr(e)))
+
+    def _compact(self):
+        """Write the schedule file and clear the journal, called with the
+        lock held."""
+        events = {}
+        for event, event_list in self.events.items():
+            single_shot = [e for e in event_list if not e[1]]
+            if single_shot:
+                events[event] = single_shot
+        tmp_file = self.schedule_file + '.tmp'
+        try:
+            with open(tmp_file, 'w') as f:
+                json.dump(events, f)
+            os.replace(tmp_file, self.schedule_file)
+        except OSError as e:
+            LOG.error('Could not store schedule ({})'.format(repr(e)))
+            return
+
+        # Everything is in the schedule file now, start a new journal
+        if self._journal is not None:
+            self._journal.close()
+            self._journal = None
+        try:
+            open(self.journal_file, 'w').close()
+        except OSError as e:
+            LOG.error('Could not clear schedule journal ({})'.format(repr(e)))
+        self._journal_entries = 0
 
     def run(self):
         while self.is_running:
             self.check_state()
-            time.sleep(0.5)
+            with self.schedule_changed:
+                if self._journal_entries > JOURNAL_MAX_ENTRIES:
+                    self._compact()
+                if self.is_running:
+                    self.schedule_changed.wait(self._time_to_next_event())
+
+    def _time_to_next_event(self):
+        """Seconds until the next event is due, called with the lock held.
+
+        The wait is capped at MAX_WAIT to pick up changes of the system
+        clock since event times are given in unix time.
+        """
+        if not self._heap:
+            return MAX_WAIT
+        return min(max(self._heap[0][0] - time.time(), 0), MAX_WAIT)
+
+    def _push(self, event, sched_time):
+        """Add a trigger time to the heap, called with the lock held."""
+        entry = [sched_time, next(self._sequence), event, True]
+        heappush(self._heap, entry)
+        self._heap_entries.setdefault(event, []).append(entry)
+
+    def _deactivate(self, event):
+        """Invalidate all heap entries of an event, called with the lock held.
+
+        The entries are left in the heap and skipped when popped. The heap
+        is rebuilt when the majority of the entries are inactive.
+        """
+        for entry in self._heap_entries.pop(event, []):
+            entry[3] = False
+            self._inactive_entries += 1
+        if (self._inactive_entries > 64 and
+                self._inactive_entries > len(self._heap) // 2):
+            self._heap = [e for e in self._heap if e[3]]
+            heapify(self._heap)
+            self._inactive_entries = 0
 
     def check_state(self):
-        """Check if an event should be triggered."""
+        """Trigger the events that are due."""
+        pending_messages = []
         with self.event_lock:
-            # Check all events
-            pending_messages = []
-            for event in self.events:
-                current_time = time.time()
-                e = self.events[event]
+            current_time = time.time()
+            while self._heap and self._heap[0][0] <= current_time:
+                _, _, event, active = entry = heappop(self._heap)
+                if not active:
+                    self._inactive_entries -= 1
+                    continue
+                self._heap_entries[event].remove(entry)
+                if not self._heap_entries[event]:
+                    del self._heap_entries[event]
+
+                e = self.events.get(event, [])
                 # Get scheduled times that has passed
                 passed = [(t, r, d) for (t, r, d) in e if t <= current_time]
                 # and remaining times that we're still waiting for
@@ -116,11 +257,12 @@ class EventScheduler(Thread):
                     if repeat:
                         next_time = repeat_time(sched_time, repeat)
                         remaining.append((next_time, repeat, data))
-                # update list of events
-                self.events[event] = remaining
-
-        # Remove events have are now completed
-        self.clear_empty()
+                        self._push(event, next_time)
+                # update list of events, removing completed events
+                if remaining:
+                    self.events[event] = remaining
+                else:
+                    self.events.pop(event, None)
 
         # Finally, emit the queued up events that triggered
         for msg in pending_messages:
@@ -148,6 +290,11 @@ class EventScheduler(Thread):
                 # add received event and time
                 event_list.append((sched_time, repeat, data))
                 self.events[event] = event_list
+                self._push(event, sched_time)
+                if not repeat:
+                    self._write_journal({'op': 'schedule', 'event': event,
+                                         'time': sched_time, 'data': data})
+                self.schedule_changed.notify()
 
     def schedule_event_handler(self, message):
         """Messagebus interface to the schedule_event method.
@@ -179,6 +326,8 @@ class EventScheduler(Thread):
         with self.event_lock:
             if event in self.events:
                 self.events.pop(event)
+                self._deactivate(event)
+                self._write_journal({'op': 'remove', 'event': event})
 
     def remove_event_handler(self, message):
         """Messagebus interface to the remove_event method."""
@@ -200,6 +349,8 @@ class EventScheduler(Thread):
             if len(self.events.get(event, [])) > 0:
                 time, repeat, _ = self.events[event][0]
                 self.events[event][0] = (time, repeat, data)
+                self._write_journal({'op': 'update', 'event': event,
+                                     'data': data})
 
     def update_event_handler(self, message):
         """Messagebus interface to the update_event method."""
@@ -223,8 +374,7 @@ class EventScheduler(Thread):
     def store(self):
         """Write current schedule to disk."""
         with self.event_lock:
-            with open(self.schedule_file, 'w') as f:
-                json.dump(self.events, f)
+            self._compact()
 
     def clear_repeating(self):
         """Remove repeating events from events dict."""
@@ -240,7 +390,9 @@ class EventScheduler(Thread):
 
     def shutdown(self):
         """Stop the running thread."""
-        self.is_running = False
+        with self.schedule_changed:
+            self.is_running = False
+            self.schedule_changed.notify()
         # Remove listeners
         self.bus.remove_all_listeners('mycroft.scheduler.schedule_event')
         self.bus.remove_all_listeners('mycroft.scheduler.remove_event')
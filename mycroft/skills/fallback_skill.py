@@ -15,8 +15,12 @@
 """The fallback skill implements a special type of skill handling
 utterances not handled by the intent system.
 """
-import operator
-from mycroft.metrics import report_timing, Stopwatch
+from concurrent.futures import ThreadPoolExecutor, TimeoutError
+from threading import Lock
+from time import time
+
+from mycroft.configuration import Configuration
+from mycroft.metrics import LatencyHistogram, report_timing, Stopwatch
 from mycroft.util.log import LOG
 
 
@@ -46,8 +50,22 @@ class FallbackSkill(MycroftSkill):
 
     A Fallback can either observe or consume an utterance. A consumed
     utterance will not be see by any other Fallback handlers.
+
+    In the "parallel" fallback mode handlers registered as speculative are
+    started at once, before the higher priority handlers are done. They
+    should only look things up, since they may run even though a higher
+    priority handler consumes the utterance. All other handlers are only
+    started once every higher priority handler has declined.
     """
     fallback_handlers = {}
+    fallback_timeouts = {}  # priority: seconds, None uses the default
+    fallback_speculative = {}  # priority: True if started ahead of time
+    # (priority, handler, timeout, speculative) sorted by priority, replaced
+    # on every change so it can be used without locking
+    fallback_table = ()
+    fallback_lock = Lock()
+    # Handler name: LatencyHistogram of the time taken by the handler
+    fallback_latencies = {}
 
     def __init__(self, name=None, bus=None, use_settings=True):
         super().__init__(name, bus, use_settings)
@@ -58,6 +76,10 @@ class FallbackSkill(MycroftSkill):
     @classmethod
     def make_intent_failure_handler(cls, bus):
         """Goes through all fallback handlers until one returns True"""
+        config = Configuration.get().get('skills', {}).get('fallback', {})
+        parallel = config.get('mode') == 'parallel'
+        default_timeout = config.get('timeout')
+        executor = ThreadPoolExecutor(max_workers=config.get('threads', 8))
 
         def handler(message):
             # indicate fallback handling start
@@ -67,19 +89,15 @@ class FallbackSkill(MycroftSkill):
             stopwatch = Stopwatch()
             handler_name = None
             with stopwatch:
-                for _, handler in sorted(cls.fallback_handlers.items(),
-                                         key=operator.itemgetter(0)):
-                    try:
-                        if handler(message):
-                            #  indicate completion
-                            handler_name = get_handler_name(handler)
-                            bus.emit(message.reply(
-                                     'mycroft.skill.handler.complete',
-                                     data={'handler': "fallback",
-                                           "fallback_handler": handler_name}))
-                            break
-                    except Exception:
-                        LOG.exception('Exception in fallback.')
+                handler = cls._run_fallbacks(message, executor, parallel,
+                                             default_timeout)
+                if handler:
+                    #  indicate completion
+                    handler_name = get_handler_name(handler)
+                    bus.emit(message.reply(
+                             'mycroft.skill.handler.complete',
+                             data={'handler': "fallback",
+                                   "fallback_handler": handler_name}))
                 else:  # No fallback could handle the utterance
                     bus.emit(message.reply('complete_intent_failure'))
                     warning = "No fallback could handle intent."
@@ -95,10 +113,91 @@ class FallbackSkill(MycroftSkill):
                 report_timing(ident, 'fallback_handler', stopwatch,
                               {'handler': handler_name})
 
+        def stats_handler(message):
+            bus.emit(message.response(cls.fallback_stats()))
+
+        bus.on('mycroft.skills.fallback.stats', stats_handler)
         return handler
 
     @classmethod
-    def _register_fallback(cls, handler, priority):
+    def _run_fallbacks(cls, message, executor, parallel, default_timeout):
+        """Run fallback handlers until one consumes the utterance.
+
+        Each handler runs in the executor. In parallel mode speculative
+        handlers are started at once, other handlers are started one at a
+        time once all higher priority handlers have declined. The results
+        are checked in priority order, a handler not done within its
+        timeout is skipped.
+
+        Returns:
+            the handler consuming the utterance, None if no handler did
+        """
+        table = cls.fallback_table
+
+        def start(handler):
+            future = executor.submit(cls._timed_fallback, handler, message)
+            return future, time()
+
+        started = {}
+        if parallel:
+            started = {i: start(handler)
+                       for i, (_, handler, _, speculative) in enumerate(table)
+                       if speculative}
+        result = None
+        for i, (_, handler, timeout, speculative) in enumerate(table):
+            future, start_time = started.get(i) or start(handler)
+            if timeout is None:
+                timeout = default_timeout
+            if timeout is not None:
+                timeout = max(start_time + timeout - time(), 0)
+            try:
+                if future.result(timeout):
+                    if i in started:
+                        # Only the winning speculative handler activates
+                        # its skill
+                        getattr(handler, 'make_active', lambda: None)()
+                    result = handler
+                    break
+            except TimeoutError:
+                LOG.warning('Fallback {} timed out'.format(
+                    get_handler_name(handler)))
+            except Exception:
+                LOG.exception('Exception in fallback.')
+
+        for future, _ in started.values():
+            future.cancel()  # Skip handlers that haven't started yet
+        return result
+
+    @classmethod
+    def _timed_fallback(cls, handler, message):
+        start = time()
+        try:
+            return handler(message)
+        finally:
+            name = get_handler_name(handler)
+            histogram = cls.fallback_latencies.get(name)
+            if histogram is None:
+                histogram = cls.fallback_latencies.setdefault(
+                    name, LatencyHistogram())
+            histogram.add(time() - start)
+
+    @classmethod
+    def fallback_stats(cls):
+        """Get the latency histograms of the fallback handlers."""
+        return {name: histogram.to_dict()
+                for name, histogram in list(cls.fallback_latencies.items())}
+
+    @classmethod
+    def _update_fallback_table(cls):
+        cls.fallback_table = tuple(
+            (priority, cls.fallback_handlers[priority],
+             cls.fallback_timeouts.get(priority),
+             cls.fallback_speculative.get(priority, False))
+            for priority in sorted(cls.fallback_handlers))
+
+    @classmethod
+    def _register_fallback(cls, handler, priority, timeout=None,
+                           speculative=False):
         """Register a function to be called as a general info fallback
         Fallback should receive message and return
         a boolean (True if succeeded or False if failed)
@@ -106,24 +205,46 @@ class FallbackSkill(MycroftSkill):
         Lower priority gets run first
         0 for high priority 100 for low priority
         """
-        while priority in cls.fallback_handlers:
-            priority += 1
+        with cls.fallback_lock:
+            while priority in cls.fallback_handlers:
+                priority += 1
 
-        cls.fallback_handlers[priority] = handler
+            cls.fallback_handlers[priority] = handler
+            cls.fallback_timeouts[priority] = timeout
+            cls.fallback_speculative[priority] = speculative
+            cls._update_fallback_table()
 
-    def register_fallback(self, handler, priority):
+    def register_fallback(self, handler, priority, timeout=None,
+                          speculative=False):
         """Register a fallback with the list of fallback handlers and with the
         list of handlers registered by this instance
+
+        Arguments:
+            handler (callable): handler taking the message
+            priority (int): priority of the handler, lowest runs first
+            timeout (float): seconds to wait for the handler before moving
+                             on to the next one, defaults to the configured
+                             fallback timeout
+            speculative (bool): in the parallel fallback mode, start the
+                                handler before the higher priority handlers
+                                are done. Only for handlers without side
+                                effects such as speaking, the handler may
+                                run even if the utterance is consumed.
         """
 
         def wrapper(*args, **kwargs):
             if handler(*args, **kwargs):
-                self.make_active()
+                if not speculative:
+                    self.make_active()
                 return True
             return False
 
+        wrapper.__name__ = get_handler_name(handler)
+        if speculative:
+            # Activated by the dispatcher if the handler wins
+            wrapper.make_active = self.make_active
         self.instance_fallback_handlers.append(wrapper)
-        self._register_fallback(wrapper, priority)
+        self._register_fallback(wrapper, priority, timeout, speculative)
 
     @classmethod
     def remove_fallback(cls, handler_to_del):
@@ -132,10 +253,14 @@ class FallbackSkill(MycroftSkill):
         Arguments:
             handler_to_del: reference to handler
         """
-        for priority, handler in cls.fallback_handlers.items():
-            if handler == handler_to_del:
-                del cls.fallback_handlers[priority]
-                return
+        with cls.fallback_lock:
+            for priority, handler in cls.fallback_handlers.items():
+                if handler == handler_to_del:
+                    del cls.fallback_handlers[priority]
+                    cls.fallback_timeouts.pop(priority, None)
+                    cls.fallback_speculative.pop(priority, None)
+                    cls._update_fallback_table()
+                    return
         LOG.warning('Could not remove fallback!')
 
     def remove_instance_handlers(self):
@@ -13,6 +13,12 @@
 # limitations under the License.
 #
 import time
+from collections import deque, namedtuple, OrderedDict
+from copy import deepcopy
+from concurrent.futures import ThreadPoolExecutor
+from threading import Condition, Event, Lock
+from uuid import uuid4
+
 from adapt.context import ContextManagerFrame
 from adapt.engine import IntentDeterminationEngine
 from adapt.intent import IntentBuilder
@@ -27,6 +33,11 @@ from mycroft.skills.padatious_service import PadatiousService
 from .intent_service_interface import open_intent_envelope
 
 
+# Intent candidate from one of the intent engines
+IntentMatch = namedtuple('IntentMatch',
+                         ['engine', 'confidence', 'utterance', 'intent'])
+
+
 class AdaptIntent(IntentBuilder):
     def __init__(self, name=''):
         super().__init__(name)
@@ -46,23 +57,90 @@ def workaround_one_of_context(best_intent):
     return best_intent
 
 
+class _ContextEntry:
+    """ Frame on the context stack with its bookkeeping.
+
+    Arguments:
+        frame (ContextManagerFrame): the frame
+        expires (float): monotonic time the frame times out
+        seq (int): sequence number, consecutive for the frames on the stack
+    """
+    __slots__ = ('frame', 'expires', 'seq', 'level', 'newer')
+
+    def __init__(self, frame, expires, seq):
+        self.frame = frame
+        self.expires = expires
+        self.seq = seq
+        self.level = 0  # Number of depth increments below this frame
+        self.newer = None  # The entry injected after this one
+
+    @property
+    def origin(self):
+        return self.frame.entities[-1].get('origin', '')
+
+
+def _keyword(entity):
+    return entity['data'][0][1]
+
+
 class ContextManager:
     """
     ContextManager
     Use to track context throughout the course of a conversational session.
-    How to manage a session's lifecycle is not captured here.
+    How to manage a session's lifecycle is not captured here, a separate
+    ContextManager can be used for each session.
+
+    Frames are kept newest first, so timed out frames are dropped from the
+    end of the stack. The latest entity of each keyword is indexed and the
+    confidence decay by conversation depth is computed when the context is
+    read, making lookups independent of the conversation length.
     """
 
     def __init__(self, timeout):
-        self.frame_stack = []
+        self.frame_stack = deque()  # _ContextEntry, newest first
         self.timeout = timeout * 60  # minutes to seconds
+        self.generation = 0  # Increased on every change of the context
+        # keyword -> deque of (entry, entity) for every entry containing the
+        # keyword, oldest first
+        self.keywords = {}
+        self.seq = 0
+        self.lock = Lock()
 
     def clear_context(self):
-        self.frame_stack = []
+        with self.lock:
+            self.frame_stack.clear()
+            self.keywords.clear()
+            self.generation += 1
 
     def remove_context(self, context_id):
-        self.frame_stack = [(f, t) for (f, t) in self.frame_stack
-                            if context_id in f.entities[0].get('data', [])]
+        """ Remove all entities of a keyword from the context.
+
+        Args:
+            context_id (str): keyword to remove
+        """
+        with self.lock:
+            instances = self.keywords.pop(context_id, ())
+            emptied = False
+            for entry, _ in instances:
+                frame = entry.frame
+                frame.entities = [e for e in frame.entities
+                                  if _keyword(e) != context_id]
+                emptied = emptied or not frame.entities
+            if emptied:
+                self.frame_stack = deque(e for e in self.frame_stack
+                                         if e.frame.entities)
+                self._relink()
+            self.generation += 1
+
+    def fingerprint(self):
+        """ Get a value identifying the current context.
+
+        The fingerprint changes whenever the context is modified or a frame
+        times out.
+        """
+        with self.lock:
+            self._expire()
+            return self.generation, len(self.frame_stack)
 
     def inject_context(self, entity, metadata=None):
         """
@@ -75,79 +153,256 @@ class ContextManager:
             metadata(object): dict, arbitrary metadata about entity injected
         """
         metadata = metadata or {}
-        try:
-            if len(self.frame_stack) > 0:
-                top_frame = self.frame_stack[0]
-            else:
-                top_frame = None
-            if top_frame and top_frame[0].metadata_matches(metadata):
-                top_frame[0].merge_context(entity, metadata)
+        with self.lock:
+            self.generation += 1
+            try:
+                keyword = _keyword(entity)
+            except (IndexError, KeyError, TypeError):
+                return
+            self._expire()
+            top = self.frame_stack[0] if self.frame_stack else None
+            if top and top.frame.metadata_matches(metadata):
+                top.frame.merge_context(entity, metadata)
+                self._link(top, self.frame_stack[1]
+                           if len(self.frame_stack) > 1 else None)
             else:
                 frame = ContextManagerFrame(entities=[entity],
                                             metadata=metadata.copy())
-                self.frame_stack.insert(0, (frame, time.time()))
-        except (IndexError, KeyError):
-            pass
+                top = _ContextEntry(frame, time.monotonic() + self.timeout,
+                                    self.seq)
+                self.seq += 1
+                self._push(top)
+            instances = self.keywords.setdefault(keyword, deque())
+            # Only the first entity of a keyword in a frame is used
+            if not instances or instances[-1][0] is not top:
+                instances.append((top, entity))
 
     def get_context(self, max_frames=None, missing_entities=None):
         """ Constructs a list of entities from the context.
 
+        Only the latest entity of each keyword is included. Confidences are
+        decayed by the conversation depth of their frame.
+
         Args:
             max_frames(int): maximum number of frames to look back
-            missing_entities(list of str): a list or set of tag names,
-            as strings
+            missing_entities(list of str): a list or set of keywords, if
+            given only entities of these keywords are returned
 
         Returns:
-            list: a list of entities
+            list: a list of entities, newest first
         """
-        missing_entities = missing_entities or []
-
-        relevant_frames = [frame[0] for frame in self.frame_stack if
-                           time.time() - frame[1] < self.timeout]
-        if not max_frames or max_frames > len(relevant_frames):
-            max_frames = len(relevant_frames)
-
-        missing_entities = list(missing_entities)
-        context = []
-        last = ''
-        depth = 0
-        for i in range(max_frames):
-            frame_entities = [entity.copy() for entity in
-                              relevant_frames[i].entities]
-            for entity in frame_entities:
-                entity['confidence'] = entity.get('confidence', 1.0) \
-                    / (2.0 + depth)
-            context += frame_entities
-
-            # Update depth
-            if entity['origin'] != last or entity['origin'] == '':
-                depth += 1
-            last = entity['origin']
-            print(depth)
-
-        result = []
-        if len(missing_entities) > 0:
-            for entity in context:
-                if entity.get('data') in missing_entities:
-                    result.append(entity)
-                    # NOTE: this implies that we will only ever get one
-                    # of an entity kind from context, unless specified
-                    # multiple times in missing_entities. Cannot get
-                    # an arbitrary number of an entity kind.
-                    missing_entities.remove(entity.get('data'))
+        with self.lock:
+            self._expire()
+            if not self.frame_stack:
+                return []
+            if missing_entities:
+                keywords = set(missing_entities)
+            else:
+                keywords = self.keywords.keys()
+
+            top = self.frame_stack[0]
+            latest = []
+            for keyword in keywords:
+                instances = self.keywords.get(keyword)
+                if not instances:
+                    continue
+                entry, entity = instances[-1]
+                position = top.seq - entry.seq
+                if max_frames and position >= max_frames:
+                    continue
+                latest.append((position, entry.frame.entities.index(entity),
+                               entry, entity))
+            latest.sort(key=lambda item: item[:2])
+            return [self._decayed(entity, entry)
+                    for _, _, entry, entity in latest]
+
+    def _decayed(self, entity, entry):
+        """ Copy of an entity with confidence decayed by its depth. """
+        top = self.frame_stack[0]
+        depth = 0 if entry is top else 1 + top.level - entry.newer.level
+        entity = entity.copy()
+        entity['confidence'] = entity.get('confidence', 1.0) / (2.0 + depth)
+        return entity
+
+    def _push(self, entry):
+        older = self.frame_stack[0] if self.frame_stack else None
+        if older:
+            older.newer = entry
+        self.frame_stack.appendleft(entry)
+        self._link(entry, older)
+
+    @staticmethod
+    def _link(entry, older):
+        """ Set the depth level of an entry from the entry before it.
+
+        The depth increases between two frames unless both come from the
+        same non-empty origin.
+        """
+        if older is None:
+            entry.level = 0
         else:
-            result = context
+            origin = older.origin
+            increment = origin != entry.origin or origin == ''
+            entry.level = older.level + int(increment)
+
+    def _relink(self):
+        """ Rebuild the links and sequence numbers between entries after
+        frames were removed.
+
+        The sequence numbers give the position of a frame on the stack, so
+        they are renumbered to close the gaps left by removed frames.
+        """
+        older = None
+        for seq, entry in enumerate(reversed(self.frame_stack)):
+            if older:
+                older.newer = entry
+            entry.newer = None
+            entry.seq = seq
+            self._link(entry, older)
+            older = entry
+        self.seq = len(self.frame_stack)
+
+    def _expire(self):
+        """ Drop the frames that timed out. """
+        now = time.monotonic()
+        while self.frame_stack and self.frame_stack[-1].expires <= now:
+            entry = self.frame_stack.pop()
+            for entity in entry.frame.entities:
+                keyword = _keyword(entity)
+                instances = self.keywords.get(keyword)
+                while instances and instances[0][0] is entry:
+                    instances.popleft()
+                if instances is not None and not instances:
+                    del self.keywords[keyword]
+            self.generation += 1
+
+
+class ConverseSession:
+    """Collect converse results from several active skills in parallel.
+
+    Arguments:
+        skill_ids (list): active skills in priority order
+    """
+    def __init__(self, skill_ids):
+        self.skill_ids = list(skill_ids)
+        self.results = {}
+        self.condition = Condition()
+
+    def set_result(self, skill_id, result):
+        """Store the result of a skill's converse() call."""
+        with self.condition:
+            if skill_id in self.skill_ids and skill_id not in self.results:
+                self.results[skill_id] = bool(result)
+                self.condition.notify_all()
+
+    def wait(self, timeout):
+        """Wait for the highest priority skill accepting the utterance.
+
+        Returns as soon as a skill has accepted and all skills with higher
+        priority have declined. Skills that haven't answered when the
+        timeout expires are treated as declining.
+
+        Arguments:
+            timeout (float): max seconds to wait for all results
+
+        Returns:
+            str: id of the accepting skill or None if no skill accepted
+        """
+        deadline = time.monotonic() + timeout
+        with self.condition:
+            while True:
+                for skill_id in self.skill_ids:
+                    if skill_id not in self.results:
+                        break  # Waiting for a higher priority skill
+                    elif self.results[skill_id]:
+                        return skill_id
+                else:
+                    return None  # All skills declined
+
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return next((s for s in self.skill_ids
+                                 if self.results.get(s)), None)
+                self.condition.wait(remaining)
+
+
+class ContextSnapshot:
+    """Context manager stand-in returning a fixed context.
+
+    Used to fetch the Adapt context once for all hypotheses of an utterance.
+    """
+    def __init__(self, context):
+        self.context = context
+
+    def get_context(self, max_frames=None, missing_entities=None):
+        return list(self.context)
+
+
+class IntentCache:
+    """ LRU cache of intent matching results.
+
+    Utterances are handled on bus handler threads while the cache is
+    cleared by intent registrations, all access is locked.
+
+    Args:
+        max_size (int): maximum number of cached results, 0 disables caching
+    """
+    def __init__(self, max_size=256):
+        self.max_size = max_size
+        self.entries = OrderedDict()  # key -> (result, time to compute)
+        self.hits = 0
+        self.misses = 0
+        self.saved_time = 0.0
+        self.lock = Lock()
+
+    @property
+    def hit_rate(self):
+        with self.lock:
+            lookups = self.hits + self.misses
+            return self.hits / lookups if lookups else 0.0
+
+    def get(self, key):
+        """ Get a cached result.
+
+        Args:
+            key: cache key, None is never cached
+
+        Returns:
+            copy of the cached result or None if not cached
+        """
+        if key is None or not self.max_size:
+            return None
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self.entries.move_to_end(key)
+            self.hits += 1
+            self.saved_time += entry[1]
+        # The result may be modified by the caller
+        return deepcopy(entry[0])
+
+    def put(self, key, result, elapsed):
+        """ Cache a result.
+
+        Args:
+            key: cache key, None is never cached
+            result: result to cache
+            elapsed (float): time it took to compute the result
+        """
+        if key is None or not self.max_size:
+            return
+        entry = (deepcopy(result), elapsed)
+        with self.lock:
+            self.entries[key] = entry
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_size:
+                self.entries.popitem(last=False)
 
-        # Only use the latest instance of each keyword
-        stripped = []
-        processed = []
-        for f in result:
-            keyword = f['data'][0][1]
-            if keyword not in processed:
-                stripped.append(f)
-                processed.append(keyword)
-        result = stripped
-        return result
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
 
 
 class IntentService:
@@ -182,11 +437,31 @@ class IntentService:
         def add_active_skill_handler(message):
             self.add_active_skill(message.data['skill_id'])
         self.bus.on('active_skill_request', add_active_skill_handler)
+        self.bus.on('padatious:register_intent', self.invalidate_intents)
+        self.bus.on('padatious:register_entity', self.invalidate_intents)
         self.active_skills = []  # [skill_id , timestamp]
         self.converse_timeout = 5  # minutes to prune active_skills
         self.waiting_for_converse = False
         self.converse_result = False
         self.converse_skill_id = ""
+        self.converse_done = Event()
+        # Parallel converse mode asks all active skills at once
+        converse_config = Configuration.get().get('skills', {}).get(
+            'converse', {})
+        self.converse_parallel = converse_config.get('mode') == 'parallel'
+        self.converse_wait = converse_config.get('timeout', 5)
+        self.converse_sessions = {}
+        # Optionally score Padatious intents while Adapt is running
+        padatious_config = Configuration.get().get('padatious', {})
+        if padatious_config.get('parallel_match', False):
+            self.match_executor = ThreadPoolExecutor(max_workers=1)
+        else:
+            self.match_executor = None
+        # Cache of intent matches for recurring utterances
+        cache_config = Configuration.get().get('skills', {}).get(
+            'intent_cache', {})
+        self.intent_cache = IntentCache(cache_config.get('max_size', 256))
+        self.intent_generation = 0
 
     def update_skill_name_dict(self, message):
         """
@@ -210,37 +485,82 @@ class IntentService:
         """Let skills know there was a problem with speech recognition"""
         lang = message.data.get('lang', "en-us")
         set_active_lang(lang)
-        for skill in self.active_skills:
-            self.do_converse(None, skill[0], lang)
+        if self.converse_parallel:
+            self.do_parallel_converse(None, [s[0] for s in self.active_skills],
+                                      lang)
+        else:
+            for skill in self.active_skills:
+                self.do_converse(None, skill[0], lang)
 
     def do_converse(self, utterances, skill_id, lang):
         self.waiting_for_converse = True
         self.converse_result = False
         self.converse_skill_id = skill_id
+        self.converse_done.clear()
         self.bus.emit(Message("skill.converse.request", {
             "skill_id": skill_id, "utterances": utterances, "lang": lang}))
-        start_time = time.time()
-        t = 0
-        while self.waiting_for_converse and t < 5:
-            t = time.time() - start_time
-            time.sleep(0.1)
+        self.converse_done.wait(self.converse_wait)
         self.waiting_for_converse = False
         self.converse_skill_id = ""
         return self.converse_result
 
+    def do_parallel_converse(self, utterances, skill_ids, lang):
+        """Send the utterances to all listed skills at once.
+
+        The converse requests are emitted without waiting for each other so
+        the skills handle them concurrently. Note that this means lower
+        priority skills may run converse() even if a higher priority skill
+        accepts the utterance.
+
+        Arguments:
+            utterances (list): utterances to converse about
+            skill_ids (list): skill ids in priority order
+            lang (str): language of the utterances
+
+        Returns:
+            str: id of the accepting skill, None if none accepted
+        """
+        if not skill_ids:
+            return None
+        session_id = str(uuid4())
+        session = ConverseSession(skill_ids)
+        self.converse_sessions[session_id] = session
+        try:
+            for skill_id in skill_ids:
+                self.bus.emit(Message("skill.converse.request",
+                                      {"skill_id": skill_id,
+                                       "utterances": utterances,
+                                       "lang": lang},
+                                      {"converse_session": session_id}))
+            return session.wait(self.converse_wait)
+        finally:
+            self.converse_sessions.pop(session_id, None)
+
+    def _get_converse_session(self, message):
+        session_id = message.context.get('converse_session')
+        return self.converse_sessions.get(session_id)
+
     def handle_converse_error(self, message):
         skill_id = message.data["skill_id"]
         if message.data["error"] == "skill id does not exist":
             self.remove_active_skill(skill_id)
-        if skill_id == self.converse_skill_id:
+        session = self._get_converse_session(message)
+        if session:
+            session.set_result(skill_id, False)
+        elif skill_id == self.converse_skill_id:
             self.converse_result = False
             self.waiting_for_converse = False
+            self.converse_done.set()
 
     def handle_converse_response(self, message):
         skill_id = message.data["skill_id"]
-        if skill_id == self.converse_skill_id:
+        session = self._get_converse_session(message)
+        if session:
+            session.set_result(skill_id, message.data.get("result", False))
+        elif skill_id == self.converse_skill_id:
             self.converse_result = message.data.get("result", False)
             self.waiting_for_converse = False
+            self.converse_done.set()
 
     def remove_active_skill(self, skill_id):
         for skill in self.active_skills:
@@ -273,24 +593,49 @@ class IntentService:
             elif context_entity['data'][0][1] in self.context_keywords:
                 self.context_manager.inject_context(context_entity)
 
-    def send_metrics(self, intent, context, stopwatch):
+    def send_metrics(self, intent, context, stopwatch, cache_hit=None):
         """
         Send timing metrics to the backend.
 
         NOTE: This only applies to those with Opt In.
         """
         ident = context['ident'] if 'ident' in context else None
+        data = {}
+        if cache_hit is not None:
+            data['intent_cache_hit'] = cache_hit
+            data['intent_cache_hit_rate'] = self.intent_cache.hit_rate
+            data['intent_cache_saved_time'] = self.intent_cache.saved_time
         if intent:
             # Recreate skill name from skill id
             parts = intent.get('intent_type', '').split(':')
             intent_type = self.get_skill_name(parts[0])
             if len(parts) > 1:
                 intent_type = ':'.join([intent_type] + parts[1:])
-            report_timing(ident, 'intent_service', stopwatch,
-                          {'intent_type': intent_type})
+            data['intent_type'] = intent_type
         else:
-            report_timing(ident, 'intent_service', stopwatch,
-                          {'intent_type': 'intent_failure'})
+            data['intent_type'] = 'intent_failure'
+        report_timing(ident, 'intent_service', stopwatch, data)
+
+    def invalidate_intents(self, message=None):
+        """ Registered intents changed, drop cached intent matches. """
+        self.intent_generation += 1
+        self.intent_cache.clear()
+
+    def _intent_cache_key(self, lang, utterances):
+        """ Key identifying the intent matching result for utterances.
+
+        Returns:
+            tuple, None if the result can't be cached
+        """
+        padatious = PadatiousService.instance
+        if padatious and hasattr(padatious, 'container'):
+            if not padatious.finished_training_event.is_set():
+                return None  # Results change when training completes
+            padatious_generation = padatious.train_count
+        else:
+            padatious_generation = None
+        return (lang, tuple(utterances), self.context_manager.fingerprint(),
+                self.intent_generation, padatious_generation)
 
     def handle_utterance(self, message):
         """ Main entrypoint for handling user utterances with Mycroft skills
@@ -318,9 +663,18 @@ class IntentService:
             set_active_lang(lang)
 
             utterances = message.data.get('utterances', [])
-            # normalize() changes "it's a boy" to "it is a boy", etc.
-            norm_utterances = [normalize(u.lower(), remove_articles=False)
-                               for u in utterances]
+            cache_key = self._intent_cache_key(lang, utterances)
+            cached = self.intent_cache.get(cache_key)
+            start = time.monotonic()
+            if cached:
+                norm_utterances, matches = cached
+            else:
+                # normalize() changes "it's a boy" to "it is a boy", etc.
+                norm_utterances = [normalize(u.lower(),
+                                             remove_articles=False)
+                                   for u in utterances]
+                matches = None
+            elapsed = time.monotonic() - start
 
             # Build list with raw utterance(s) first, then optionally a
             # normalized version following.
@@ -337,15 +691,20 @@ class IntentService:
 
                 if not converse:
                     # No conversation, use intent system to handle utterance
-                    intent = self._adapt_intent_match(utterances,
-                                                      norm_utterances, lang)
-                    for utt in combined:
-                        _intent = PadatiousService.instance.calc_intent(utt)
-                        if _intent:
-                            best = padatious_intent.conf if padatious_intent\
-                                        else 0.0
-                            if best < _intent.conf:
-                                padatious_intent = _intent
+                    if matches is None:
+                        start = time.monotonic()
+                        matches = self.match_intents(utterances,
+                                                     norm_utterances,
+                                                     combined)
+                        elapsed += time.monotonic() - start
+                        self.intent_cache.put(cache_key,
+                                              (norm_utterances, matches),
+                                              elapsed)
+                    intent = next((m.intent for m in matches
+                                   if m.engine == 'adapt'), None)
+                    padatious_intent = next((m.intent for m in matches
+                                             if m.engine == 'padatious'),
+                                            None)
                     LOG.debug("Padatious intent: {}".format(padatious_intent))
                     LOG.debug("    Adapt intent: {}".format(intent))
 
@@ -381,7 +740,8 @@ class IntentService:
                                        'norm_utt': norm_utterances[0],
                                        'lang': lang})
             self.bus.emit(reply)
-            self.send_metrics(intent, message.context, stopwatch)
+            self.send_metrics(intent, message.context, stopwatch,
+                              cache_hit=cached is not None)
         except Exception as e:
             LOG.exception(e)
 
@@ -401,6 +761,14 @@ class IntentService:
                               if time.time() - skill[
                                   1] <= self.converse_timeout * 60]
 
+        if self.converse_parallel:
+            skill_id = self.do_parallel_converse(
+                utterances, [skill[0] for skill in self.active_skills], lang)
+            if skill_id:
+                self.add_active_skill(skill_id)
+                return True
+            return False
+
         # check if any skill wants to handle utterance
         for skill in self.active_skills:
             if self.do_converse(utterances, skill[0], lang):
@@ -410,48 +778,108 @@ class IntentService:
                 return True
         return False
 
-    def _adapt_intent_match(self, raw_utt, norm_utt, lang):
-        """ Run the Adapt engine to search for an matching intent
+    def match_intents(self, raw_utt, norm_utt, combined=None):
+        """ Evaluate all utterance hypotheses with Adapt and Padatious.
+
+        Each distinct text is tagged and parsed by Adapt only once and the
+        Adapt context is fetched once for all of them. If parallel matching
+        is enabled Padatious scores the utterances while Adapt is running.
 
         Args:
             raw_utt (list):  list of utterances
             norm_utt (list): same list of utterances, normalized
-            lang (string):   language code, e.g "en-us"
+            combined (list): utterances for Padatious, defaults to the raw
+                             utterances followed by new normalized versions
 
         Returns:
-            Intent structure, or None if no match was found.
+            list of IntentMatch from both engines, highest confidence first.
         """
-        best_intent = None
+        if combined is None:
+            combined = raw_utt + list(set(norm_utt) - set(raw_utt))
+
+        if self.match_executor:
+            padatious = self.match_executor.submit(self._padatious_matches,
+                                                   combined)
+            matches = self._adapt_matches(raw_utt, norm_utt)
+            matches += padatious.result()
+        else:
+            matches = self._adapt_matches(raw_utt, norm_utt)
+            matches += self._padatious_matches(combined)
+        # Stable sort, on equal confidence the first candidate is preferred
+        return sorted(matches, key=lambda m: m.confidence, reverse=True)
+
+    def _adapt_matches(self, raw_utt, norm_utt):
+        """ Run the Adapt engine over raw and normalized utterances.
 
-        def take_best(intent, utt):
-            nonlocal best_intent
-            best = best_intent.get('confidence', 0.0) if best_intent else 0.0
-            conf = intent.get('confidence', 0.0)
-            if conf > best:
-                best_intent = intent
-                # TODO - Shouldn't Adapt do this?
-                best_intent['utterance'] = utt
+        Returns:
+            list of IntentMatch, the best intent for each utterance version
+            in the order raw, normalized for each utterance.
+        """
+        context = ContextSnapshot(self.context_manager.get_context())
+        best_intents = {}
 
+        def best_intent(utt):
+            key = utt.lower()  # Adapt tags the lower case utterance
+            if key not in best_intents:
+                try:
+                    best_intents[key] = next(self.engine.determine_intent(
+                        utt, 100,
+                        include_tags=True,
+                        context_manager=context), None)
+                except Exception as e:
+                    LOG.exception(e)
+                    best_intents[key] = None
+            return best_intents[key]
+
+        matches = []
         for idx, utt in enumerate(raw_utt):
+            # Also test the normalized version, but set the utterance to
+            # the raw version so skill has access to original STT
+            for version in (utt, norm_utt[idx]):
+                intent = best_intent(version)
+                if intent and intent.get('confidence', 0.0) > 0.0:
+                    # TODO - Shouldn't Adapt do this?
+                    intent = dict(intent, utterance=utt)
+                    matches.append(IntentMatch('adapt', intent['confidence'],
+                                               utt, intent))
+        return matches
+
+    @staticmethod
+    def _padatious_matches(utterances):
+        """ Score the utterances with Padatious.
+
+        Returns:
+            list of IntentMatch for utterances matching an intent
+        """
+        service = PadatiousService.instance
+        if not service or not hasattr(service, 'container'):
+            return []
+        matches = []
+        for utt in utterances:
             try:
-                intents = [i for i in self.engine.determine_intent(
-                    utt, 100,
-                    include_tags=True,
-                    context_manager=self.context_manager)]
-                if intents:
-                    take_best(intents[0], utt)
-
-                # Also test the normalized version, but set the utternace to
-                # the raw version so skill has access to original STT
-                norm_intents = [i for i in self.engine.determine_intent(
-                    norm_utt[idx], 100,
-                    include_tags=True,
-                    context_manager=self.context_manager)]
-                if norm_intents:
-                    take_best(norm_intents[0], utt)
+                intent = service.calc_intent(utt)
             except Exception as e:
                 LOG.exception(e)
-        return best_intent
+                continue
+            if intent and intent.conf > 0.0:
+                matches.append(IntentMatch('padatious', intent.conf, utt,
+                                           intent))
+        return matches
+
+    def _adapt_intent_match(self, raw_utt, norm_utt, lang):
+        """ Run the Adapt engine to search for an matching intent
+
+        Args:
+            raw_utt (list):  list of utterances
+            norm_utt (list): same list of utterances, normalized
+            lang (string):   language code, e.g "en-us"
+
+        Returns:
+            Intent structure, or None if no match was found.
+        """
+        matches = sorted(self._adapt_matches(raw_utt, norm_utt),
+                         key=lambda m: m.confidence, reverse=True)
+        return matches[0].intent if matches else None
 
     def handle_register_vocab(self, message):
         start_concept = message.data.get('start')
@@ -463,16 +891,19 @@ class IntentService:
         else:
             self.engine.register_entity(
                 start_concept, end_concept, alias_of=alias_of)
+        self.invalidate_intents()
 
     def handle_register_intent(self, message):
         intent = open_intent_envelope(message)
         self.engine.register_intent_parser(intent)
+        self.invalidate_intents()
 
     def handle_detach_intent(self, message):
         intent_name = message.data.get('intent_name')
         new_parsers = [
             p for p in self.engine.intent_parsers if p.name != intent_name]
         self.engine.intent_parsers = new_parsers
+        self.invalidate_intents()
 
     def handle_detach_skill(self, message):
         skill_id = message.data.get('skill_id')
@@ -480,6 +911,7 @@ class IntentService:
             p for p in self.engine.intent_parsers if
             not p.name.startswith(skill_id)]
         self.engine.intent_parsers = new_parsers
+        self.invalidate_intents()
 
     def handle_add_context(self, message):
         """ Add context
@@ -18,7 +18,6 @@ import sys
 import re
 import traceback
 import inspect
-from itertools import chain
 from adapt.intent import Intent, IntentBuilder
 from os import walk
 from os.path import join, abspath, dirname, basename, exists
@@ -40,8 +39,9 @@ from mycroft.util.log import LOG
 
 from ..settings import SkillSettings
 from ..skill_data import (load_vocabulary, load_regex, to_alnum,
-                          munge_regex, munge_intent_parser, read_vocab_file,
-                          read_value_file, read_translated_file)
+                          munge_regex, munge_intent_parser,
+                          load_vocabulary_matcher, read_value_file,
+                          read_translated_file)
 from ..event_scheduler import EventSchedulerInterface
 from ..intent_service_interface import IntentServiceInterface
 from .event_container import EventContainer, create_wrapper, get_handler_name
@@ -428,6 +428,23 @@ class MycroftSkill:
         Returns:
             bool: True if the utterance has the given vocabulary it
         """
+        return self.voc_search(utt, voc_filename, lang) is not None
+
+    def voc_search(self, utt, voc_filename, lang=None):
+        """Find the first word of the given vocabulary in the utterance.
+
+        Works like voc_match() but also tells which word matched and where.
+
+        Arguments:
+            utt (str): Utterance to be tested
+            voc_filename (str): Name of vocabulary file (e.g. 'yes' for
+                                'res/text/en-us/yes.voc')
+            lang (str): Language code, defaults to self.long
+
+        Returns:
+            VocabularyMatch: (word, start, end) of the match in the
+                             utterance, None if there is no match
+        """
         lang = lang or self.lang
         cache_key = lang + voc_filename
         if cache_key not in self.voc_match_cache:
@@ -440,15 +457,9 @@ class MycroftSkill:
             if not voc or not exists(voc):
                 raise FileNotFoundError(
                         'Could not find {}.voc file'.format(voc_filename))
-            # load vocab and flatten into a simple list
-            vocab = read_vocab_file(voc)
-            self.voc_match_cache[cache_key] = list(chain(*vocab))
-        if utt:
-            # Check for matches against complete words
-            return any([re.match(r'.*\b' + i + r'\b.*', utt)
-                        for i in self.voc_match_cache[cache_key]])
-        else:
-            return False
+            self.voc_match_cache[cache_key] = load_vocabulary_matcher(voc)
+        # Check for matches against complete words
+        return self.voc_match_cache[cache_key].search(utt)
 
     def report_metric(self, name, data):
         """Report a skill metric to the Mycroft servers.
@@ -14,8 +14,7 @@
 #
 from functools import lru_cache
 from subprocess import call
-from threading import Event
-from time import time as get_time, sleep
+from threading import Event, Lock, Timer
 
 from os.path import expanduser, isfile
 from pkg_resources import get_distribution
@@ -39,7 +38,7 @@ class PadatiousService(FallbackSkill):
 
         self.padatious_config = Configuration.get()['padatious']
         self.service = service
-        intent_cache = expanduser(self.padatious_config['intent_cache'])
+        self.intent_cache = expanduser(self.padatious_config['intent_cache'])
 
         try:
             from padatious import IntentContainer
@@ -52,7 +51,8 @@ class PadatiousService(FallbackSkill):
                 pass
             return
 
-        self.container = IntentContainer(intent_cache)
+        # Trained container answering queries, replaced when retrained
+        self.container = IntentContainer(self.intent_cache)
 
         self._bus = bus
         self.bus.on('padatious:register_intent', self.register_intent)
@@ -71,39 +71,84 @@ class PadatiousService(FallbackSkill):
 
         self.finished_training_event = Event()
         self.finished_initial_train = False
+        self.train_count = 0  # Number of completed trainings
 
         self.train_delay = self.padatious_config['train_delay']
-        self.train_time = get_time() + self.train_delay
+        self.train_lock = Lock()
+        self.train_timer = None
+        self.definitions_lock = Lock()
+        self.definitions_changed = True
 
-        self.registered_intents = []
+        # name: file of the registered definitions
+        self.registered_intents = {}
+        self.registered_entities = {}
+
+    def _create_container(self):
+        from padatious import IntentContainer
+        return IntentContainer(self.intent_cache)
 
     def train(self, message=None):
+        """ Train the registered intents and entities.
+
+        A new container is trained while the current one keeps answering
+        queries, it replaces the current one when done. Only definitions
+        that changed since they were last trained are retrained, the others
+        are loaded from the hash-keyed models in the intent cache. Changed
+        definitions are trained in worker processes unless single_thread is
+        set in the message data.
+        """
         if message is None:
             single_thread = False
         else:
             single_thread = message.data.get('single_thread', False)
-        self.finished_training_event.clear()
-
-        LOG.info('Training... (single_thread={})'.format(single_thread))
-        self.container.train(single_thread=single_thread)
-        LOG.info('Training complete.')
-
-        self.finished_training_event.set()
-        if not self.finished_initial_train:
-            LOG.info("Mycroft is all loaded and ready to roll!")
-            self.bus.emit(Message('mycroft.ready'))
-            self.finished_initial_train = True
 
-    def wait_and_train(self):
+        with self.train_lock:
+            with self.definitions_lock:
+                unchanged = not self.definitions_changed
+                if unchanged and self.finished_initial_train:
+                    LOG.debug('Padatious definitions unchanged, '
+                              'skipping training')
+                    return
+                intents = dict(self.registered_intents)
+                entities = dict(self.registered_entities)
+                self.definitions_changed = False
+
+            container = self._create_container()
+            for name, file_name in entities.items():
+                container.load_entity(name, file_name)
+            for name, file_name in intents.items():
+                container.load_intent(name, file_name)
+
+            num_changed = (len(container.intents.objects_to_train) +
+                           len(container.entities.objects_to_train))
+            LOG.info('Training {} of {} intents and entities... '
+                     '(single_thread={})'.format(num_changed,
+                                                 len(intents) + len(entities),
+                                                 single_thread))
+            container.train(single_thread=single_thread)
+            LOG.info('Training complete.')
+
+            self.container = container
+            self.calc_intent.cache_clear()
+            self.train_count += 1
+            self.finished_training_event.set()
+            if not self.finished_initial_train:
+                LOG.info("Mycroft is all loaded and ready to roll!")
+                self.bus.emit(Message('mycroft.ready'))
+                self.finished_initial_train = True
+
+    def schedule_training(self):
+        """ Train in the background once no definition has changed for
+        train_delay seconds.
+        """
         if not self.finished_initial_train:
             return
-        sleep(self.train_delay)
-        if self.train_time < 0.0:
-            return
-
-        if self.train_time <= get_time() + 0.01:
-            self.train_time = -1.0
-            self.train()
+        with self.definitions_lock:
+            if self.train_timer:
+                self.train_timer.cancel()
+            self.train_timer = Timer(self.train_delay, self.train)
+            self.train_timer.daemon = True
+            self.train_timer.start()
 
     def __detach_intent(self, intent_name):
         """ Remove an intent if it has been registered.
@@ -111,20 +156,26 @@ class PadatiousService(FallbackSkill):
         Arguments:
             intent_name (str): intent identifier
         """
-        if intent_name in self.registered_intents:
-            self.registered_intents.remove(intent_name)
-            self.container.remove_intent(intent_name)
+        with self.definitions_lock:
+            if intent_name in self.registered_intents:
+                del self.registered_intents[intent_name]
+                self.definitions_changed = True
+                return True
+        return False
 
     def handle_detach_intent(self, message):
-        self.__detach_intent(message.data.get('intent_name'))
+        if self.__detach_intent(message.data.get('intent_name')):
+            self.calc_intent.cache_clear()
+            self.schedule_training()
 
     def handle_detach_skill(self, message):
         skill_id = message.data['skill_id']
         remove_list = [i for i in self.registered_intents if skill_id in i]
-        for i in remove_list:
-            self.__detach_intent(i)
+        if any([self.__detach_intent(i) for i in remove_list]):
+            self.calc_intent.cache_clear()
+            self.schedule_training()
 
-    def _register_object(self, message, object_name, register_func):
+    def _register_object(self, message, object_name, registered):
         file_name = message.data['file_name']
         name = message.data['name']
 
@@ -134,16 +185,16 @@ class PadatiousService(FallbackSkill):
             LOG.warning('Could not find file ' + file_name)
             return
 
-        register_func(name, file_name)
-        self.train_time = get_time() + self.train_delay
-        self.wait_and_train()
+        with self.definitions_lock:
+            registered[name] = file_name
+            self.definitions_changed = True
+        self.schedule_training()
 
     def register_intent(self, message):
-        self.registered_intents.append(message.data['name'])
-        self._register_object(message, 'intent', self.container.load_intent)
+        self._register_object(message, 'intent', self.registered_intents)
 
     def register_entity(self, message):
-        self._register_object(message, 'entity', self.container.load_entity)
+        self._register_object(message, 'entity', self.registered_entities)
 
     def handle_fallback(self, message, threshold=0.8):
         if not self.finished_training_event.is_set():
@@ -176,4 +227,11 @@ class PadatiousService(FallbackSkill):
     # but we can live with that since it is used as a singleton.
     @lru_cache(maxsize=2)   # 2 catches both raw and normalized utts in cache
     def calc_intent(self, utt):
-        return self.container.calc_intent(utt)
+        container = self.container
+        intent = container.calc_intent(utt)
+        if intent.name and intent.name not in self.registered_intents:
+            # Detached, but still in the container until it is retrained
+            matches = [i for i in container.calc_intents(utt)
+                       if i.name in self.registered_intents]
+            intent = max(matches, key=lambda i: i.conf, default=None)
+        return intent
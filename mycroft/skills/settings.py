@@ -66,7 +66,7 @@ import re
 import time
 from os.path import isfile, join
 from requests.exceptions import RequestException, HTTPError
-from threading import Timer, Thread
+from threading import Event, Lock, Thread
 
 from msm import SkillEntry
 
@@ -117,6 +117,116 @@ class DelayRequest(Exception):
     pass
 
 
+class SettingsSync:
+    """ Keeps the settings of all skills in sync with the backend.
+
+    A single thread fetches the settings of all skills in one request and
+    hands each skill its own entry, matched by skill_gid. Skills are only
+    updated when their entry differs from the one previously seen.
+
+    In "poll" mode the settings are fetched every interval seconds, in
+    "push" mode only when requested through sync_now(), e.g. when the
+    backend signals a change using mycroft.skills.settings.update. Skills
+    that failed to initialize or update are retried every retry_interval
+    seconds in "push" mode.
+    """
+    retry_interval = 5 * 60
+
+    def __init__(self):
+        self.mode = 'poll'
+        self.interval = 60
+        self.skills = {}  # id(settings): settings
+        self.remote = {}  # skill_gid: last seen remote entry as json
+        self._lock = Lock()
+        self._wakeup = Event()
+        self._thread = None
+
+    def register(self, settings):
+        """ Keep a skill's settings in sync, starting the sync if needed.
+
+        Args:
+            settings (SkillSettings): settings of the skill
+        """
+        with self._lock:
+            self.skills[id(settings)] = settings
+            if self._thread is None:
+                config = ConfigurationManager.get()['skills']
+                sync_config = config.get('settings_sync') or {}
+                self.mode = sync_config.get('mode', 'poll')
+                self.interval = sync_config.get('interval', 60)
+                self._thread = Thread(target=self._run, daemon=True)
+                self._thread.start()
+        # Initialize the new skill right away
+        self._wakeup.set()
+
+    def unregister(self, settings):
+        with self._lock:
+            self.skills.pop(id(settings), None)
+
+    def sync_now(self):
+        """ Trigger a sync, requests in quick succession are merged. """
+        self._wakeup.set()
+
+    def _run(self):
+        in_sync = True
+        while True:
+            if self.mode == 'poll':
+                timeout = self.interval
+            else:
+                timeout = None if in_sync else self.retry_interval
+            self._wakeup.wait(timeout)
+            self._wakeup.clear()
+            try:
+                in_sync = self.sync()
+            except Exception as e:
+                LOG.exception('Failed to sync skill settings: '
+                              '{}'.format(repr(e)))
+                in_sync = False
+
+    def sync(self):
+        """ Fetch the settings of all skills and update the changed ones.
+
+        Returns:
+            bool: False if a skill failed to sync and should be retried
+        """
+        if not is_paired():
+            return False
+        with self._lock:
+            skills = list(self.skills.values())
+
+        for settings in skills:
+            if not settings._complete_intialization:
+                settings._initialize_remote()
+        in_sync = all(settings._complete_intialization for settings in skills)
+
+        skills = [settings for settings in skills
+                  if settings._complete_intialization and settings._meta_path]
+        if not skills:
+            return in_sync
+        try:
+            remote = DeviceApi().get_skill_settings()
+        except RequestException as e:
+            LOG.warning('Could not fetch skill settings: {}'.format(repr(e)))
+            return False
+        remote = {entry.get('identifier'): entry
+                  for entry in remote if entry is not None}
+
+        for settings in skills:
+            skill_gid = settings.skill_gid
+            entry = remote.get(skill_gid)
+            entry_json = json.dumps(entry, sort_keys=True)
+            # A missing entry is reuploaded until it shows up on the server
+            if entry is None or self.remote.get(skill_gid) != entry_json:
+                if settings._sync_remote(entry):
+                    self.remote[skill_gid] = entry_json
+                else:
+                    in_sync = False
+        return in_sync
+
+
+settings_sync = SettingsSync()
+
+
 class SkillSettings(dict):
     """ Dictionary that can easily be saved to a file, serialized as json. It
         also syncs to the backend for skill settings
@@ -149,9 +259,6 @@ class SkillSettings(dict):
         self._api_path = None
         self._user_identity = None
         self.changed_callback = None
-        self._poll_timer = None
-        self._blank_poll_timer = None
-        self._is_alive = True
 
         # Add Information extracted from the skills-meta.json entry for the
         # skill.
@@ -159,16 +266,11 @@ class SkillSettings(dict):
         self.__skill_gid = skill_gid
         self.display_name = disp_name
 
-        # if settingsmeta exist
-        if self._meta_path:
-            t = Thread(target=self._poll_skill_settings)
-            t.daemon = True
-            t.start()
-        # if not disallowed by user upload an entry for all skills installed
-        elif self.config['skills']['upload_skill_manifest']:
-            self._blank_poll_timer = Timer(1, self._init_blank_meta)
-            self._blank_poll_timer.daemon = True
-            self._blank_poll_timer.start()
+        # Sync if settingsmeta exist or, if not disallowed by user, to
+        # upload an entry for all skills installed
+        if (self._meta_path or
+                self.config['skills']['upload_skill_manifest']):
+            settings_sync.register(self)
 
     @property
     def skill_gid(self):
@@ -185,16 +287,10 @@ class SkillSettings(dict):
 
     def run_poll(self, _=None):
         """Immediately poll the web for new skill settings"""
-        if self._poll_timer:
-            self._poll_timer.cancel()
-            self._poll_skill_settings()
+        settings_sync.sync_now()
 
     def stop_polling(self):
-        self._is_alive = False
-        if self._poll_timer:
-            self._poll_timer.cancel()
-        if self._blank_poll_timer:
-            self._blank_poll_timer.cancel()
+        settings_sync.unregister(self)
 
     def set_changed_callback(self, callback):
         """ Set callback to perform when server settings have changed.
@@ -362,75 +458,55 @@ class SkillSettings(dict):
         """ md5 hasher for consistency across cpu architectures """
         return hashlib.md5(bytes(string, 'utf-8')).hexdigest()
 
-    def update_remote(self):
-        """ update settings state from server """
-        settings_meta = self._load_settings_meta()
-        if settings_meta is None:
-            return
-        # Get settings
-        skills_settings = self._request_my_settings(self.skill_gid)
-
-        if skills_settings is not None:
-            self.save_skill_settings(skills_settings)
-        else:
-            LOG.debug("No Settings on server for {}".format(self.skill_gid))
-            # Settings meta doesn't exist on server push them
-            settings_meta = self._load_settings_meta()
-            self._upload_meta(settings_meta, self.skill_gid)
+    def _initialize_remote(self):
+        """ Initialize the remote settings, called by the settings sync.
 
-    def _init_blank_meta(self):
-        """ Send blank settingsmeta to remote. """
+        Failures are retried on the next sync.
+        """
+        original = hash(str(self))
         try:
-            if not is_paired() and self.is_alive:
-                self._blank_poll_timer = Timer(60, self._init_blank_meta)
-                self._blank_poll_timer.daemon = True
-                self._blank_poll_timer.start()
-            else:
-                self.initialize_remote_settings()
+            self.initialize_remote_settings()
         except DelayRequest:
-            # Delay 5 minutes and retry
-            self._blank_poll_timer = Timer(60 * 5,
-                                           self._init_blank_meta)
-            self._blank_poll_timer.daemon = True
-            self._blank_poll_timer.start()
+            LOG.info('{}: Delaying settings upload'.format(self.name))
         except Exception as e:
-            LOG.exception('Failed to send blank meta: {}'.format(repr(e)))
+            LOG.exception('Failed to initialize skill settings: '
+                          '{}'.format(repr(e)))
+        if (self._complete_intialization and self.changed_callback and
+                hash(str(self)) != original):
+            self.changed_callback()
+
+    def _sync_remote(self, skill_settings):
+        """ Update from the settings fetched by the settings sync.
 
-    def _poll_skill_settings(self):
-        """ If identifier exists for this skill poll to backend to
-            request settings and store it if it changes
-            TODO: implement as websocket
+        Args:
+            skill_settings (dict): this skill's entry in the remote settings,
+                                   None if the server has no entry
+
+        Returns:
+            bool: False if the update failed and should be retried
         """
-        delay = 10
         original = hash(str(self))
+        success = False
         try:
-            if not is_paired():
-                pass
-            elif not self._complete_intialization:
-                self.initialize_remote_settings()
+            if skill_settings is not None:
+                skill_settings = self._type_cast(skill_settings,
+                                                 to_platform='core')
+                self._remote_settings = skill_settings
+                self.save_skill_settings(skill_settings)
             else:
-                self.update_remote()
+                LOG.debug("No Settings on server for {}".format(
+                    self.skill_gid))
+                # Settings meta doesn't exist on server push them
+                self._upload_meta(self._load_settings_meta(), self.skill_gid)
+            success = True
         except DelayRequest:
-            LOG.info('{}: Delaying next settings fetch'.format(self.name))
-            delay = 5
+            LOG.info('{}: Delaying settings upload'.format(self.name))
         except Exception as e:
-            LOG.exception('Failed to fetch skill settings: {}'.format(repr(e)))
-        finally:
-            # Call callback for updated settings
-            if self._complete_intialization:
-                if self.changed_callback and hash(str(self)) != original:
-                    self.changed_callback()
-
-        if self._poll_timer:
-            self._poll_timer.cancel()
-
-        if not self._is_alive:
-            return
-
-        # continues to poll settings every minute
-        self._poll_timer = Timer(delay * 60, self._poll_skill_settings)
-        self._poll_timer.daemon = True
-        self._poll_timer.start()
+            LOG.exception('Failed to update skill settings: '
+                          '{}'.format(repr(e)))
+        if self.changed_callback and hash(str(self)) != original:
+            self.changed_callback()
+        return success
 
     def load_skill_settings_from_file(self):
         """ If settings.json exist, open and read stored values into self """
@@ -17,8 +17,10 @@
 regular expressions.
 """
 
+from functools import lru_cache
 from os import walk
-from os.path import splitext, join
+from os.path import getmtime, splitext, join
+from itertools import chain
 import re
 import csv
 import collections
@@ -49,6 +51,67 @@ def read_vocab_file(path):
     return vocab
 
 
+# Vocabulary word found in an utterance, with its position
+VocabularyMatch = collections.namedtuple('VocabularyMatch',
+                                         ['word', 'start', 'end'])
+
+
+class VocabularyMatcher:
+    """ Find the words of a vocabulary in utterances.
+
+    The words are compiled into a single regular expression matching any of
+    them as complete words.
+
+    Arguments:
+        words (iterable): words and phrases of the vocabulary
+    """
+    def __init__(self, words):
+        self.words = list(words)
+        # Prefer the longest word matching at a position
+        alternatives = sorted(set(self.words), key=len, reverse=True)
+        if alternatives:
+            self.regex = re.compile(r'\b(?:{})\b'.format(
+                '|'.join(re.escape(word) for word in alternatives)))
+        else:
+            self.regex = None
+
+    def search(self, utt):
+        """ Find the first vocabulary word in an utterance.
+
+        Arguments:
+            utt (str): utterance to search
+
+        Returns:
+            VocabularyMatch or None if no word matched
+        """
+        if not utt or not self.regex:
+            return None
+        match = self.regex.search(utt)
+        if not match:
+            return None
+        return VocabularyMatch(match.group(), match.start(), match.end())
+
+
+@lru_cache(maxsize=512)
+def _load_vocabulary_matcher(path, mtime):
+    return VocabularyMatcher(chain(*read_vocab_file(path)))
+
+
+def load_vocabulary_matcher(path):
+    """ Get the matcher for a .voc file.
+
+    Matchers are shared between all skills and only rebuilt when the file
+    is modified.
+
+    Arguments:
+        path (str): path to vocab file
+
+    Returns:
+        VocabularyMatcher
+    """
+    return _load_vocabulary_matcher(path, getmtime(path))
+
+
 def load_regex_from_file(path, skill_id):
     """Load regex from file
     The regex is sent to the intent handler using the message bus
@@ -22,6 +22,7 @@ from time import time
 from mycroft.configuration import Configuration
 from mycroft.messagebus import Message
 from mycroft.util.log import LOG
+from .mycroft_skill import MycroftSkill
 
 SKILL_MAIN_MODULE = '__init__.py'
 
@@ -55,6 +56,17 @@ def _get_last_modified_time(path):
     return max(os.path.getmtime(f) for f in all_files)
 
 
+def _overrides_load_data_files(skill):
+    """Check if a skill replaces MycroftSkill.load_data_files.
+
+    The loader loads dialogs while creating the instance and the rest of
+    the data files once it is bound to the bus. A skill's own
+    load_data_files() is instead called as a whole after binding.
+    """
+    method = getattr(type(skill), 'load_data_files', None)
+    return method is not MycroftSkill.load_data_files
+
+
 class SkillLoader:
     def __init__(self, bus, skill_directory):
         self.bus = bus
@@ -108,6 +120,20 @@ class SkillLoader:
         LOG.info('ATTEMPTING TO LOAD SKILL: ' + self.skill_id)
         self._load()
 
+    def prepare_load(self):
+        """First phase of load(), safe to run in parallel with other skills.
+
+        Imports the skill, creates the skill instance and parses its dialog
+        files without using the message bus. complete_load() must be called
+        afterwards to finish the load.
+        """
+        LOG.info('ATTEMPTING TO LOAD SKILL: ' + self.skill_id)
+        self._prepare_skill()
+
+    def complete_load(self):
+        """Second phase of load(), registers the skill with the bus."""
+        self._register_skill()
+
     def _unload(self):
         """Remove listeners and stop threads before loading"""
         self._execute_instance_shutdown()
@@ -159,14 +185,22 @@ class SkillLoader:
         self.bus.emit(message)
 
     def _load(self):
+        self._prepare_skill()
+        self._register_skill()
+
+    def _prepare_skill(self):
         self._prepare_for_load()
+        if not self.is_blacklisted:
+            skill_module = self._load_skill_source()
+            if skill_module:
+                self._create_skill_instance(skill_module)
+
+    def _register_skill(self):
         if self.is_blacklisted:
             self._skip_load()
-        else:
-            skill_module = self._load_skill_source()
-            if skill_module and self._create_skill_instance(skill_module):
-                self._check_for_first_run()
-                self.loaded = True
+        elif self.instance and self._initialize_skill_instance():
+            self._check_for_first_run()
+            self.loaded = True
 
         self.last_loaded = time()
         self._communicate_load_status()
@@ -221,23 +255,43 @@ class SkillLoader:
             self.instance.skill_id = self.skill_id
             self.instance.settings.allow_overwrite = True
             self.instance.settings.load_skill_settings_from_file()
-            self.instance.bind(self.bus)
             try:
-                self.instance.load_data_files()
-                # Set up intent handlers
-                # TODO: can this be a public method?
-                self.instance._register_decorated()
-                self.instance.register_resting_screen()
-                self.instance.initialize()
+                # Skills overriding load_data_files() load everything
+                # once bound to the bus
+                if not _overrides_load_data_files(self.instance):
+                    self.instance.init_dialog(self.instance.root_dir)
             except Exception as e:
-                # If an exception occurs, make sure to clean up the skill
-                self.instance.default_shutdown()
                 self.instance = None
-                log_msg = 'Skill initialization failed with {}'
+                log_msg = 'Loading dialogs failed with {}'
                 LOG.exception(log_msg.format(repr(e)))
 
         return self.instance is not None
 
+    def _initialize_skill_instance(self):
+        """Connect the skill instance to the bus and initialize it."""
+        self.instance.bind(self.bus)
+        try:
+            if _overrides_load_data_files(self.instance):
+                self.instance.load_data_files()
+            else:
+                # Dialogs were loaded with the instance
+                root_dir = self.instance.root_dir
+                self.instance.load_vocab_files(root_dir)
+                self.instance.load_regex_files(root_dir)
+            # Set up intent handlers
+            # TODO: can this be a public method?
+            self.instance._register_decorated()
+            self.instance.register_resting_screen()
+            self.instance.initialize()
+        except Exception as e:
+            # If an exception occurs, make sure to clean up the skill
+            self.instance.default_shutdown()
+            self.instance = None
+            log_msg = 'Skill initialization failed with {}'
+            LOG.exception(log_msg.format(repr(e)))
+
+        return self.instance is not None
+
     def _check_for_first_run(self):
         """The very first time a skill is run, speak the intro."""
         first_run = self.instance.settings.get(
@@ -14,6 +14,7 @@
 #
 """Load, update and manage skills on this device."""
 import os
+from concurrent.futures import ThreadPoolExecutor
 from glob import glob
 from threading import Thread, Event
 from time import sleep, time
@@ -25,10 +26,18 @@ from mycroft.util.log import LOG
 from .msm_wrapper import create_msm as msm_creator, build_msm_config
 from .skill_loader import SkillLoader
 from .skill_updater import SkillUpdater
+from .skill_watcher import SkillWatcher
 
 SKILL_MAIN_MODULE = '__init__.py'
 
 
+def _timed(func):
+    """Call func and return the number of seconds it took."""
+    start = time()
+    func()
+    return time() - start
+
+
 class SkillManager(Thread):
     _msm = None
 
@@ -43,11 +52,13 @@ class SkillManager(Thread):
         self._stop_event = Event()
         self._connected_event = Event()
         self.skill_loaders = {}
+        self.load_times = {}  # skill directory: seconds spent loading
         self.enclosure = EnclosureAPI(bus)
         self.initial_load_complete = False
         self.num_install_retries = 0
         self._define_message_bus_events()
         self.skill_updater = SkillUpdater()
+        self.skill_watcher = None
         self.daemon = True
 
         # Statuses
@@ -131,6 +142,7 @@ class SkillManager(Thread):
         """Load skills and update periodically from disk and internet."""
         self._remove_git_locks()
         self._connected_event.wait()
+        self._start_skill_watcher()
         self._load_on_startup()
 
         # Scan the file folder that contains Skills.  If a Skill is updated,
@@ -148,26 +160,126 @@ class SkillManager(Thread):
             LOG.warning('Found and removed git lock file: ' + i)
             os.remove(i)
 
+    def _start_skill_watcher(self):
+        """Watch the skills directory instead of polling for changes."""
+        delay = self.skills_config.get('reload_delay', 2)
+        self.skill_watcher = SkillWatcher(self.msm.skills_dir, delay)
+        if self.skill_watcher.start():
+            LOG.info('Watching {} for changes'.format(self.msm.skills_dir))
+
+    @property
+    def _watching_skills(self):
+        watcher = self.skill_watcher
+        return watcher is not None and watcher.is_watching
+
     def _load_on_startup(self):
-        """Handle initial skill load."""
+        """Handle initial skill load.
+
+        mycroft.skills.initialized is sent as soon as the critical skills
+        are loaded, the others keep loading after it.
+        """
         LOG.info('Loading installed skills...')
-        self._load_new_skills()
+        skill_dirs = self._get_new_skill_directories()
+        critical = self.skills_config.get('critical_skills')
+        if critical is None:
+            pending = set(skill_dirs)
+        else:
+            pending = set(d for d in skill_dirs
+                          if os.path.basename(d) in critical)
+        # Load the critical skills first
+        skill_dirs.sort(key=lambda d: d not in pending)
+
+        def skill_loaded(skill_dir):
+            pending.discard(skill_dir)
+            if not pending:
+                self._emit_initialized()
+
+        if not pending:
+            self._emit_initialized()
+        self._load_skills(skill_dirs, skill_loaded)
         LOG.info("Skills all loaded!")
-        self.bus.emit(Message('mycroft.skills.initialized'))
+        self._emit_initialized()
         self._loaded_status = True
+        self._log_load_times()
+
+    def _emit_initialized(self):
+        if not self.initial_load_complete:
+            self.initial_load_complete = True
+            self.bus.emit(Message('mycroft.skills.initialized'))
+
+    def _log_load_times(self):
+        load_times = sorted(self.load_times.items(),
+                            key=lambda item: item[1], reverse=True)
+        LOG.info('Skill load times: ' + ', '.join(
+            '{} {:.2f}s'.format(os.path.basename(skill_dir), seconds)
+            for skill_dir, seconds in load_times))
 
     def _reload_modified_skills(self):
-        """Handle reload of recently changed skill(s)"""
-        for skill_dir in self._get_skill_directories():
+        """Handle reload of recently changed skill(s)
+
+        When the skills directory is watched only the skills with modified
+        files are checked, otherwise all skills are.
+        """
+        if self._watching_skills:
+            skill_dirs = self.skill_watcher.pop_modified()
+        else:
+            skill_dirs = self._get_skill_directories()
+        for skill_dir in skill_dirs:
             skill_loader = self.skill_loaders.get(skill_dir)
             if skill_loader is not None and skill_loader.reload_needed():
                 skill_loader.reload()
 
     def _load_new_skills(self):
         """Handle load of skills installed since startup."""
-        for skill_dir in self._get_skill_directories():
-            if skill_dir not in self.skill_loaders:
+        self._load_skills(self._get_new_skill_directories())
+
+    def _get_new_skill_directories(self):
+        new_skill_dirs = [d for d in self._get_skill_directories()
+                          if d not in self.skill_loaders]
+        if self._watching_skills:
+            # Wait for skills being installed to be complete
+            new_skill_dirs = [d for d in new_skill_dirs
+                              if not self.skill_watcher.is_settling(d)]
+        return new_skill_dirs
+
+    def _load_skills(self, skill_directories, skill_loaded=None):
+        """Load skills, preparing them in parallel.
+
+        The skills are imported and their files parsed in a thread pool
+        while the registration with the message bus is done in this thread,
+        in the order of skill_directories.
+
+        Arguments:
+            skill_directories (list): directories of the skills to load
+            skill_loaded (callable): called with the directory of each skill
+                                     once it has been loaded
+        """
+        num_threads = self.skills_config.get('load_threads', 1)
+        if num_threads < 2 or len(skill_directories) < 2:
+            for skill_dir in skill_directories:
+                start = time()
                 self._load_skill(skill_dir)
+                self.load_times[skill_dir] = time() - start
+                if skill_loaded:
+                    skill_loaded(skill_dir)
+            return
+
+        loaders = [SkillLoader(self.bus, d) for d in skill_directories]
+        with ThreadPoolExecutor(max_workers=num_threads) as executor:
+            preparations = [executor.submit(_timed, loader.prepare_load)
+                            for loader in loaders]
+            for loader, preparation in zip(loaders, preparations):
+                skill_dir = loader.skill_directory
+                try:
+                    prepare_time = preparation.result()
+                    self.load_times[skill_dir] = (prepare_time +
+                                                  _timed(loader.complete_load))
+                except Exception:
+                    LOG.exception('Load of skill {} failed!'.format(skill_dir))
+                finally:
+                    self.skill_loaders[skill_dir] = loader
+                if skill_loaded:
+                    skill_loaded(skill_dir)
 
     def _load_skill(self, skill_directory):
         try:
@@ -284,6 +396,8 @@ class SkillManager(Thread):
     def stop(self):
         """Tell the manager to shutdown."""
         self._stop_event.set()
+        if self.skill_watcher:
+            self.skill_watcher.stop()
 
         # Do a clean shutdown of all skills
         for skill_loader in self.skill_loaders.values():
@@ -0,0 +1,139 @@
+# Copyright 2019 Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Watch the skills directory for modified skills."""
+import os
+from threading import Lock
+from time import monotonic
+
+from mycroft.util.log import LOG
+
+
+def is_ignored_file(path):
+    """Check if a change to the file should not trigger a skill reload.
+
+    Compiled python files, the settings.json file and hidden files and
+    directories are ignored.
+
+    Arguments:
+        path (str): path relative to the skill directory
+    """
+    parts = path.split(os.sep)
+    file_name = parts[-1]
+    return (
+        any(part.startswith('.') for part in parts) or
+        file_name.endswith('.pyc') or
+        file_name == 'settings.json' or
+        file_name.endswith('.qmlc')
+    )
+
+
+class SkillWatcher:
+    """Keep track of the skills modified on disk.
+
+    File system events are received through watchdog (inotify on Linux).
+    A skill is reported as modified once no file of it has changed for
+    delay seconds, so the many writes of a git pull result in one reload.
+
+    Arguments:
+        skills_dir (str): directory containing the skills
+        delay (float): seconds without changes before a skill is reported
+    """
+    def __init__(self, skills_dir, delay=2.0):
+        self.skills_dir = os.path.abspath(skills_dir)
+        self.delay = delay
+        self.observer = None
+        self._lock = Lock()
+        self._dirty = {}  # skill directory: time of the last change
+
+    @property
+    def is_watching(self):
+        return self.observer is not None
+
+    def start(self):
+        """Start watching the skills directory.
+
+        Returns:
+            bool: False if the file system can't be watched, the changes
+                  must be found by polling the skill directories instead.
+        """
+        try:
+            from watchdog.events import FileSystemEventHandler
+            from watchdog.observers import Observer
+        except ImportError:
+            LOG.info('watchdog not installed, polling skills for changes')
+            return False
+
+        watcher = self
+
+        class Handler(FileSystemEventHandler):
+            def on_any_event(self, event):
+                watcher.file_changed(event.src_path)
+                dest_path = getattr(event, 'dest_path', None)
+                if dest_path:
+                    watcher.file_changed(dest_path)
+
+        try:
+            observer = Observer()
+            observer.daemon = True
+            observer.schedule(Handler(), self.skills_dir, recursive=True)
+            observer.start()
+        except Exception as e:
+            LOG.warning('Can\'t watch the skills directory ({}), '
+                        'polling skills for changes'.format(repr(e)))
+            return False
+
+        self.observer = observer
+        return True
+
+    def stop(self):
+        if self.observer:
+            self.observer.stop()
+            self.observer = None
+
+    def file_changed(self, path):
+        """Register a change of a file in the skills directory.
+
+        Arguments:
+            path (str): path of the changed file
+        """
+        relative = os.path.relpath(os.path.abspath(path), self.skills_dir)
+        if relative.startswith(os.pardir):
+            return
+        parts = relative.split(os.sep, 1)
+        if len(parts) < 2 or is_ignored_file(parts[1]):
+            return  # Not a file within a skill
+        skill_dir = os.path.join(self.skills_dir, parts[0])
+        with self._lock:
+            self._dirty[skill_dir] = monotonic()
+
+    def pop_modified(self):
+        """Get the skills that were modified and have settled since.
+
+        Returns:
+            list: directories of the modified skills
+        """
+        now = monotonic()
+        with self._lock:
+            settled = [skill_dir for skill_dir, changed in self._dirty.items()
+                       if now - changed >= self.delay]
+            for skill_dir in settled:
+                del self._dirty[skill_dir]
+        return settled
+
+    def is_settling(self, skill_dir):
+        """Check if files of a skill have changed within the delay."""
+        with self._lock:
+            changed = self._dirty.get(skill_dir)
+        return changed is not None and monotonic() - changed < self.delay
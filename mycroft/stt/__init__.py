@@ -14,6 +14,7 @@
 #
 import re
 import json
+import struct
 from abc import ABCMeta, abstractmethod
 from requests import post, put, exceptions
 from speech_recognition import Recognizer
@@ -36,6 +37,26 @@ class STT(metaclass=ABCMeta):
         self.recognizer = Recognizer()
         self.can_stream = False
 
+    def stream_start(self, language=None):
+        """Start of an utterance, audio will be passed using stream_data.
+
+        Engines that can't make use of the audio before the utterance is
+        complete keep can_stream False and ignore the stream.
+        """
+        pass
+
+    def stream_data(self, data):
+        """Chunk of raw audio of the utterance being recorded."""
+        pass
+
+    def stream_stop(self):
+        """End of the streamed utterance.
+
+        Returns:
+            str: transcription of the streamed audio, None if not available
+        """
+        return None
+
     @staticmethod
     def init_language(config_core):
         lang = config_core.get("lang", "en-US")
@@ -168,23 +189,6 @@ class MycroftDeepSpeechSTT(STT):
         return self.api.stt(audio.get_wav_data(), self.lang, 1)
 
 
-class DeepSpeechServerSTT(STT):
-    """
-        STT interface for the deepspeech-server:
-        https://github.com/MainRo/deepspeech-server
-        use this if you want to host DeepSpeech yourself
-    """
-    def __init__(self):
-        super(DeepSpeechServerSTT, self).__init__()
-
-    def execute(self, audio, language=None):
-        language = language or self.lang
-        if not language.startswith("en"):
-            raise ValueError("Deepspeech is currently english only")
-        response = post(self.config.get("uri"), data=audio.get_wav_data())
-        return response.text
-
-
 class StreamThread(Thread, metaclass=ABCMeta):
     """
         ABC class to be used with StreamingSTT class implementations.
@@ -195,6 +199,7 @@ class StreamThread(Thread, metaclass=ABCMeta):
         self.language = language
         self.queue = queue
         self.text = None
+        self.error = None
 
     def _get_data(self):
         while True:
@@ -205,7 +210,11 @@ class StreamThread(Thread, metaclass=ABCMeta):
             self.queue.task_done()
 
     def run(self):
-        return self.handle_audio_stream(self._get_data(), self.language)
+        try:
+            return self.handle_audio_stream(self._get_data(), self.language)
+        except Exception as e:
+            LOG.error('Audio stream failed ({})'.format(repr(e)))
+            self.error = e
 
     @abstractmethod
     def handle_audio_stream(self, audio, language):
@@ -251,6 +260,111 @@ class StreamingSTT(STT, metaclass=ABCMeta):
         pass
 
 
+def wav_stream(chunks, sample_rate=16000, sample_width=2):
+    """Wrap raw mono PCM chunks in a wav header for streaming.
+
+    The total length isn't known in advance so the size fields are set to
+    the maximum value, as is usual for streamed wav data.
+
+    Arguments:
+        chunks (iterable): raw audio chunks
+        sample_rate (int): samples per second
+        sample_width (int): bytes per sample
+
+    Returns:
+        generator yielding the header followed by the chunks
+    """
+    unknown = 0xFFFFFFFF
+    yield struct.pack('<4sI4s4sIHHIIHH4sI',
+                      b'RIFF', unknown, b'WAVE', b'fmt ', 16, 1, 1,
+                      sample_rate, sample_rate * sample_width, sample_width,
+                      sample_width * 8, b'data', unknown)
+    yield from chunks
+
+
+class UploadStreamThread(StreamThread):
+    """Stream thread passing the audio to an upload function."""
+    def __init__(self, queue, language, upload):
+        super().__init__(queue, language)
+        self.upload = upload
+
+    def handle_audio_stream(self, audio, language):
+        self.text = self.upload(audio, language)
+        return self.text
+
+
+class StreamingUploadSTT(StreamingSTT, metaclass=ABCMeta):
+    """
+        Adapter streaming the audio to request based STT engines.
+
+        The audio is uploaded with chunked transfer encoding while the user
+        is still speaking, when the utterance ends only the last chunks and
+        the decoding remain. If streaming fails the complete audio is
+        transcribed afterwards.
+
+        Streaming can be disabled with "stream": false in the engine config.
+    """
+    def __init__(self):
+        super().__init__()
+        self.can_stream = self.config.get('stream', True)
+        listener = Configuration.get().get('listener', {})
+        self.sample_rate = listener.get('sample_rate', 16000)
+        self.sample_width = 2
+
+    def execute(self, audio, language=None):
+        if self.stream is not None:
+            stream = self.stream
+            text = self.stream_stop()
+            if stream.error is None:
+                return text
+        return self.transcribe(audio, language)
+
+    def create_streaming_thread(self):
+        self.queue = Queue()
+        return UploadStreamThread(self.queue, self.lang, self.upload_stream)
+
+    @abstractmethod
+    def upload_stream(self, chunks, language):
+        """Transcribe streamed raw audio chunks.
+
+        Arguments:
+            chunks (iterable): raw audio, exhausted at the end of speech
+            language (str): language of the utterance
+
+        Returns:
+            str: transcription
+        """
+        pass
+
+    @abstractmethod
+    def transcribe(self, audio, language=None):
+        """Transcribe recorded audio, as STT.execute."""
+        pass
+
+
+class DeepSpeechServerSTT(StreamingUploadSTT):
+    """
+        STT interface for the deepspeech-server:
+        https://github.com/MainRo/deepspeech-server
+        use this if you want to host DeepSpeech yourself
+    """
+    def transcribe(self, audio, language=None):
+        language = language or self.lang
+        if not language.startswith("en"):
+            raise ValueError("Deepspeech is currently english only")
+        response = post(self.config.get("uri"), data=audio.get_wav_data())
+        return response.text
+
+    def upload_stream(self, chunks, language):
+        if not language.startswith("en"):
+            raise ValueError("Deepspeech is currently english only")
+        response = post(self.config.get("uri"),
+                        data=wav_stream(chunks, self.sample_rate,
+                                        self.sample_width))
+        response.raise_for_status()
+        return response.text
+
+
 class DeepSpeechStreamThread(StreamThread):
     def __init__(self, queue, language, url):
         if not language.startswith("en"):
@@ -354,15 +468,22 @@ class GoogleCloudStreamingSTT(StreamingSTT):
         )
 
 
-class KaldiSTT(STT):
+class KaldiSTT(StreamingUploadSTT):
     def __init__(self):
         super(KaldiSTT, self).__init__()
 
-    def execute(self, audio, language=None):
+    def transcribe(self, audio, language=None):
         language = language or self.lang
         response = post(self.config.get("uri"), data=audio.get_wav_data())
         return self.get_response(response)
 
+    def upload_stream(self, chunks, language):
+        response = post(self.config.get("uri"),
+                        data=wav_stream(chunks, self.sample_rate,
+                                        self.sample_width))
+        response.raise_for_status()
+        return self.get_response(response)
+
     def get_response(self, response):
         try:
             hypotheses = response.json()["hypotheses"]
@@ -26,6 +26,7 @@ from os.path import dirname, exists, isdir, join
 
 import mycroft.util
 from mycroft.enclosure.api import EnclosureAPI
+from mycroft.audio.sink import AudioSink
 from mycroft.configuration import Configuration
 from mycroft.messagebus.message import Message
 from mycroft.metrics import report_timing, Stopwatch
@@ -35,6 +36,8 @@ from mycroft.util import (
 from mycroft.util.log import LOG
 from queue import Queue, Empty
 
+from .cache import TTSCache
+
 
 _TTS_ENV = deepcopy(os.environ)
 _TTS_ENV['PULSE_PROP'] = 'media.role=phone'
@@ -61,11 +64,22 @@ class PlaybackThread(Thread):
         self.queue = queue
         self._terminated = False
         self._processing_queue = False
+        tts_config = Configuration.get().get('tts', {})
         # Check if the tts shall have a ducking role set
-        if Configuration.get().get('tts', {}).get('pulse_duck'):
+        if tts_config.get('pulse_duck'):
             self.pulse_env = _TTS_ENV
         else:
             self.pulse_env = None
+        # Stream wav audio to a persistent output unless the player
+        # processes are needed to set the ducking role
+        playback_config = tts_config.get('playback', {})
+        if (playback_config.get('mode') == 'stream' and
+                not self.pulse_env):
+            self.sink = AudioSink(
+                playback_config.get('device_index'),
+                playback_config.get('frames_per_buffer', 1024))
+        else:
+            self.sink = None
 
     def init(self, tts):
         self.tts = tts
@@ -74,6 +88,9 @@ class PlaybackThread(Thread):
         """Remove all pending playbacks."""
         while not self.queue.empty():
             self.queue.get()
+        sink = self.sink
+        if sink:
+            sink.stop()
         try:
             self.p.terminate()
         except Exception:
@@ -91,18 +108,12 @@ class PlaybackThread(Thread):
 
                 stopwatch = Stopwatch()
                 with stopwatch:
-                    if snd_type == 'wav':
-                        self.p = play_wav(data, environment=self.pulse_env)
-                    elif snd_type == 'mp3':
-                        self.p = play_mp3(data, environment=self.pulse_env)
-
-                    if visemes:
-                        self.show_visemes(visemes)
-                    self.p.communicate()
-                    self.p.wait()
+                    self.play(snd_type, data, visemes)
                 send_playback_metric(stopwatch, ident)
 
                 if self.queue.empty():
+                    if self.sink:
+                        self.sink.drain()
                     self.tts.end_audio()
                     self._processing_queue = False
                 self.blink(0.2)
@@ -111,8 +122,46 @@ class PlaybackThread(Thread):
             except Exception as e:
                 LOG.exception(e)
                 if self._processing_queue:
+                    if self.sink:
+                        self.sink.drain()
                     self.tts.end_audio()
                     self._processing_queue = False
+        if self.sink:
+            self.sink.close()
+
+    def play(self, snd_type, data, visemes):
+        """Play an audio file and show its visemes.
+
+        wav files are streamed to the audio sink, the play commands of the
+        configuration are used for other files or if streaming fails.
+
+        Arguments:
+            snd_type (str): 'wav' or 'mp3'
+            data (str): path of the audio file
+            visemes (list): viseme and timing pairs, may be None
+        """
+        if snd_type == 'wav' and self.sink:
+            if visemes:
+                self.show_visemes(visemes)
+            try:
+                if self.sink.play_wav(data):
+                    return
+            except OSError:
+                # Don't retry a failing device for every sentence
+                self.sink.close()
+                self.sink = None
+                raise
+            visemes = None  # Already shown
+
+        if snd_type == 'wav':
+            self.p = play_wav(data, environment=self.pulse_env)
+        elif snd_type == 'mp3':
+            self.p = play_mp3(data, environment=self.pulse_env)
+
+        if visemes:
+            self.show_visemes(visemes)
+        self.p.communicate()
+        self.p.wait()
 
     def show_visemes(self, pairs):
         """Send viseme data to enclosure
@@ -172,9 +221,19 @@ class TTS(metaclass=ABCMeta):
         self.queue = Queue()
         self.playback = PlaybackThread(self.queue)
         self.playback.start()
+        self.tts_name = type(self).__name__
+        self.cache = self._create_cache()
         self.clear_cache()
         self.spellings = self.load_spellings()
-        self.tts_name = type(self).__name__
+
+    def _create_cache(self):
+        """Create the audio cache index from the tts cache config."""
+        config = Configuration.get().get('tts', {}).get('cache', {})
+        return TTSCache(self.tts_name,
+                        max_size=config.get('max_size', 0) * 1024 * 1024,
+                        policy=config.get('policy', 'lru'),
+                        min_free_percent=config.get('min_free_percent', 100),
+                        min_free_disk=config.get('min_free_disk', 50))
 
     def load_spellings(self):
         """Load phonetic spellings of words as dictionary"""
@@ -206,8 +265,7 @@ class TTS(metaclass=ABCMeta):
 
         self.bus.emit(Message("recognizer_loop:audio_output_end"))
         # Clean the cache as needed
-        cache_dir = mycroft.util.get_cache_directory("tts/" + self.tts_name)
-        mycroft.util.curate_cache(cache_dir, min_free_percent=100)
+        self.cache.curate()
 
         # This check will clear the "signal"
         check_for_signal("isSpeaking")
@@ -222,6 +280,11 @@ class TTS(metaclass=ABCMeta):
         self.playback.init(self)
         self.enclosure = EnclosureAPI(self.bus)
         self.playback.enclosure = self.enclosure
+        self.bus.on('mycroft.tts.cache.stats', self.handle_cache_stats)
+
+    def handle_cache_stats(self, message):
+        """Reply with the hit/miss statistics of the audio cache."""
+        self.bus.emit(message.response(self.cache.stats()))
 
     def get_tts(self, sentence, wav_file):
         """Abstract method that a tts implementation needs to implement.
@@ -297,9 +360,26 @@ class TTS(metaclass=ABCMeta):
                 sentence:   Sentence to be spoken
                 ident:      Id reference to current interaction
         """
+        create_signal("isSpeaking")
+        for audio_ext, wav_file, vis in self.synthesize(sentence):
+            self.queue.put((audio_ext, wav_file, vis, ident))
+
+    def synthesize(self, sentence):
+        """Synthesize a sentence without queueing it for playback.
+
+        Performs the preprocessing and cache handling of execute(). This
+        allows the audio for upcoming sentences to be prepared while the
+        current one is playing.
+
+        Arguments:
+            sentence (str): Sentence to synthesize
+
+        Returns:
+            generator yielding (audio_ext, audio_file, visemes) for each
+            part of the sentence, in playback order.
+        """
         sentence = self.validate_ssml(sentence)
 
-        create_signal("isSpeaking")
         if self.phonetic_spelling:
             for word in re.findall(r"[\w']+", sentence):
                 if word.lower() in self.spellings:
@@ -310,20 +390,31 @@ class TTS(metaclass=ABCMeta):
         for sentence in chunks:
             key = str(hashlib.md5(
                 sentence.encode('utf-8', 'ignore')).hexdigest())
-            wav_file = os.path.join(
-                mycroft.util.get_cache_directory("tts/" + self.tts_name),
-                key + '.' + self.audio_ext)
-
-            if os.path.exists(wav_file):
+            cached = self.cache.get(key)
+            if cached:
                 LOG.debug("TTS cache hit")
-                phonemes = self.load_phonemes(key)
+                wav_file = cached.audio_file
+                if cached.phonemes is None and cached.has_phonemes:
+                    cached.phonemes = self.load_phonemes(key)
+                phonemes = cached.phonemes
             else:
+                wav_file = self.cache.audio_file(key, self.audio_ext)
                 wav_file, phonemes = self.get_tts(sentence, wav_file)
                 if phonemes:
                     self.save_phonemes(key, phonemes)
+                self.cache.add(key, wav_file, phonemes)
 
             vis = self.viseme(phonemes) if phonemes else None
-            self.queue.put((self.audio_ext, wav_file, vis, ident))
+            yield self.audio_ext, wav_file, vis
+
+    @property
+    def can_synthesize(self):
+        """True if the engine produces audio through synthesize().
+
+        Engines overriding execute() to play audio directly can't be used
+        to prepare audio ahead of playback.
+        """
+        return type(self).execute is TTS.execute
 
     def viseme(self, phonemes):
         """Create visemes from phonemes. Needs to be implemented for all
@@ -336,6 +427,8 @@ class TTS(metaclass=ABCMeta):
 
     def clear_cache(self):
         """Remove all cached files."""
+        # Don't return the deleted files from the index
+        self.cache.clear()
         if not os.path.exists(mycroft.util.get_cache_directory('tts')):
             return
         for d in os.listdir(mycroft.util.get_cache_directory("tts")):
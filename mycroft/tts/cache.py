@@ -0,0 +1,235 @@
+# Copyright 2019 Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""In memory index of the synthesized audio cached on disk.
+
+Each TTS engine has its own cache namespace (directory). The directory is
+scanned once on first use, after that lookups never touch the disk: a cache
+hit returns the audio path and the phonemes kept in memory.
+
+The cache is kept within a byte budget by evicting entries, either the least
+recently used (lru) or the least frequently used (lfu) ones. Entries are also
+evicted when the disk is running out of space.
+"""
+import os
+from collections import OrderedDict
+from stat import S_ISREG
+from threading import Lock
+from time import time
+
+import psutil
+
+import mycroft.util
+from mycroft.util.log import LOG
+
+PHONEME_EXT = '.pho'
+
+
+class CacheEntry:
+    """Cached audio file and associated data.
+
+    Attributes:
+        audio_file (str): path to the cached audio
+        size (int): size in bytes of the audio file
+        phonemes: phonemes for the audio, None if not loaded or missing
+        has_phonemes (bool): True if a phoneme file exists for the entry
+        last_access (float): unix time of last access
+        hits (int): number of times the entry has been used
+    """
+    __slots__ = ('audio_file', 'size', 'phonemes', 'has_phonemes',
+                 'last_access', 'hits')
+
+    def __init__(self, audio_file, size, phonemes=None, has_phonemes=False):
+        self.audio_file = audio_file
+        self.size = size
+        self.phonemes = phonemes
+        self.has_phonemes = has_phonemes or phonemes is not None
+        self.last_access = time()
+        self.hits = 0
+
+
+class TTSCache:
+    """Index of the cached audio of a TTS engine.
+
+    Arguments:
+        namespace (str): name of the cache, usually the TTS engine name
+        max_size (int): byte budget for the cache, 0 for no limit
+        policy (str): eviction policy, "lru" or "lfu"
+        min_free_percent (float): evict when the disk has less free space
+        min_free_disk (float): ... and less than this many MB free
+    """
+    def __init__(self, namespace, max_size=0, policy='lru',
+                 min_free_percent=100, min_free_disk=50):
+        self.namespace = namespace
+        self.max_size = max_size
+        self.policy = policy
+        self.min_free_percent = min_free_percent
+        self.min_free_disk = min_free_disk * 1024 * 1024
+        self.entries = OrderedDict()  # key -> CacheEntry, oldest use first
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._directory = None
+        self._lock = Lock()
+
+    @property
+    def directory(self):
+        """Cache directory, the index is built on first access."""
+        if self._directory is None:
+            self._directory = mycroft.util.get_cache_directory(
+                'tts/' + self.namespace)
+            self._scan()
+        return self._directory
+
+    def _scan(self):
+        """Index the files already present in the cache directory."""
+        phoneme_keys = set()
+        audio_files = []
+        for name in os.listdir(self._directory):
+            path = os.path.join(self._directory, name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue  # Removed meanwhile
+            if not S_ISREG(stat.st_mode):
+                continue
+            key, ext = os.path.splitext(name)
+            if ext == PHONEME_EXT:
+                phoneme_keys.add(key)
+            else:
+                audio_files.append((stat.st_mtime, key, path, stat.st_size))
+        # Oldest files are the first candidates for eviction
+        for _, key, path, size in sorted(audio_files):
+            entry = CacheEntry(path, size, has_phonemes=key in phoneme_keys)
+            self.entries[key] = entry
+            self.size += size
+
+    def audio_file(self, key, ext):
+        """Path to store the audio for a key in."""
+        return os.path.join(self.directory, key + '.' + ext)
+
+    def phoneme_file(self, key):
+        """Path to store the phonemes for a key in."""
+        return os.path.join(self.directory, key + PHONEME_EXT)
+
+    def get(self, key):
+        """Look up a cached entry.
+
+        Arguments:
+            key (str): cache key of the sentence
+
+        Returns:
+            CacheEntry or None if the key isn't cached
+        """
+        self.directory  # Make sure the index is built
+        with self._lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            entry.hits += 1
+            entry.last_access = time()
+            self.entries.move_to_end(key)
+            return entry
+
+    def add(self, key, audio_file, phonemes=None):
+        """Add newly synthesized audio to the cache.
+
+        Arguments:
+            key (str): cache key of the sentence
+            audio_file (str): path to the audio
+            phonemes: phonemes for the audio if available
+        """
+        try:
+            size = os.path.getsize(audio_file)
+        except OSError:
+            LOG.warning('Cached audio {} not found'.format(audio_file))
+            return
+        self.directory  # Make sure the index is built
+        with self._lock:
+            old = self.entries.pop(key, None)
+            if old:
+                self.size -= old.size
+            self.entries[key] = CacheEntry(audio_file, size, phonemes)
+            self.size += size
+            if self.max_size:
+                while self.size > self.max_size and len(self.entries) > 1:
+                    self._evict(keep=key)
+
+    def curate(self):
+        """Evict entries if the disk is running low on space."""
+        if not self.entries:
+            return
+        space = psutil.disk_usage(self.directory)
+        percent_free = 100.0 - space.percent
+        if (percent_free < self.min_free_percent and
+                space.free < self.min_free_disk):
+            LOG.info('Low diskspace detected, cleaning TTS cache')
+            bytes_needed = self.min_free_disk - space.free
+            with self._lock:
+                freed = 0
+                while freed < bytes_needed and self.entries:
+                    freed += self._evict()
+
+    def clear(self):
+        """Forget all entries, the files are removed by the caller."""
+        with self._lock:
+            self.entries.clear()
+            self.size = 0
+
+    def stats(self):
+        """Get cache statistics.
+
+        Returns:
+            dict: hits, misses, evictions, entries, size and max_size
+        """
+        return {'namespace': self.namespace,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'entries': len(self.entries),
+                'size': self.size,
+                'max_size': self.max_size}
+
+    def _evict(self, keep=None):
+        """Remove one entry according to the policy, called with the lock
+        held.
+
+        Arguments:
+            keep (str): key that must not be evicted
+
+        Returns:
+            int: number of bytes freed
+        """
+        if self.policy == 'lfu':
+            # entries are ordered on last access, min() picks the least
+            # recently used of the least frequently used entries.
+            key = min((k for k in self.entries if k != keep),
+                      key=lambda k: self.entries[k].hits)
+            entry = self.entries.pop(key)
+        else:
+            key, entry = self.entries.popitem(last=False)
+        self.size -= entry.size
+        self.evictions += 1
+        files = [entry.audio_file]
+        if entry.has_phonemes:
+            files.append(self.phoneme_file(key))
+        for path in files:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+        return entry.size
@@ -22,29 +22,8 @@ and allow localization.
 """
 from os.path import join
 
-from mycroft.util.lang import get_full_lang_code, get_primary_lang_code
-
-from mycroft.util.lang.format_en import *
-from mycroft.util.lang.format_pt import *
-from mycroft.util.lang.format_it import *
-from mycroft.util.lang.format_sv import *
-from mycroft.util.lang.format_hu import *
-
-from mycroft.util.lang.format_es import nice_number_es
-from mycroft.util.lang.format_es import nice_time_es
-from mycroft.util.lang.format_es import pronounce_number_es
-from mycroft.util.lang.format_de import nice_number_de
-from mycroft.util.lang.format_de import nice_time_de
-from mycroft.util.lang.format_de import pronounce_number_de
-from mycroft.util.lang.format_fr import nice_number_fr
-from mycroft.util.lang.format_fr import nice_time_fr
-from mycroft.util.lang.format_fr import pronounce_number_fr
-from mycroft.util.lang.format_nl import nice_time_nl
-from mycroft.util.lang.format_nl import pronounce_number_nl
-from mycroft.util.lang.format_nl import nice_number_nl
-from mycroft.util.lang.format_da import nice_number_da
-from mycroft.util.lang.format_da import nice_time_da
-from mycroft.util.lang.format_da import pronounce_number_da
+from mycroft.util.lang import get_full_lang_code, get_primary_lang_code, \
+    LanguageFunctions
 
 from collections import namedtuple
 from padatious.util import expand_parentheses
@@ -52,6 +31,26 @@ import json
 import os
 import datetime
 import re
+import sys
+
+# Language modules are imported on first use, see LanguageFunctions
+_functions = LanguageFunctions('format', ['en', 'es', 'pt', 'it', 'fr', 'sv',
+                                          'de', 'hu', 'nl', 'da'])
+
+
+def __getattr__(name):
+    """ Resolve language specific functions such as nice_number_en.
+
+    These used to be imported into this module, keep them available
+    without importing every language up front. Python < 3.7 doesn't call
+    a module __getattr__ (PEP 562), the functions are imported at the end
+    of this module there.
+    """
+    function = _functions.lookup(name)
+    if function is None:
+        raise AttributeError("module {!r} has no attribute {!r}".format(
+            __name__, name))
+    return function
 
 
 def _translate_word(name, lang):
@@ -265,28 +264,9 @@ def nice_number(number, lang=None, speech=True, denominators=None):
     """
     # Convert to spoken representation in appropriate language
     lang_code = get_primary_lang_code(lang)
-    if lang_code == "en":
-        return nice_number_en(number, speech, denominators)
-    elif lang_code == "es":
-        return nice_number_es(number, speech, denominators)
-    elif lang_code == "pt":
-        return nice_number_pt(number, speech, denominators)
-    elif lang_code == "it":
-        return nice_number_it(number, speech, denominators)
-    elif lang_code == "fr":
-        return nice_number_fr(number, speech, denominators)
-    elif lang_code == "sv":
-        return nice_number_sv(number, speech, denominators)
-    elif lang_code == "de":
-        return nice_number_de(number, speech, denominators)
-    elif lang_code == "hu":
-        return nice_number_hu(number, speech, denominators)
-    elif lang_code == "nl":
-        return nice_number_nl(number, speech, denominators)
-    elif lang_code == "da":
-        return nice_number_da(number, speech, denominators)
-    elif lang_code == "sv":
-        return nice_number_sv(number, speech, denominators)
+    format_number = _functions.get('nice_number', lang_code)
+    if format_number:
+        return format_number(number, speech, denominators)
 
     # Default to the raw number for unsupported languages,
     # hopefully the STT engine will pronounce understandably.
@@ -311,26 +291,9 @@ def nice_time(dt, lang=None, speech=True, use_24hour=False,
         (str): The formatted time string
     """
     lang_code = get_primary_lang_code(lang)
-    if lang_code == "en":
-        return nice_time_en(dt, speech, use_24hour, use_ampm)
-    elif lang_code == "es":
-        return nice_time_es(dt, speech, use_24hour, use_ampm)
-    elif lang_code == "it":
-        return nice_time_it(dt, speech, use_24hour, use_ampm)
-    elif lang_code == "fr":
-        return nice_time_fr(dt, speech, use_24hour, use_ampm)
-    elif lang_code == "de":
-        return nice_time_de(dt, speech, use_24hour, use_ampm)
-    elif lang_code == "hu":
-        return nice_time_hu(dt, speech, use_24hour, use_ampm)
-    elif lang_code == "nl":
-        return nice_time_nl(dt, speech, use_24hour, use_ampm)
-    elif lang_code == "da":
-        return nice_time_da(dt, speech, use_24hour, use_ampm)
-    elif lang_code == "pt":
-        return nice_time_pt(dt, speech, use_24hour, use_ampm)
-    elif lang_code == "sv":
-        return nice_time_sv(dt, speech, use_24hour, use_ampm)
+    format_time = _functions.get('nice_time', lang_code)
+    if format_time:
+        return format_time(dt, speech, use_24hour, use_ampm)
 
     # TODO: Other languages
     return str(dt)
@@ -352,30 +315,12 @@ def pronounce_number(number, lang=None, places=2, short_scale=True,
         (str): The pronounced number
     """
     lang_code = get_primary_lang_code(lang)
-    if lang_code == "en":
-        return pronounce_number_en(number, places=places,
-                                   short_scale=short_scale,
-                                   scientific=scientific)
-    elif lang_code == "it":
-        return pronounce_number_it(number, places=places,
-                                   short_scale=short_scale,
-                                   scientific=scientific)
-    elif lang_code == "es":
-        return pronounce_number_es(number, places=places)
-    elif lang_code == "fr":
-        return pronounce_number_fr(number, places=places)
-    elif lang_code == "de":
-        return pronounce_number_de(number, places=places)
-    elif lang_code == "hu":
-        return pronounce_number_hu(number, places=places)
-    elif lang_code == "nl":
-        return pronounce_number_nl(number, places=places)
-    elif lang_code == "da":
-        return pronounce_number_da(number, places=places)
-    elif lang_code == "pt":
-        return pronounce_number_pt(number, places=places)
-    elif lang_code == "sv":
-        return pronounce_number_sv(number, places=places)
+    pronounce = _functions.get('pronounce_number', lang_code)
+    if lang_code in ("en", "it"):
+        return pronounce(number, places=places, short_scale=short_scale,
+                         scientific=scientific)
+    elif pronounce:
+        return pronounce(number, places=places)
 
     # Default to just returning the numeric value
     return str(number)
@@ -571,3 +516,9 @@ def expand_options(parentheses_line: str) -> list:
     # 'a(this|that)b' -> [['a', 'this', 'b'], ['a', 'that', 'b']]
     options = expand_parentheses(re.split(r'([(|)])', parentheses_line))
     return [re.sub(r'\s+', ' ', ' '.join(i)).strip() for i in options]
+
+
+if sys.version_info < (3, 7):
+    # Module names take precedence, like they did over the star imports
+    for _name, _function in _functions.all_functions().items():
+        globals().setdefault(_name, _function)
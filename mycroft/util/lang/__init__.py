@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
+from importlib import import_module
 
 __active_lang = "en-us"  # English is the default active language
 # TODO: Should this really be stored in the user config file?
@@ -68,3 +69,69 @@ def get_full_lang_code(lang=None):
         lang = __active_lang
 
     return lang or "en-us"
+
+
+class LanguageFunctions:
+    """ Language specific functions, imported on first use of a language
+
+    The functions of a language are named <name>_<lang code> and live in
+    the module mycroft.util.lang.<prefix>_<lang code>, e.g. extract_datetime
+    for "de" is extract_datetime_de in mycroft.util.lang.parse_de. A
+    language module is only imported the first time one of its functions
+    is requested.
+
+    Args:
+        prefix (str): module name prefix, e.g. "parse" or "format"
+        languages (list): primary language codes having a module
+    """
+    def __init__(self, prefix, languages):
+        self.prefix = prefix
+        self.languages = list(languages)
+        self._functions = {}  # (name, lang code): function or None
+
+    def get(self, name, lang_code):
+        """ Get the implementation of a function for a language
+
+        Args:
+            name (str): function name without language suffix
+            lang_code (str): primary language code, e.g. "en"
+
+        Returns:
+            function, None if the language doesn't implement the function
+        """
+        try:
+            return self._functions[(name, lang_code)]
+        except KeyError:
+            function = None
+            if lang_code in self.languages:
+                module = import_module('mycroft.util.lang.{}_{}'.format(
+                    self.prefix, lang_code))
+                function = getattr(module, name + '_' + lang_code, None)
+            self._functions[(name, lang_code)] = function
+            return function
+
+    def lookup(self, full_name):
+        """ Get a function by its full name, e.g. "normalize_en"
+
+        Returns:
+            function, None if there is no function by that name
+        """
+        name, _, lang_code = full_name.rpartition('_')
+        return self.get(name, lang_code) if name else None
+
+    def all_functions(self):
+        """ Import every language module and get its functions
+
+        Returns:
+            dict: full name (e.g. "normalize_en"): function
+        """
+        functions = {}
+        for lang_code in self.languages:
+            module = import_module('mycroft.util.lang.{}_{}'.format(
+                self.prefix, lang_code))
+            suffix = '_' + lang_code
+            functions.update((name, value)
+                             for name, value in vars(module).items()
+                             if name.endswith(suffix) and
+                             not name.startswith('_'))
+        return functions
@@ -16,6 +16,50 @@
 #
 
 
+class Normalizer:
+    """
+        Word by word string normalization driven by lookup tables.
+
+        The replacement tables are composed into a single table when the
+        normalizer is created, so normalizing a string is a single pass
+        over its words with one lookup per word.
+
+    Args:
+        replacements (list): dicts of word: replacement, applied in order
+                             so a replacement may be replaced again by a
+                             later table
+        articles (iterable): words dropped when removing articles, checked
+                             before any replacement
+    """
+    def __init__(self, replacements=(), articles=()):
+        self.articles = frozenset(articles)
+        self.table = {}
+        for table in replacements:
+            for word in table:
+                if word not in self.table:
+                    result = word
+                    for replacement in replacements:
+                        result = replacement.get(result, result)
+                    self.table[word] = result
+
+    def normalize(self, text, remove_articles):
+        """
+            Normalize the words of a string.
+
+        Args:
+            text (str): the string to normalize
+            remove_articles (bool): whether to remove articles
+        Returns:
+            (str): the words after replacement, separated by single spaces
+        """
+        words = text.split()  # this also removed extra spaces
+        if remove_articles and self.articles:
+            articles = self.articles
+            words = [word for word in words if word not in articles]
+        table = self.table
+        return " ".join([table.get(word, word) for word in words])
+
+
 def is_numeric(input_str):
     """
     Takes in a string and tests to see if it is a number.
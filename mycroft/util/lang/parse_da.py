@@ -17,7 +17,7 @@
 from datetime import datetime
 from dateutil.relativedelta import relativedelta
 from mycroft.util.lang.parse_common import is_numeric, look_for_fractions, \
-    extract_numbers_generic
+    extract_numbers_generic, Normalizer
 from mycroft.util.lang.format_da import pronounce_number_da
 
 da_numbers = {
@@ -73,6 +73,11 @@ da_numbers = {
     'million': 1000000
 }
 
+# Convert numbers into digits, e.g. "to" -> "2"
+_NORMALIZER_DA = Normalizer(
+    [{word: str(number) for word, number in da_numbers.items()}],
+    articles=["den", "det"])
+
 
 def extractnumber_da(text):
     """
@@ -898,21 +903,7 @@ def isOrdinal_da(input_str):
 
 def normalize_da(text, remove_articles):
     """ German string normalization """
-
-    words = text.split()  # this also removed extra spaces
-    normalized = ""
-    for word in words:
-        if remove_articles and word in ["den", "det"]:
-            continue
-
-        # Convert numbers into digits, e.g. "two" -> "2"
-
-        if word in da_numbers:
-            word = str(da_numbers[word])
-
-        normalized += " " + word
-
-    return normalized[1:]  # strip the initial space
+    return _NORMALIZER_DA.normalize(text, remove_articles)
 
 
 def extract_numbers_da(text, short_scale=True, ordinals=False):
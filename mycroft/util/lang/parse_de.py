@@ -17,7 +17,7 @@
 from datetime import datetime
 from dateutil.relativedelta import relativedelta
 from mycroft.util.lang.parse_common import is_numeric, look_for_fractions, \
-    extract_numbers_generic
+    extract_numbers_generic, Normalizer
 from mycroft.util.lang.format_de import pronounce_number_de
 
 de_numbers = {
@@ -78,6 +78,13 @@ de_numbers = {
     'million': 1000000
 }
 
+# Expand common contractions and convert numbers into digits, e.g.
+# "net" -> "nicht", "zwei" -> "2"
+_NORMALIZER_DE = Normalizer(
+    [{"net": "nicht", "nett": "nicht"},
+     {word: str(number) for word, number in de_numbers.items()}],
+    articles=["der", "die", "das", "des", "den", "dem"])
+
 
 def extractnumber_de(text):
     """
@@ -909,28 +916,7 @@ def isOrdinal_de(input_str):
 
 def normalize_de(text, remove_articles):
     """ German string normalization """
-
-    words = text.split()  # this also removed extra spaces
-    normalized = ""
-    for word in words:
-        if remove_articles and word in ["der", "die", "das", "des", "den",
-                                        "dem"]:
-            continue
-
-        # Expand common contractions, e.g. "isn't" -> "is not"
-        contraction = ["net", "nett"]
-        if word in contraction:
-            expansion = ["nicht", "nicht"]
-            word = expansion[contraction.index(word)]
-
-        # Convert numbers into digits, e.g. "two" -> "2"
-
-        if word in de_numbers:
-            word = str(de_numbers[word])
-
-        normalized += " " + word
-
-    return normalized[1:]  # strip the initial space
+    return _NORMALIZER_DE.normalize(text, remove_articles)
 
 
 def extract_numbers_de(text, short_scale=True, ordinals=False):
@@ -19,10 +19,11 @@ from datetime import datetime, timedelta
 
 from dateutil.relativedelta import relativedelta
 
-from mycroft.util.lang.parse_common import is_numeric, look_for_fractions
+from mycroft.util.lang.parse_common import is_numeric, look_for_fractions, \
+    Normalizer
 from mycroft.util.lang.common_data_en import _ARTICLES, _NUM_STRING_EN, \
     _LONG_ORDINAL_STRING_EN, _LONG_SCALE_EN, \
-    _SHORT_SCALE_EN, _SHORT_ORDINAL_STRING_EN
+    _SHORT_SCALE_EN, _SHORT_ORDINAL_STRING_EN, _CONTRACTIONS_EN
 
 import re
 
@@ -91,6 +92,73 @@ _STRING_SHORT_ORDINAL_EN = _invert_dict(_SHORT_ORDINAL_STRING_EN)
 _STRING_LONG_ORDINAL_EN = _invert_dict(_LONG_ORDINAL_STRING_EN)
 
 
+def _build_number_data(multiplies, string_num_ordinal, scale):
+    string_num_scale = _invert_dict(scale)
+    string_num_scale.update(_generate_plurals(string_num_scale))
+    return multiplies, string_num_ordinal, string_num_scale
+
+
+# (multiplies, string_num_ordinal, string_num_scale) per scale, shared by
+# all calls instead of being rebuilt by _initialize_number_data every time
+_NUMBER_DATA_SHORT_SCALE_EN = _build_number_data(
+    _MULTIPLIES_SHORT_SCALE_EN, _STRING_SHORT_ORDINAL_EN, _SHORT_SCALE_EN)
+_NUMBER_DATA_LONG_SCALE_EN = _build_number_data(
+    _MULTIPLIES_LONG_SCALE_EN, _STRING_LONG_ORDINAL_EN, _LONG_SCALE_EN)
+
+
+def _build_fractions(ordinal_string):
+    fractions = {"whole": 1, "half": 2, "halve": 2, "quarter": 4}
+    fractions.update((word, num) for num, word in ordinal_string.items()
+                     if num > 2)
+    return fractions
+
+
+# fraction word -> denominator, used by isFractional_en
+_FRACTIONS_SHORT_SCALE_EN = _build_fractions(_SHORT_ORDINAL_STRING_EN)
+_FRACTIONS_LONG_SCALE_EN = _build_fractions(_LONG_ORDINAL_STRING_EN)
+
+# Expand contractions and convert numbers up to twenty into digits, e.g.
+# "isn't" -> "is not", "two" -> "2"
+_NORMALIZER_EN = Normalizer(
+    [_CONTRACTIONS_EN, {_NUM_STRING_EN[n]: str(n) for n in range(21)}],
+    articles=_ARTICLES)
+
+# Keyword tables of extract_datetime_en, built once instead of on every call
+_TIME_QUALIFIERS_AM_EN = frozenset(['morning'])
+_TIME_QUALIFIERS_PM_EN = frozenset(['afternoon', 'evening', 'night',
+                                    'tonight'])
+_TIME_QUALIFIERS_EN = _TIME_QUALIFIERS_AM_EN | _TIME_QUALIFIERS_PM_EN
+_DATE_MARKERS_EN = frozenset(['at', 'in', 'on', 'by', 'this', 'around', 'for',
+                              'of', 'within'])
+_WEEKDAYS_EN = ['monday', 'tuesday', 'wednesday', 'thursday', 'friday',
+                'saturday', 'sunday']
+_MONTHS_EN = ['january', 'february', 'march', 'april', 'may', 'june', 'july',
+              'august', 'september', 'october', 'november', 'december']
+_MONTHS_SHORT_EN = ['jan', 'feb', 'mar', 'apr', 'may', 'june', 'july', 'aug',
+                    'sept', 'oct', 'nov', 'dec']
+# weekday -> number of the day, 1 = monday
+_WEEKDAY_NUMBERS_EN = {day: idx + 1 for idx, day in enumerate(_WEEKDAYS_EN)}
+# month or abbreviation -> month name
+_MONTH_NAMES_EN = dict(zip(_MONTHS_SHORT_EN, _MONTHS_EN))
+_MONTH_NAMES_EN.update(zip(_MONTHS_EN, _MONTHS_EN))
+_RECUR_MARKERS_EN = frozenset(_WEEKDAYS_EN) | \
+    _generate_plurals(_WEEKDAYS_EN) | \
+    {'weekend', 'weekday', 'weekends', 'weekdays'}
+# years per unit
+_YEAR_MULTIPLES_EN = {'decade': 10, 'century': 100, 'millennium': 1000}
+_DAY_MULTIPLES_EN = frozenset(['weeks', 'months', 'years'])
+# words allowed after "from" and "after", e.g. "2 days from tomorrow"
+_DATE_FOLLOWUPS_EN = frozenset(_WEEKDAYS_EN) | _MONTH_NAMES_EN.keys() | \
+    {'today', 'tomorrow', 'next', 'last', 'now'}
+# Words the date and time rules start from. Other words, except those
+# followed by a year multiple, are skipped without evaluating the rules.
+_DATE_KEYWORDS_EN = frozenset(_WEEKDAYS_EN) | _MONTH_NAMES_EN.keys() | \
+    _TIME_QUALIFIERS_EN | {'now', '2', 'today', 'tomorrow', 'day', 'week',
+                           'month', 'year', 'from', 'after'}
+_TIME_KEYWORDS_EN = frozenset(['noon', 'midnight', 'morning', 'afternoon',
+                               'evening', '2', 'hour', 'minute', 'second'])
+
+
 # _Token is intended to be used in the number processing functions in
 # this module. The parsing requires slicing and dividing of the original
 # text. To ensure things parse correctly, we need to know where text came
@@ -564,9 +632,10 @@ def _extract_whole_number_with_text_en(tokens, short_scale, ordinals):
 
 def _initialize_number_data(short_scale):
     """
-    Generate dictionaries of words to numbers, based on scale.
+    Get the dictionaries of words to numbers, based on scale.
 
-    This is a helper function for _extract_whole_number.
+    This is a helper function for _extract_whole_number. The dictionaries
+    are built once on import and must not be modified.
 
     Args:
         short_scale boolean:
@@ -576,17 +645,8 @@ def _initialize_number_data(short_scale):
         multiplies, string_num_ordinal, string_num_scale
 
     """
-    multiplies = _MULTIPLIES_SHORT_SCALE_EN if short_scale \
-        else _MULTIPLIES_LONG_SCALE_EN
-
-    string_num_ordinal_en = _STRING_SHORT_ORDINAL_EN if short_scale \
-        else _STRING_LONG_ORDINAL_EN
-
-    string_num_scale_en = _SHORT_SCALE_EN if short_scale else _LONG_SCALE_EN
-    string_num_scale_en = _invert_dict(string_num_scale_en)
-    string_num_scale_en.update(_generate_plurals(string_num_scale_en))
-
-    return multiplies, string_num_ordinal_en, string_num_scale_en
+    return _NUMBER_DATA_SHORT_SCALE_EN if short_scale \
+        else _NUMBER_DATA_LONG_SCALE_EN
 
 
 def extractnumber_en(text, short_scale=True, ordinals=False):
@@ -709,9 +769,8 @@ def extract_datetime_en(string, dateNow, default_time):
         for idx, word in enumerate(wordList):
             word = word.replace("'s", "")
 
-            ordinals = ["rd", "st", "nd", "th"]
             if word[0].isdigit():
-                for ordinal in ordinals:
+                for ordinal in ("rd", "st", "nd", "th"):
                     # "second" is the only case we should not do this
                     if ordinal in word and "second" not in word:
                         word = word.replace(ordinal, "")
@@ -737,41 +796,33 @@ def extract_datetime_en(string, dateNow, default_time):
     dayOffset = False
     monthOffset = 0
     yearOffset = 0
-    today = dateNow.strftime("%w")
-    currentYear = dateNow.strftime("%Y")
+    today = dateNow.isoweekday() % 7  # 0 = sunday
+    currentYear = dateNow.year
     fromFlag = False
     datestr = ""
     hasYear = False
     timeQualifier = ""
 
-    timeQualifiersAM = ['morning']
-    timeQualifiersPM = ['afternoon', 'evening', 'night', 'tonight']
-    timeQualifiersList = set(timeQualifiersAM + timeQualifiersPM)
-    markers = ['at', 'in', 'on', 'by', 'this', 'around', 'for', 'of', "within"]
-    days = ['monday', 'tuesday', 'wednesday',
-            'thursday', 'friday', 'saturday', 'sunday']
-    months = ['january', 'february', 'march', 'april', 'may', 'june',
-              'july', 'august', 'september', 'october', 'november',
-              'december']
-    recur_markers = days + [d+'s' for d in days] + ['weekend', 'weekday',
-                                                    'weekends', 'weekdays']
-    monthsShort = ['jan', 'feb', 'mar', 'apr', 'may', 'june', 'july', 'aug',
-                   'sept', 'oct', 'nov', 'dec']
-    year_multiples = ["decade", "century", "millennium"]
-    day_multiples = ["weeks", "months", "years"]
+    timeQualifiersAM = _TIME_QUALIFIERS_AM_EN
+    timeQualifiersPM = _TIME_QUALIFIERS_PM_EN
+    markers = _DATE_MARKERS_EN
+    days = _WEEKDAY_NUMBERS_EN
+    year_multiples = _YEAR_MULTIPLES_EN
 
     words = clean_string(string)
 
     for idx, word in enumerate(words):
         if word == "":
             continue
-        wordPrevPrev = words[idx - 2] if idx > 1 else ""
-        wordPrev = words[idx - 1] if idx > 0 else ""
         wordNext = words[idx + 1] if idx + 1 < len(words) else ""
-        wordNextNext = words[idx + 2] if idx + 2 < len(words) else ""
-
         # this isn't in clean string because I don't want to save back to words
         word = word.rstrip('s')
+        if word not in _DATE_KEYWORDS_EN and wordNext not in year_multiples:
+            continue
+
+        wordPrevPrev = words[idx - 2] if idx > 1 else ""
+        wordPrev = words[idx - 1] if idx > 0 else ""
+        wordNextNext = words[idx + 2] if idx + 2 < len(words) else ""
         start = idx
         used = 0
         # save timequalifier for later
@@ -788,25 +839,14 @@ def extract_datetime_en(string, dateNow, default_time):
             multiplier = multiplier or 1
             multiplier = int(multiplier)
             used += 2
-            if wordNext == "decade":
-                yearOffset = multiplier * 10
-            elif wordNext == "century":
-                yearOffset = multiplier * 100
-            elif wordNext == "millennium":
-                yearOffset = multiplier * 1000
+            yearOffset = multiplier * year_multiples[wordNext]
         # couple of
         elif word == "2" and wordNext == "of" and \
                 wordNextNext in year_multiples:
-            multiplier = 2
             used += 3
-            if wordNextNext == "decade":
-                yearOffset = multiplier * 10
-            elif wordNextNext == "century":
-                yearOffset = multiplier * 100
-            elif wordNextNext == "millennium":
-                yearOffset = multiplier * 1000
+            yearOffset = 2 * year_multiples[wordNextNext]
         elif word == "2" and wordNext == "of" and \
-                wordNextNext in day_multiples:
+                wordNextNext in _DAY_MULTIPLES_EN:
             multiplier = 2
             used += 3
             if wordNextNext == "years":
@@ -815,7 +855,7 @@ def extract_datetime_en(string, dateNow, default_time):
                 monthOffset = multiplier
             elif wordNextNext == "weeks":
                 dayOffset = multiplier * 7
-        elif word in timeQualifiersList:
+        elif word in _TIME_QUALIFIERS_EN:
             timeQualifier = word
         # parse today, tomorrow, day after tomorrow
         elif word == "today" and not fromFlag:
@@ -884,8 +924,7 @@ def extract_datetime_en(string, dateNow, default_time):
         # parse Monday, Tuesday, etc., and next Monday,
         # last Tuesday, etc.
         elif word in days and not fromFlag:
-            d = days.index(word)
-            dayOffset = (d + 1) - int(today)
+            dayOffset = days[word] - today
             used = 1
             if dayOffset < 0:
                 dayOffset += 7
@@ -899,13 +938,9 @@ def extract_datetime_en(string, dateNow, default_time):
                 used += 1
                 start -= 1
                 # parse 15 of July, June 20th, Feb 18, 19 of February
-        elif word in months or word in monthsShort and not fromFlag:
-            try:
-                m = months.index(word)
-            except ValueError:
-                m = monthsShort.index(word)
+        elif word in _MONTHS_EN or word in _MONTHS_SHORT_EN and not fromFlag:
             used += 1
-            datestr = months[m]
+            datestr = _MONTH_NAMES_EN[word]
             if wordPrev and (wordPrev[0].isdigit() or
                              (wordPrev == "of" and wordPrevPrev[0].isdigit())):
                 if wordPrev == "of" and wordPrevPrev[0].isdigit():
@@ -941,27 +976,20 @@ def extract_datetime_en(string, dateNow, default_time):
 
         # parse 5 days from tomorrow, 10 weeks from next thursday,
         # 2 months from July
-        validFollowups = days + months + monthsShort
-        validFollowups.append("today")
-        validFollowups.append("tomorrow")
-        validFollowups.append("next")
-        validFollowups.append("last")
-        validFollowups.append("now")
-        if (word == "from" or word == "after") and wordNext in validFollowups:
+        if (word == "from" or word == "after") and \
+                wordNext in _DATE_FOLLOWUPS_EN:
             used = 2
             fromFlag = True
             if wordNext == "tomorrow":
                 dayOffset += 1
             elif wordNext in days:
-                d = days.index(wordNext)
-                tmpOffset = (d + 1) - int(today)
+                tmpOffset = days[wordNext] - today
                 used = 2
                 if tmpOffset < 0:
                     tmpOffset += 7
                 dayOffset += tmpOffset
             elif wordNextNext and wordNextNext in days:
-                d = days.index(wordNextNext)
-                tmpOffset = (d + 1) - int(today)
+                tmpOffset = days[wordNextNext] - today
                 used = 3
                 if wordNext == "next":
                     if dayOffset <= 2:
@@ -997,6 +1025,8 @@ def extract_datetime_en(string, dateNow, default_time):
     for idx, word in enumerate(words):
         if word == "":
             continue
+        if word not in _TIME_KEYWORDS_EN and not word[0].isdigit():
+            continue
 
         wordPrevPrev = words[idx - 2] if idx > 1 else ""
         wordPrev = words[idx - 1] if idx > 0 else ""
@@ -1197,9 +1227,9 @@ def extract_datetime_en(string, dateNow, default_time):
                     remainder = "am"
                     used = 1
                 elif (
-                        remainder in recur_markers or
-                        wordNext in recur_markers or
-                        wordNextNext in recur_markers):
+                        remainder in _RECUR_MARKERS_EN or
+                        wordNext in _RECUR_MARKERS_EN or
+                        wordNextNext in _RECUR_MARKERS_EN):
                     # Ex: "7 on mondays" or "3 this friday"
                     # Set strHH so that isTime == True
                     # when am or pm is not specified
@@ -1400,21 +1430,21 @@ def extract_datetime_en(string, dateNow, default_time):
                                 tzinfo=extractedDate.tzinfo)
             if extractedDate < temp:
                 extractedDate = extractedDate.replace(
-                    year=int(currentYear),
-                    month=int(temp.strftime("%m")),
-                    day=int(temp.strftime("%d")),
+                    year=currentYear,
+                    month=temp.month,
+                    day=temp.day,
                     tzinfo=extractedDate.tzinfo)
             else:
                 extractedDate = extractedDate.replace(
-                    year=int(currentYear) + 1,
-                    month=int(temp.strftime("%m")),
-                    day=int(temp.strftime("%d")),
+                    year=currentYear + 1,
+                    month=temp.month,
+                    day=temp.day,
                     tzinfo=extractedDate.tzinfo)
         else:
             extractedDate = extractedDate.replace(
-                year=int(temp.strftime("%Y")),
-                month=int(temp.strftime("%m")),
-                day=int(temp.strftime("%d")),
+                year=temp.year,
+                month=temp.month,
+                day=temp.day,
                 tzinfo=extractedDate.tzinfo)
     else:
         # ignore the current HH:MM:SS if relative using days or greater
@@ -1426,7 +1456,7 @@ def extract_datetime_en(string, dateNow, default_time):
     if monthOffset != 0:
         extractedDate = extractedDate + relativedelta(months=monthOffset)
     if dayOffset != 0:
-        extractedDate = extractedDate + relativedelta(days=dayOffset)
+        extractedDate = extractedDate + timedelta(days=dayOffset)
     if hrAbs != -1 and minAbs != -1:
         # If no time was supplied in the string set the time to default
         # time if it's available
@@ -1436,17 +1466,17 @@ def extract_datetime_en(string, dateNow, default_time):
             hrAbs = hrAbs or 0
             minAbs = minAbs or 0
 
-        extractedDate = extractedDate + relativedelta(hours=hrAbs,
-                                                      minutes=minAbs)
+        extractedDate = extractedDate + timedelta(hours=hrAbs,
+                                                  minutes=minAbs)
         if (hrAbs != 0 or minAbs != 0) and datestr == "":
             if not daySpecified and dateNow > extractedDate:
-                extractedDate = extractedDate + relativedelta(days=1)
+                extractedDate = extractedDate + timedelta(days=1)
     if hrOffset != 0:
-        extractedDate = extractedDate + relativedelta(hours=hrOffset)
+        extractedDate = extractedDate + timedelta(hours=hrOffset)
     if minOffset != 0:
-        extractedDate = extractedDate + relativedelta(minutes=minOffset)
+        extractedDate = extractedDate + timedelta(minutes=minOffset)
     if secOffset != 0:
-        extractedDate = extractedDate + relativedelta(seconds=secOffset)
+        extractedDate = extractedDate + timedelta(seconds=secOffset)
     for idx, word in enumerate(words):
         if words[idx] == "and" and \
                 words[idx - 1] == "" and words[idx + 1] == "":
@@ -1471,16 +1501,8 @@ def isFractional_en(input_str, short_scale=True):
     if input_str.endswith('s', -1):
         input_str = input_str[:len(input_str) - 1]  # e.g. "fifths"
 
-    fracts = {"whole": 1, "half": 2, "halve": 2, "quarter": 4}
-    if short_scale:
-        for num in _SHORT_ORDINAL_STRING_EN:
-            if num > 2:
-                fracts[_SHORT_ORDINAL_STRING_EN[num]] = num
-    else:
-        for num in _LONG_ORDINAL_STRING_EN:
-            if num > 2:
-                fracts[_LONG_ORDINAL_STRING_EN[num]] = num
-
+    fracts = _FRACTIONS_SHORT_SCALE_EN if short_scale \
+        else _FRACTIONS_LONG_SCALE_EN
     if input_str.lower() in fracts:
         return 1.0 / fracts[input_str.lower()]
     return False
@@ -1507,71 +1529,4 @@ def extract_numbers_en(text, short_scale=True, ordinals=False):
 
 def normalize_en(text, remove_articles):
     """ English string normalization """
-
-    words = text.split()  # this also removed extra spaces
-    normalized = ""
-    for word in words:
-        if remove_articles and word in ["the", "a", "an"]:
-            continue
-
-        # Expand common contractions, e.g. "isn't" -> "is not"
-        contraction = ["ain't", "aren't", "can't", "could've", "couldn't",
-                       "didn't", "doesn't", "don't", "gonna", "gotta",
-                       "hadn't", "hasn't", "haven't", "he'd", "he'll", "he's",
-                       "how'd", "how'll", "how's", "I'd", "I'll", "I'm",
-                       "I've", "isn't", "it'd", "it'll", "it's", "mightn't",
-                       "might've", "mustn't", "must've", "needn't",
-                       "oughtn't",
-                       "shan't", "she'd", "she'll", "she's", "shouldn't",
-                       "should've", "somebody's", "someone'd", "someone'll",
-                       "someone's", "that'll", "that's", "that'd", "there'd",
-                       "there're", "there's", "they'd", "they'll", "they're",
-                       "they've", "wasn't", "we'd", "we'll", "we're", "we've",
-                       "weren't", "what'd", "what'll", "what're", "what's",
-                       "whats",  # technically incorrect but some STT outputs
-                       "what've", "when's", "when'd", "where'd", "where's",
-                       "where've", "who'd", "who'd've", "who'll", "who're",
-                       "who's", "who've", "why'd", "why're", "why's", "won't",
-                       "won't've", "would've", "wouldn't", "wouldn't've",
-                       "y'all", "ya'll", "you'd", "you'd've", "you'll",
-                       "y'aint", "y'ain't", "you're", "you've"]
-        if word in contraction:
-            expansion = ["is not", "are not", "can not", "could have",
-                         "could not", "did not", "does not", "do not",
-                         "going to", "got to", "had not", "has not",
-                         "have not", "he would", "he will", "he is",
-                         "how did",
-                         "how will", "how is", "I would", "I will", "I am",
-                         "I have", "is not", "it would", "it will", "it is",
-                         "might not", "might have", "must not", "must have",
-                         "need not", "ought not", "shall not", "she would",
-                         "she will", "she is", "should not", "should have",
-                         "somebody is", "someone would", "someone will",
-                         "someone is", "that will", "that is", "that would",
-                         "there would", "there are", "there is", "they would",
-                         "they will", "they are", "they have", "was not",
-                         "we would", "we will", "we are", "we have",
-                         "were not", "what did", "what will", "what are",
-                         "what is",
-                         "what is", "what have", "when is", "when did",
-                         "where did", "where is", "where have", "who would",
-                         "who would have", "who will", "who are", "who is",
-                         "who have", "why did", "why are", "why is",
-                         "will not", "will not have", "would have",
-                         "would not", "would not have", "you all", "you all",
-                         "you would", "you would have", "you will",
-                         "you are not", "you are not", "you are", "you have"]
-            word = expansion[contraction.index(word)]
-
-        # Convert numbers into digits, e.g. "two" -> "2"
-        textNumbers = ["zero", "one", "two", "three", "four", "five", "six",
-                       "seven", "eight", "nine", "ten", "eleven", "twelve",
-                       "thirteen", "fourteen", "fifteen", "sixteen",
-                       "seventeen", "eighteen", "nineteen", "twenty"]
-
-        if word in textNumbers:
-            word = str(textNumbers.index(word))
-
-        normalized += " " + word
-
-    return normalized[1:]  # strip the initial space
+    return _NORMALIZER_EN.normalize(text, remove_articles)
@@ -16,7 +16,16 @@
 #
 from datetime import datetime
 from dateutil.relativedelta import relativedelta
-from mycroft.util.lang.parse_common import is_numeric, look_for_fractions
+from mycroft.util.lang.parse_common import is_numeric, look_for_fractions, \
+    Normalizer
+
+# Convert numbers into digits, e.g. "två" -> "2"
+_NORMALIZER_SV = Normalizer([
+    {"en": "ett"},
+    {word: str(number) for number, word in enumerate([
+        "noll", "ett", "två", "tre", "fyra", "fem", "sex", "sju", "åtta",
+        "nio", "tio", "elva", "tolv", "tretton", "fjorton", "femton",
+        "sexton", "sjutton", "arton", "nitton", "tjugo"])}])
 
 
 def extractnumber_sv(text):
@@ -759,20 +768,4 @@ def is_fractional_sv(input_str):
 
 def normalize_sv(text, remove_articles):
     """ English string normalization """
-
-    words = text.split()  # this also removed extra spaces
-    normalized = ''
-    for word in words:
-        # Convert numbers into digits, e.g. "two" -> "2"
-        if word == 'en':
-            word = 'ett'
-        textNumbers = ["noll", "ett", "två", "tre", "fyra", "fem", "sex",
-                       "sju", "åtta", "nio", "tio", "elva", "tolv",
-                       "tretton", "fjorton", "femton", "sexton",
-                       "sjutton", "arton", "nitton", "tjugo"]
-        if word in textNumbers:
-            word = str(textNumbers.index(word))
-
-        normalized += " " + word
-
-    return normalized[1:]  # strip the initial space
+    return _NORMALIZER_SV.normalize(text, remove_articles)
@@ -23,31 +23,35 @@ The focus of these parsing functions is to extract data from natural speech
 and to allow localization.
 """
 
+from concurrent.futures import ProcessPoolExecutor
 from difflib import SequenceMatcher
+from functools import lru_cache, partial
+import sys
 from mycroft.util.time import now_local
-from mycroft.util.lang import get_primary_lang_code
-
-from mycroft.util.lang.parse_en import *
-from mycroft.util.lang.parse_pt import *
-from mycroft.util.lang.parse_es import *
-from mycroft.util.lang.parse_it import *
-from mycroft.util.lang.parse_sv import *
-
-from mycroft.util.lang.parse_de import extractnumber_de
-from mycroft.util.lang.parse_de import extract_numbers_de
-from mycroft.util.lang.parse_de import extract_datetime_de
-from mycroft.util.lang.parse_de import normalize_de
-from mycroft.util.lang.parse_fr import extractnumber_fr
-from mycroft.util.lang.parse_fr import extract_numbers_fr
-from mycroft.util.lang.parse_fr import extract_datetime_fr
-from mycroft.util.lang.parse_fr import normalize_fr
-from mycroft.util.lang.parse_da import extractnumber_da
-from mycroft.util.lang.parse_da import extract_numbers_da
-from mycroft.util.lang.parse_da import extract_datetime_da
-from mycroft.util.lang.parse_da import normalize_da
+from mycroft.util.lang import get_primary_lang_code, LanguageFunctions
 
 from .log import LOG
 
+_SUPPORTED_LANGUAGES = ['en', 'es', 'pt', 'it', 'fr', 'sv', 'de', 'da']
+
+# Language modules are imported on first use, see LanguageFunctions
+_functions = LanguageFunctions('parse', _SUPPORTED_LANGUAGES)
+
+
+def __getattr__(name):
+    """ Resolve language specific functions such as extract_datetime_en.
+
+    These used to be imported into this module, keep them available
+    without importing every language up front. Python < 3.7 doesn't call
+    a module __getattr__ (PEP 562), the functions are imported at the end
+    of this module there.
+    """
+    function = _functions.lookup(name)
+    if function is None:
+        raise AttributeError("module {!r} has no attribute {!r}".format(
+            __name__, name))
+    return function
+
 
 def _log_unsupported_language(language, supported_languages):
     """
@@ -119,19 +123,52 @@ def extract_numbers(text, short_scale=True, ordinals=False, lang=None):
         list: list of extracted numbers as floats, or empty list if none found
     """
     lang_code = get_primary_lang_code(lang)
-    if lang_code == "en":
-        return extract_numbers_en(text, short_scale, ordinals)
-    elif lang_code == "de":
-        return extract_numbers_de(text, short_scale, ordinals)
-    elif lang_code == "fr":
-        return extract_numbers_fr(text, short_scale, ordinals)
-    elif lang_code == "it":
-        return extract_numbers_it(text, short_scale, ordinals)
-    elif lang_code == "da":
-        return extract_numbers_da(text, short_scale, ordinals)
+    extract = _functions.get('extract_numbers', lang_code)
+    if extract:
+        return extract(text, short_scale, ordinals)
     return []
 
 
+def extract_numbers_many(texts, short_scale=True, ordinals=False, lang=None,
+                         processes=None):
+    """Extract the numbers of many strings, like extract_numbers.
+
+    The language is resolved once for the whole batch and repeated strings
+    are only parsed once. Large batches can be spread over worker
+    processes. Starting the workers takes a while, so this only pays off
+    for thousands of strings.
+
+    Args:
+        texts (iterable): the strings to extract numbers from
+        short_scale (bool): Use "short scale" or "long scale" for large
+            numbers, see extract_numbers
+        ordinals (bool): consider ordinal numbers, e.g. third=3 instead of 1/3
+        lang (str): the BCP-47 code for the language to use, None uses default
+        processes (int): number of worker processes, None or 1 extracts in
+                         the calling process
+    Returns:
+        list: a list of extracted numbers (floats) for each string, in the
+              order of texts
+    """
+    texts = list(texts)
+    lang_code = get_primary_lang_code(lang)
+    extract = _functions.get('extract_numbers', lang_code)
+    if not extract:
+        return [[] for _ in texts]
+
+    extract = partial(extract, short_scale=short_scale, ordinals=ordinals)
+    unique_texts = list(dict.fromkeys(texts))
+    if processes and processes > 1 and len(unique_texts) > 1:
+        chunksize = max(1, len(unique_texts) // (processes * 4))
+        with ProcessPoolExecutor(max_workers=processes) as executor:
+            results = list(executor.map(extract, unique_texts,
+                                        chunksize=chunksize))
+    else:
+        results = [extract(text) for text in unique_texts]
+    numbers = dict(zip(unique_texts, results))
+    return [list(numbers[text]) for text in texts]
+
+
 def extract_number(text, short_scale=True, ordinals=False, lang=None):
     """Takes in a string and extracts a number.
 
@@ -148,27 +185,13 @@ def extract_number(text, short_scale=True, ordinals=False, lang=None):
                                text contains no numbers
     """
     lang_code = get_primary_lang_code(lang)
-    if lang_code == "en":
-        return extractnumber_en(text, short_scale=short_scale,
-                                ordinals=ordinals)
-    elif lang_code == "es":
-        return extractnumber_es(text)
-    elif lang_code == "pt":
-        return extractnumber_pt(text)
-    elif lang_code == "it":
-        return extractnumber_it(text, short_scale=short_scale,
-                                ordinals=ordinals)
-    elif lang_code == "fr":
-        return extractnumber_fr(text)
-    elif lang_code == "sv":
-        return extractnumber_sv(text)
-    elif lang_code == "de":
-        return extractnumber_de(text)
-    elif lang_code == "da":
-        return extractnumber_da(text)
+    extract = _functions.get('extractnumber', lang_code)
+    if lang_code in ("en", "it"):
+        return extract(text, short_scale=short_scale, ordinals=ordinals)
+    elif extract:
+        return extract(text)
     # TODO: extractnumber_xx for other languages
-    _log_unsupported_language(lang_lower,
-                              ['en', 'es', 'pt', 'it', 'fr', 'sv', 'de', 'da'])
+    _log_unsupported_language(lang_code, _SUPPORTED_LANGUAGES)
     return text
 
 
@@ -199,9 +222,9 @@ def extract_duration(text, lang=None):
                     will have whitespace stripped from the ends.
     """
     lang_code = get_primary_lang_code(lang)
-
-    if lang_code == "en":
-        return extract_duration_en(text)
+    extract = _functions.get('extract_duration', lang_code)
+    if extract:
+        return extract(text)
 
     # TODO: extract_duration for other languages
     _log_unsupported_language(lang_code, ['en'])
@@ -265,28 +288,22 @@ def extract_datetime(text, anchorDate=None, lang=None, default_time=None):
     if not anchorDate:
         anchorDate = now_local()
 
-    if lang_code == "en":
-        return extract_datetime_en(text, anchorDate, default_time)
-    elif lang_code == "es":
-        return extract_datetime_es(text, anchorDate, default_time)
-    elif lang_code == "pt":
-        return extract_datetime_pt(text, anchorDate, default_time)
-    elif lang_code == "it":
-        return extract_datetime_it(text, anchorDate, default_time)
-    elif lang_code == "fr":
-        return extract_datetime_fr(text, anchorDate, default_time)
-    elif lang_code == "sv":
-        return extract_datetime_sv(text, anchorDate, default_time)
-    elif lang_code == "de":
-        return extract_datetime_de(text, anchorDate, default_time)
-    elif lang_code == "da":
-        return extract_datetime_da(text, anchorDate, default_time)
+    extract = _functions.get('extract_datetime', lang_code)
+    if extract:
+        return extract(text, anchorDate, default_time)
     # TODO: extract_datetime for other languages
-    _log_unsupported_language(lang_code,
-                              ['en', 'es', 'pt', 'it', 'fr', 'sv', 'de', 'da'])
+    _log_unsupported_language(lang_code, _SUPPORTED_LANGUAGES)
     return text
 
 
+@lru_cache(maxsize=256)
+def _normalize(text, lang_code, remove_articles):
+    """ Normalize using the language's normalizer, remembering recent
+    utterances since the same text is normalized for every intent parser.
+    """
+    return _functions.get('normalize', lang_code)(text, remove_articles)
+
+
 def normalize(text, lang=None, remove_articles=True):
     """Prepare a string for parsing
 
@@ -305,25 +322,10 @@ def normalize(text, lang=None, remove_articles=True):
 
     lang_code = get_primary_lang_code(lang)
 
-    if lang_code == "en":
-        return normalize_en(text, remove_articles)
-    elif lang_code == "es":
-        return normalize_es(text, remove_articles)
-    elif lang_code == "pt":
-        return normalize_pt(text, remove_articles)
-    elif lang_code == "it":
-        return normalize_it(text, remove_articles)
-    elif lang_code == "fr":
-        return normalize_fr(text, remove_articles)
-    elif lang_code == "sv":
-        return normalize_sv(text, remove_articles)
-    elif lang_code == "de":
-        return normalize_de(text, remove_articles)
-    elif lang_code == "da":
-        return normalize_da(text, remove_articles)
+    if lang_code in _SUPPORTED_LANGUAGES:
+        return _normalize(text, lang_code, remove_articles)
     # TODO: Normalization for other languages
-    _log_unsupported_language(lang_code,
-                              ['en', 'es', 'pt', 'it', 'fr', 'sv', 'de', 'da'])
+    _log_unsupported_language(lang_code, _SUPPORTED_LANGUAGES)
     return text
 
 
@@ -347,7 +349,13 @@ def get_gender(word, context="", lang=None):
 
     if lang_code in ["pt", "es"]:
         # spanish follows same rules
-        return get_gender_pt(word, context)
+        return _functions.get('get_gender', 'pt')(word, context)
     elif lang_code == "it":
-        return get_gender_it(word, context)
+        return _functions.get('get_gender', 'it')(word, context)
     return None
+
+
+if sys.version_info < (3, 7):
+    # Module names take precedence, like they did over the star imports
+    for _name, _function in _functions.all_functions().items():
+        globals().setdefault(_name, _function)
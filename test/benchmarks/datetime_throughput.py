@@ -0,0 +1,58 @@
+# Copyright 2019 Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Throughput of extract_datetime_en over the datetime test corpus.
+
+The corpus holds the sentences of the English extract_datetime unit tests
+and generated sentences mixing date and time words, see
+test/unittests/util/datetime_corpus.json.
+
+Run from the repository root:
+
+    python -m test.benchmarks.datetime_throughput [--runs N]
+"""
+import argparse
+import time
+from statistics import median
+
+from mycroft.util.lang.parse_en import extract_datetime_en
+from test.unittests.util.test_extract_datetime import load_corpus
+
+
+def measure(corpus, runs):
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        for text, now, default_time, _ in corpus:
+            extract_datetime_en(text, now, default_time)
+        timings.append(time.perf_counter() - start)
+    return median(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--runs', type=int, default=10,
+                        help='passes over the corpus')
+    args = parser.parse_args()
+
+    corpus = load_corpus()
+    elapsed = measure(corpus, args.runs)
+    print('{} sentences in {:.1f} ms: {:.1f} us per sentence, '
+          '{:.0f} sentences/s'.format(len(corpus), elapsed * 1000,
+                                      elapsed / len(corpus) * 1e6,
+                                      len(corpus) / elapsed))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,93 @@
+# Copyright 2019 Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Batch number extraction compared to one extract_numbers call per text.
+
+The corpus consists of generated English transcripts with spelled out and
+numeric numbers, a share of them repeated like commands in real transcripts.
+
+Run from the repository root:
+
+    python -m test.benchmarks.extract_numbers [--texts N] [--processes N]
+"""
+import argparse
+import os
+import random
+import time
+
+from mycroft.util.format import pronounce_number
+from mycroft.util.parse import extract_numbers, extract_numbers_many
+
+TEMPLATES = [
+    'set a timer for {} minutes',
+    'remind me in {} hours and {} minutes',
+    'add {} eggs and {} apples to the shopping list',
+    'what is {} times {}',
+    'turn the volume to {} percent',
+    'play the {} song of the album',
+    'i need {} and a half cups of flour',
+]
+
+
+def generate_corpus(size, seed=1234):
+    rng = random.Random(seed)
+    corpus = []
+    for _ in range(size):
+        if corpus and rng.random() < 0.2:
+            corpus.append(rng.choice(corpus))
+            continue
+        template = rng.choice(TEMPLATES)
+        numbers = [pronounce_number(rng.randint(1, 100000))
+                   if rng.random() < 0.8 else str(rng.randint(1, 1000))
+                   for _ in range(template.count('{}'))]
+        corpus.append(template.format(*numbers))
+    return corpus
+
+
+def measure(function):
+    start = time.perf_counter()
+    result = function()
+    return time.perf_counter() - start, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--texts', type=int, default=5000,
+                        help='number of transcripts')
+    parser.add_argument('--processes', type=int, default=os.cpu_count(),
+                        help='worker processes of the process pool run')
+    args = parser.parse_args()
+
+    texts = generate_corpus(args.texts)
+    runs = [
+        ('per call', lambda: [extract_numbers(text) for text in texts]),
+        ('batch', lambda: extract_numbers_many(texts)),
+        ('batch, {} processes'.format(args.processes),
+         lambda: extract_numbers_many(texts, processes=args.processes)),
+    ]
+
+    print('{:<22} {:>10} {:>14}'.format('run', 'time (s)', 'texts/s'))
+    expected = None
+    for name, function in runs:
+        elapsed, result = measure(function)
+        if expected is None:
+            expected = result
+        elif result != expected:
+            raise AssertionError(name + ' results differ from per call')
+        print('{:<22} {:>10.2f} {:>14.0f}'.format(name, elapsed,
+                                                  len(texts) / elapsed))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,88 @@
+# Copyright 2019 Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Import time and memory use of mycroft.util.parse and mycroft.util.format.
+
+Every measurement runs in a fresh interpreter. "monolingual" imports the
+modules and uses English only, "all languages" also loads every language
+module like the modules used to do on import.
+
+Run from the repository root:
+
+    python -m test.benchmarks.import_time [--runs N]
+"""
+import argparse
+import json
+import subprocess
+import sys
+from statistics import median
+
+SCRIPT = """
+import json, resource, sys, time
+start = time.perf_counter()
+import mycroft.util.parse
+import mycroft.util.format
+{use}
+elapsed = time.perf_counter() - start
+print(json.dumps({{
+    'time': elapsed,
+    'rss': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+    'modules': sum(name.startswith(('mycroft.util.lang.parse_',
+                                    'mycroft.util.lang.format_'))
+                   for name in sys.modules)
+}}))
+"""
+
+SCENARIOS = [
+    ('import', ''),
+    ('monolingual', """
+mycroft.util.parse.normalize('it is two o clock', 'en-us')
+mycroft.util.format.nice_number(2.5, 'en-us')
+"""),
+    ('all languages', """
+for lang in mycroft.util.parse._functions.languages:
+    mycroft.util.parse._functions.get('normalize', lang)
+for lang in mycroft.util.format._functions.languages:
+    mycroft.util.format._functions.get('nice_number', lang)
+"""),
+]
+
+
+def measure(use, runs):
+    results = []
+    for _ in range(runs):
+        output = subprocess.check_output(
+            [sys.executable, '-c', SCRIPT.format(use=use)])
+        results.append(json.loads(output.decode().splitlines()[-1]))
+    return {key: median(result[key] for result in results)
+            for key in results[0]}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--runs', type=int, default=5,
+                        help='fresh interpreters per scenario')
+    args = parser.parse_args()
+
+    print('{:<15} {:>10} {:>12} {:>16}'.format(
+        'scenario', 'time (ms)', 'max RSS (MB)', 'language modules'))
+    for name, use in SCENARIOS:
+        result = measure(use, args.runs)
+        print('{:<15} {:>10.1f} {:>12.1f} {:>16}'.format(
+            name, result['time'] * 1000, result['rss'] / 1024,
+            result['modules']))
+
+
+if __name__ == '__main__':
+    main()
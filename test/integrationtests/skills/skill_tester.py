@@ -194,7 +194,7 @@ class TestSettings(SkillSettings):
     def save_skill_settings(self, skill_settings):
         pass
 
-    def _poll_skill_settings(self):
+    def _sync_remote(self, skill_settings):
         pass
 
     def _load_settings_meta(self):
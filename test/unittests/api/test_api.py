@@ -35,9 +35,6 @@ CONFIG.merge(
 )
 
 
-mycroft.api.requests.post = MagicMock()
-
-
 def create_identity(uuid, expired=False):
     mock_identity = MagicMock()
     mock_identity.is_expired.return_value = expired
@@ -71,7 +68,7 @@ class TestApi(unittest.TestCase):
         self.assertEquals(a.identity.uuid, '1234')
 
     @patch('mycroft.api.IdentityManager')
-    @patch('mycroft.api.requests.request')
+    @patch('mycroft.api.pool.requests.Session.request')
     def test_send(self, mock_request, mock_identity_manager):
         # Setup an OK response
         mock_response_ok = create_response(200, {})
@@ -112,10 +109,11 @@ class TestDeviceApi(unittest.TestCase):
                         return_value=CONFIG)
         self.mock_config_get = patcher.start()
         self.addCleanup(patcher.stop)
+        mycroft.api.pool.clear_response_cache()
         super().setUp()
 
     @patch('mycroft.api.IdentityManager.get')
-    @patch('mycroft.api.requests.request')
+    @patch('mycroft.api.pool.requests.Session.request')
     def test_init(self, mock_request, mock_identity_get):
         mock_request.return_value = create_response(200)
         mock_identity_get.return_value = create_identity('1234')
@@ -125,7 +123,7 @@ class TestDeviceApi(unittest.TestCase):
         self.assertEquals(device.path, 'device')
 
     @patch('mycroft.api.IdentityManager.get')
-    @patch('mycroft.api.requests.request')
+    @patch('mycroft.api.pool.requests.Session.request')
     def test_device_activate(self, mock_request, mock_identity_get):
         mock_request.return_value = create_response(200)
         mock_identity_get.return_value = create_identity('1234')
@@ -137,7 +135,7 @@ class TestDeviceApi(unittest.TestCase):
         self.assertEquals(json['token'], 'token')
 
     @patch('mycroft.api.IdentityManager.get')
-    @patch('mycroft.api.requests.request')
+    @patch('mycroft.api.pool.requests.Session.request')
     def test_device_get(self, mock_request, mock_identity_get):
         mock_request.return_value = create_response(200)
         mock_identity_get.return_value = create_identity('1234')
@@ -149,7 +147,7 @@ class TestDeviceApi(unittest.TestCase):
 
     @patch('mycroft.api.IdentityManager.update')
     @patch('mycroft.api.IdentityManager.get')
-    @patch('mycroft.api.requests.request')
+    @patch('mycroft.api.pool.requests.Session.request')
     def test_device_get_code(self, mock_request, mock_identity_get,
                              mock_identit_update):
         mock_request.return_value = create_response(200, '123ABC')
@@ -162,7 +160,7 @@ class TestDeviceApi(unittest.TestCase):
             url, 'https://api-test.mycroft.ai/v1/device/code?state=state')
 
     @patch('mycroft.api.IdentityManager.get')
-    @patch('mycroft.api.requests.request')
+    @patch('mycroft.api.pool.requests.Session.request')
     def test_device_get_settings(self, mock_request, mock_identity_get):
         mock_request.return_value = create_response(200, {})
         mock_identity_get.return_value = create_identity('1234')
@@ -173,7 +171,7 @@ class TestDeviceApi(unittest.TestCase):
             url, 'https://api-test.mycroft.ai/v1/device/1234/setting')
 
     @patch('mycroft.api.IdentityManager.get')
-    @patch('mycroft.api.requests.request')
+    @patch('mycroft.api.pool.requests.Session.request')
     def test_device_report_metric(self, mock_request, mock_identity_get):
         mock_request.return_value = create_response(200, {})
         mock_identity_get.return_value = create_identity('1234')
@@ -190,7 +188,7 @@ class TestDeviceApi(unittest.TestCase):
             url, 'https://api-test.mycroft.ai/v1/device/1234/metric/mymetric')
 
     @patch('mycroft.api.IdentityManager.get')
-    @patch('mycroft.api.requests.request')
+    @patch('mycroft.api.pool.requests.Session.request')
     def test_device_send_email(self, mock_request, mock_identity_get):
         mock_request.return_value = create_response(200, {})
         mock_identity_get.return_value = create_identity('1234')
@@ -207,7 +205,7 @@ class TestDeviceApi(unittest.TestCase):
             url, 'https://api-test.mycroft.ai/v1/device/1234/message')
 
     @patch('mycroft.api.IdentityManager.get')
-    @patch('mycroft.api.requests.request')
+    @patch('mycroft.api.pool.requests.Session.request')
     def test_device_get_oauth_token(self, mock_request, mock_identity_get):
         mock_request.return_value = create_response(200, {})
         mock_identity_get.return_value = create_identity('1234')
@@ -219,7 +217,7 @@ class TestDeviceApi(unittest.TestCase):
             url, 'https://api-test.mycroft.ai/v1/device/1234/token/1')
 
     @patch('mycroft.api.IdentityManager.get')
-    @patch('mycroft.api.requests.request')
+    @patch('mycroft.api.pool.requests.Session.request')
     def test_device_get_location(self, mock_request, mock_identity_get):
         mock_request.return_value = create_response(200, {})
         mock_identity_get.return_value = create_identity('1234')
@@ -230,7 +228,7 @@ class TestDeviceApi(unittest.TestCase):
             url, 'https://api-test.mycroft.ai/v1/device/1234/location')
 
     @patch('mycroft.api.IdentityManager.get')
-    @patch('mycroft.api.requests.request')
+    @patch('mycroft.api.pool.requests.Session.request')
     def test_device_get_subscription(self, mock_request, mock_identity_get):
         mock_request.return_value = create_response(200, {})
         mock_identity_get.return_value = create_identity('1234')
@@ -240,17 +238,36 @@ class TestDeviceApi(unittest.TestCase):
         self.assertEquals(
             url, 'https://api-test.mycroft.ai/v1/device/1234/subscription')
 
+        mycroft.api.pool.clear_response_cache()
         mock_request.return_value = create_response(200, {'@type': 'free'})
         self.assertFalse(device.is_subscriber)
 
+        mycroft.api.pool.clear_response_cache()
         mock_request.return_value = create_response(200, {'@type': 'monthly'})
         self.assertTrue(device.is_subscriber)
 
+        mycroft.api.pool.clear_response_cache()
         mock_request.return_value = create_response(200, {'@type': 'yearly'})
         self.assertTrue(device.is_subscriber)
 
     @patch('mycroft.api.IdentityManager.get')
-    @patch('mycroft.api.requests.request')
+    @patch('mycroft.api.pool.requests.Session.request')
+    def test_device_cached_location(self, mock_request, mock_identity_get):
+        mock_request.return_value = create_response(200, {'city': 'Paris'})
+        mock_identity_get.return_value = create_identity('1234')
+        device = mycroft.api.DeviceApi()
+        location = device.get_location()
+        location['city'] = 'Lyon'
+        # Second request is answered from the cache, unaffected by the change
+        self.assertEqual(device.get_location(), {'city': 'Paris'})
+        self.assertEqual(mock_request.call_count, 1)
+
+        mycroft.api.pool.clear_response_cache()
+        device.get_location()
+        self.assertEqual(mock_request.call_count, 2)
+
+    @patch('mycroft.api.IdentityManager.get')
+    @patch('mycroft.api.pool.requests.Session.request')
     def test_device_upload_skills_data(self, mock_request, mock_identity_get):
         mock_request.return_value = create_response(200)
         mock_identity_get.return_value = create_identity('1234')
@@ -271,7 +288,7 @@ class TestDeviceApi(unittest.TestCase):
             device.upload_skills_data('This isn\'t right at all')
 
     @patch('mycroft.api.IdentityManager.get')
-    @patch('mycroft.api.requests.request')
+    @patch('mycroft.api.pool.requests.Session.request')
     def test_stt(self, mock_request, mock_identity_get):
         mock_request.return_value = create_response(200, {})
         mock_identity_get.return_value = create_identity('1234')
@@ -279,7 +296,7 @@ class TestDeviceApi(unittest.TestCase):
         self.assertEquals(stt.path, 'stt')
 
     @patch('mycroft.api.IdentityManager.get')
-    @patch('mycroft.api.requests.request')
+    @patch('mycroft.api.pool.requests.Session.request')
     def test_stt_stt(self, mock_request, mock_identity_get):
         mock_request.return_value = create_response(200, {})
         mock_identity_get.return_value = create_identity('1234')
@@ -309,7 +326,7 @@ class TestDeviceApi(unittest.TestCase):
 
 
 @patch('mycroft.api.IdentityManager.get')
-@patch('mycroft.api.requests.request')
+@patch('mycroft.api.pool.requests.Session.request')
 class TestSettingsMeta(unittest.TestCase):
     def setUp(self):
         patcher = patch('mycroft.configuration.Configuration.get',
@@ -383,7 +400,7 @@ class TestSettingsMeta(unittest.TestCase):
 
 @patch('mycroft.api._paired_cache', False)
 @patch('mycroft.api.IdentityManager.get')
-@patch('mycroft.api.requests.request')
+@patch('mycroft.api.pool.requests.Session.request')
 class TestIsPaired(unittest.TestCase):
     def setUp(self):
         patcher = patch('mycroft.configuration.Configuration.get',
@@ -0,0 +1,135 @@
+# Copyright 2019 Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import json
+import unittest
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from threading import Thread
+from unittest.mock import patch
+
+from mycroft.api.pool import (clear_response_cache, create_session,
+                              get_caches, ResponseCache)
+
+
+class MockBackend(BaseHTTPRequestHandler):
+    """Backend answering with the client port, failing if told to."""
+    protocol_version = 'HTTP/1.1'  # Keep connections alive
+    failures = 0
+    requests = 0
+
+    def do_GET(self):
+        MockBackend.requests += 1
+        if MockBackend.failures:
+            MockBackend.failures -= 1
+            status = 503
+        else:
+            status = 200
+        body = json.dumps({'port': self.client_address[1]}).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class TestSession(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = HTTPServer(('127.0.0.1', 0), MockBackend)
+        cls.url = 'http://127.0.0.1:{}/'.format(cls.server.server_port)
+        Thread(target=cls.server.serve_forever, daemon=True).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        MockBackend.failures = 0
+        MockBackend.requests = 0
+        self.session = create_session(retries=2, backoff=0)
+        self.addCleanup(self.session.close)
+
+    def test_keep_alive(self):
+        ports = {self.session.get(self.url, timeout=5).json()['port']
+                 for _ in range(3)}
+        self.assertEqual(len(ports), 1)
+
+    def test_retry(self):
+        MockBackend.failures = 2
+        response = self.session.get(self.url, timeout=5)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(MockBackend.requests, 3)
+
+    def test_retries_exhausted(self):
+        MockBackend.failures = 5
+        response = self.session.get(self.url, timeout=5)
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(MockBackend.requests, 3)
+
+
+class TestResponseCache(unittest.TestCase):
+    def test_size_bound(self):
+        cache = ResponseCache(max_size=2)
+        cache.put('a', 1)
+        cache.put('b', 2)
+        cache.get('a')  # Makes b the least recently used
+        cache.put('c', 3)
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.get('a'), 1)
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual(cache.get('c'), 3)
+
+    @patch('mycroft.api.pool.time.monotonic')
+    def test_ttl(self, mock_monotonic):
+        mock_monotonic.return_value = 100
+        cache = ResponseCache()
+        cache.put('a', 1, ttl=10)
+        cache.put('b', 2)
+        mock_monotonic.return_value = 109
+        self.assertEqual(cache.get('a'), 1)
+        mock_monotonic.return_value = 110
+        self.assertEqual(cache.get('a', 'expired'), 'expired')
+        self.assertEqual(cache.get('b'), 2)
+
+    def test_clear(self):
+        cache = ResponseCache()
+        cache.put('a', 1)
+        cache.clear()
+        self.assertIsNone(cache.get('a'))
+
+
+@patch('mycroft.api.pool._caches', None)
+class TestSharedCaches(unittest.TestCase):
+    def test_config(self):
+        etag_cache, response_cache = get_caches({'etag_max_size': 5,
+                                                 'max_size': 3})
+        self.assertEqual(etag_cache.max_size, 5)
+        self.assertEqual(response_cache.max_size, 3)
+        # The caches are only configured when created
+        self.assertEqual(get_caches({'max_size': 10}),
+                         (etag_cache, response_cache))
+        self.assertEqual(response_cache.max_size, 3)
+
+    def test_clear_response_cache(self):
+        clear_response_cache()  # Nothing created yet
+        etag_cache, response_cache = get_caches()
+        etag_cache.put('a', 1)
+        response_cache.put('a', 1)
+        clear_response_cache()
+        self.assertEqual(len(response_cache), 0)
+        self.assertEqual(etag_cache.get('a'), 1)
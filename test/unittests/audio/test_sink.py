@@ -0,0 +1,125 @@
+# Copyright 2019 Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import unittest
+import wave
+from os.path import join
+from shutil import rmtree
+from tempfile import mkdtemp
+from unittest import mock
+
+from mycroft.audio.sink import AudioSink
+
+
+def write_wav(path, frames, rate=22050, channels=1, width=2):
+    with wave.open(path, 'wb') as wav:
+        wav.setnchannels(channels)
+        wav.setsampwidth(width)
+        wav.setframerate(rate)
+        wav.writeframes(frames)
+    return path
+
+
+@mock.patch('mycroft.audio.sink.pyaudio.PyAudio')
+class TestAudioSink(unittest.TestCase):
+    def setUp(self):
+        self.dir = mkdtemp()
+        self.addCleanup(rmtree, self.dir)
+        self.first = write_wav(join(self.dir, 'first.wav'), b'\x01\x00' * 5)
+        self.second = write_wav(join(self.dir, 'second.wav'), b'\x02\x00' * 3)
+
+    def written(self, stream):
+        return b''.join(args[0] for args, _ in stream.write.call_args_list)
+
+    def test_chained_files(self, mock_pyaudio):
+        sink = AudioSink(frames_per_buffer=2)
+        self.assertTrue(sink.play_wav(self.first))
+        self.assertTrue(sink.play_wav(self.second))
+
+        audio = mock_pyaudio.return_value
+        audio.open.assert_called_once_with(
+            format=audio.get_format_from_width.return_value,
+            channels=1, rate=22050, output=True, output_device_index=None,
+            frames_per_buffer=2)
+        stream = audio.open.return_value
+        self.assertEqual(self.written(stream),
+                         b'\x01\x00' * 5 + b'\x02\x00' * 3)
+        stream.close.assert_not_called()
+
+    def test_format_change(self, mock_pyaudio):
+        other = write_wav(join(self.dir, 'other.wav'), b'\x00\x00',
+                          rate=16000)
+        sink = AudioSink()
+        sink.play_wav(self.first)
+        sink.play_wav(other)
+        audio = mock_pyaudio.return_value
+        self.assertEqual(audio.open.call_count, 2)
+        audio.open.return_value.close.assert_called_once_with()
+        self.assertEqual(audio.open.call_args[1]['rate'], 16000)
+
+    def test_not_wav(self, mock_pyaudio):
+        path = join(self.dir, 'sound.mp3')
+        with open(path, 'wb') as f:
+            f.write(b'ID3 not a wav file')
+        sink = AudioSink()
+        self.assertFalse(sink.play_wav(path))
+        self.assertFalse(sink.play_wav(join(self.dir, 'missing.wav')))
+        mock_pyaudio.assert_not_called()
+        self.assertTrue(sink.available)
+
+    def test_device_failure(self, mock_pyaudio):
+        mock_pyaudio.return_value.open.side_effect = OSError('No device')
+        sink = AudioSink()
+        self.assertFalse(sink.play_wav(self.first))
+        self.assertFalse(sink.available)
+        mock_pyaudio.return_value.terminate.assert_called_once_with()
+        # The device isn't opened again
+        self.assertFalse(sink.play_wav(self.first))
+        self.assertEqual(mock_pyaudio.call_count, 1)
+
+    def test_stop(self, mock_pyaudio):
+        sink = AudioSink(frames_per_buffer=2)
+        stream = mock_pyaudio.return_value.open.return_value
+        stream.write.side_effect = lambda frames: sink.stop()
+        self.assertTrue(sink.play_wav(self.first))
+        self.assertEqual(stream.write.call_count, 1)
+        # The next file plays again
+        stream.write.side_effect = None
+        sink.play_wav(self.second)
+        self.assertEqual(stream.write.call_count, 3)
+
+    def test_drain(self, mock_pyaudio):
+        sink = AudioSink()
+        sink.drain()  # Nothing opened yet
+        sink.play_wav(self.first)
+        audio = mock_pyaudio.return_value
+        stream = audio.open.return_value
+        sink.drain()
+        # Buffered audio is played before the device is released
+        self.assertEqual(stream.method_calls[-2:],
+                         [mock.call.stop_stream(), mock.call.close()])
+        audio.terminate.assert_not_called()
+
+        sink.play_wav(self.second)
+        self.assertEqual(audio.open.call_count, 2)
+
+    def test_close(self, mock_pyaudio):
+        sink = AudioSink()
+        sink.play_wav(self.first)
+        sink.close()
+        audio = mock_pyaudio.return_value
+        audio.open.return_value.close.assert_called_once_with()
+        audio.terminate.assert_called_once_with()
+        sink.play_wav(self.second)
+        self.assertEqual(audio.open.call_count, 2)
@@ -0,0 +1,90 @@
+import time
+import unittest
+from queue import Queue
+from threading import Event, Thread
+
+from mycroft.audio.synthesis import SynthesisPipeline, create_executor
+
+
+class MockTTS:
+    def __init__(self, delays=None):
+        self.queue = Queue()
+        self.delays = delays or {}
+        self.synthesized = []
+
+    def synthesize(self, sentence):
+        time.sleep(self.delays.get(sentence, 0))
+        if sentence == 'fail':
+            raise ValueError(sentence)
+        self.synthesized.append(sentence)
+        yield 'wav', sentence + '.wav', None
+
+
+def queued(tts):
+    items = []
+    while not tts.queue.empty():
+        items.append(tts.queue.get())
+    return items
+
+
+class TestSynthesisPipeline(unittest.TestCase):
+    def setUp(self):
+        self.executor = create_executor(2)
+        self.addCleanup(self.executor.shutdown)
+
+    def test_order(self):
+        # Later sentences finish first but are queued in order
+        tts = MockTTS({'a': 0.2, 'b': 0.1})
+        pipeline = SynthesisPipeline(tts, self.executor, lookahead=2)
+        pipeline.speak(['a', 'b', 'c', 'd'], 'ident')
+        self.assertEqual(queued(tts),
+                         [('wav', s + '.wav', None, 'ident')
+                          for s in 'abcd'])
+
+    def test_lookahead(self):
+        tts = MockTTS({'a': 0.3})
+        pipeline = SynthesisPipeline(tts, self.executor, lookahead=2)
+        t = Thread(target=pipeline.speak, args=(['a', 'b', 'c', 'd'], 1))
+        t.start()
+        time.sleep(0.15)
+        # b and c are ready while a is still being synthesized
+        self.assertEqual(tts.synthesized, ['b', 'c'])
+        self.assertTrue(tts.queue.empty())
+        t.join()
+        self.assertEqual(len(queued(tts)), 4)
+
+    def test_error(self):
+        errors = []
+        tts = MockTTS()
+        pipeline = SynthesisPipeline(tts, self.executor)
+        pipeline.speak(['a', 'fail', 'b'], 1,
+                       on_error=lambda s, e: errors.append(s))
+        self.assertEqual(errors, ['fail'])
+        self.assertEqual([i[1] for i in queued(tts)], ['a.wav', 'b.wav'])
+
+    def test_cancel(self):
+        tts = MockTTS({'a': 0.1, 'b': 0.5})
+        pipeline = SynthesisPipeline(tts, self.executor, lookahead=1)
+        done = Event()
+
+        def speak():
+            pipeline.speak(['a', 'b', 'c', 'd'], 1)
+            done.set()
+
+        Thread(target=speak).start()
+        time.sleep(0.2)
+        pipeline.cancel()
+        # The pipeline returns without waiting for b to finish
+        self.assertTrue(done.wait(0.2))
+        self.assertTrue(pipeline.cancelled)
+        self.assertEqual([i[1] for i in queued(tts)], ['a.wav'])
+        time.sleep(0.5)
+        self.assertNotIn('d', tts.synthesized)
+
+    def test_should_stop(self):
+        tts = MockTTS()
+        pipeline = SynthesisPipeline(tts, self.executor)
+        pipeline.speak(['a', 'b', 'c'], 1,
+                       should_stop=lambda: not tts.queue.empty())
+        self.assertEqual([i[1] for i in queued(tts)], ['a.wav'])
+        self.assertTrue(pipeline.cancelled)
@@ -0,0 +1,65 @@
+# Copyright 2019 Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import unittest
+
+from mycroft.client.speech.audio_buffer import CyclicAudioBuffer
+
+
+class TestCyclicAudioBuffer(unittest.TestCase):
+    def test_fill(self):
+        buf = CyclicAudioBuffer(10, b'ab')
+        self.assertEqual(len(buf), 2)
+        buf.append(b'cde')
+        self.assertEqual(buf.get(), b'abcde')
+        self.assertEqual(bytes(buf.window(2)), b'de')
+        self.assertEqual(bytes(buf.window(100)), b'abcde')
+
+    def test_wrap(self):
+        buf = CyclicAudioBuffer(8)
+        reference = b''
+        for i in range(50):
+            chunk = bytes([i % 256] * 3)
+            buf.append(chunk)
+            reference = (reference + chunk)[-8:]
+            self.assertEqual(buf.get(), reference)
+            self.assertEqual(bytes(buf.window(5)), reference[-5:])
+
+    def test_large_chunk(self):
+        buf = CyclicAudioBuffer(4, b'xy')
+        buf.append(b'0123456789')
+        self.assertEqual(buf.get(), b'6789')
+
+    def test_padding(self):
+        buf = CyclicAudioBuffer(6, padding=2)
+        for i in range(20):
+            buf.append(bytes([i + 1] * 2))
+            window = buf.window(4, padding=2)
+            self.assertEqual(bytes(window),
+                             bytes([i, i, i + 1, i + 1, 0, 0])
+                             if i else bytes([1, 1, 0, 0]))
+            # Padding doesn't corrupt the buffered audio
+            expected = b''.join(bytes([j + 1] * 2)
+                                for j in range(max(i - 2, 0), i + 1))
+            self.assertEqual(buf.get(), expected)
+
+    def test_padding_limit(self):
+        buf = CyclicAudioBuffer(6, padding=2)
+        with self.assertRaises(ValueError):
+            buf.window(2, padding=3)
+
+    def test_view(self):
+        buf = CyclicAudioBuffer(6)
+        buf.append(b'abc')
+        self.assertIsInstance(buf.window(), memoryview)
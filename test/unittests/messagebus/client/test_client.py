@@ -12,9 +12,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
+from threading import Thread
 from unittest.mock import patch
 
+from mycroft.messagebus import Message
 from mycroft.messagebus.client import MessageBusClient
+from mycroft.messagebus.client.client import PendingRequests, REQUEST_ID
 
 WS_CONF = {
     'websocket': {
@@ -37,3 +40,79 @@ class TestMessageBusClient:
     def test_create_client(self, mock_conf):
         mc = MessageBusClient()
         assert mc.client.url == 'ws://testhost:1337/core'
+
+
+class TestPendingRequests:
+    def test_match_request_id(self):
+        pending = PendingRequests()
+        first = pending.add('test.response', 'a')
+        second = pending.add('test.response', 'b')
+        reply = Message('test.response', context={REQUEST_ID: 'b'})
+        assert pending.resolve(reply)
+        assert second.result(0) is reply
+        assert not first.done()
+
+    def test_foreign_request_id_is_ignored(self):
+        pending = PendingRequests()
+        future = pending.add('test.response', 'a')
+        reply = Message('test.response', context={REQUEST_ID: 'other'})
+        assert not pending.resolve(reply)
+        assert not future.done()
+
+    def test_uncorrelated_reply_resolves_oldest(self):
+        pending = PendingRequests()
+        first = pending.add('test.response', 'a')
+        second = pending.add('test.response', 'b')
+        assert pending.resolve(Message('test.response'))
+        assert first.done()
+        assert not second.done()
+
+    def test_discard(self):
+        pending = PendingRequests()
+        future = pending.add('test.response', 'a')
+        pending.discard(future)
+        assert not pending.resolve(Message('test.response'))
+
+
+@patch('mycroft.configuration.Configuration.get', return_value=WS_CONF)
+class TestWaitForResponse:
+    @staticmethod
+    def create_client():
+        """Create client with emit() answering directly through the bus."""
+        client = MessageBusClient()
+
+        def emit(message):
+            reply = message.response({'value': message.data['value']})
+            Thread(target=client.on_message, args=(reply.serialize(),),
+                   daemon=True).start()
+
+        client.emit = emit
+        return client
+
+    def test_response(self, _):
+        client = self.create_client()
+        reply = client.wait_for_response(Message('test', {'value': 1}))
+        assert reply.data['value'] == 1
+
+    def test_timeout(self, _):
+        client = MessageBusClient()
+        client.emit = lambda message: None
+        reply = client.wait_for_response(Message('test'), timeout=0.1)
+        assert reply is None
+        assert not client.pending.resolve(Message('test.response'))
+
+    def test_concurrent_requests(self, _):
+        client = self.create_client()
+        results = {}
+
+        def request(value):
+            reply = client.wait_for_response(Message('test',
+                                                     {'value': value}))
+            results[value] = reply.data['value']
+
+        threads = [Thread(target=request, args=(i,)) for i in range(10)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert results == {i: i for i in range(10)}
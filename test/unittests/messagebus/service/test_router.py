@@ -0,0 +1,66 @@
+# Copyright 2019 Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from mycroft.messagebus.service.router import MessageRouter
+
+
+class TestMessageRouter:
+    def setup(self):
+        self.router = MessageRouter()
+        self.router.add_client('cli')
+        self.router.add_client('gui')
+        self.router.add_client('skills')
+
+    def test_broadcast_without_subscriptions(self):
+        assert self.router.recipients('speak') == ['cli', 'gui', 'skills']
+
+    def test_exact_type(self):
+        self.router.subscribe('gui', types=['gui.value.set'])
+        assert self.router.recipients('gui.value.set') == ['cli', 'gui',
+                                                           'skills']
+        assert self.router.recipients('gui.value') == ['cli', 'skills']
+        assert self.router.recipients('gui.value.set.x') == ['cli', 'skills']
+
+    def test_prefix(self):
+        self.router.subscribe('skills', prefixes=['mycroft.skills.'])
+        assert 'skills' in self.router.recipients('mycroft.skills.loaded')
+        assert 'skills' not in self.router.recipients('enclosure.mouth.viseme')
+        assert 'skills' not in self.router.recipients('mycroft.skills')
+
+    def test_empty_prefix_matches_everything(self):
+        self.router.subscribe('gui', prefixes=[''])
+        assert 'gui' in self.router.recipients('enclosure.mouth.viseme')
+
+    def test_cache_invalidated_on_subscribe(self):
+        assert 'gui' in self.router.recipients('speak')
+        self.router.subscribe('gui', types=['gui.event'])
+        assert 'gui' not in self.router.recipients('speak')
+        self.router.subscribe('gui', types=['speak'])
+        assert 'gui' in self.router.recipients('speak')
+
+    def test_unsubscribe(self):
+        self.router.subscribe('gui', types=['a', 'b'], prefixes=['c.'])
+        self.router.unsubscribe('gui', types=['a'])
+        assert 'gui' not in self.router.recipients('a')
+        assert 'gui' in self.router.recipients('b')
+        assert 'gui' in self.router.recipients('c.d')
+        # Remove all subscriptions, back to receiving everything
+        self.router.unsubscribe('gui')
+        assert 'gui' in self.router.recipients('a')
+
+    def test_remove_client(self):
+        self.router.subscribe('gui', types=['a'])
+        self.router.remove_client('gui')
+        assert self.router.recipients('a') == ['cli', 'skills']
+        assert self.router.clients == ['cli', 'skills']
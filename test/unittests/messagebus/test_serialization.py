@@ -0,0 +1,80 @@
+# Copyright 2019 Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from unittest.mock import Mock
+
+from mycroft.messagebus.message import Message, LazyMessage
+from mycroft.messagebus.serialization import (
+    available_formats, deserialize, detect_serializer, get_serializer,
+    select_format, JsonSerializer, FramedSerializer
+)
+
+
+def create_message():
+    return Message('test.type', {'utterance': 'hello', 'n': [1, 2]},
+                   {'source': 'test'})
+
+
+class TestSerialization:
+    def test_json_is_default(self):
+        assert get_serializer(None) is JsonSerializer
+        assert get_serializer('unknown') is JsonSerializer
+        assert select_format(['unknown']) == 'json'
+        assert select_format(['unknown', 'framed']) == 'framed'
+
+    def test_json_round_trip(self):
+        msg = create_message()
+        data = get_serializer('json').serialize(msg)
+        assert data == msg.serialize()
+        assert detect_serializer(data) is JsonSerializer
+        parsed = deserialize(data)
+        assert parsed.msg_type == msg.msg_type
+        assert parsed.data == msg.data
+
+    def test_framed_round_trip(self):
+        for name in available_formats():
+            msg = create_message()
+            data = get_serializer(name).serialize(msg)
+            parsed = deserialize(data)
+            assert parsed.msg_type == msg.msg_type
+            assert parsed.context == msg.context
+            assert parsed.data == msg.data
+
+    def test_framed_data_is_lazy(self):
+        data = FramedSerializer.serialize(create_message())
+        loads = Mock(wraps=FramedSerializer.loads)
+        parsed = FramedSerializer.deserialize(data)
+        parsed._loads = loads
+        assert parsed.msg_type == 'test.type'
+        loads.assert_not_called()
+        # Relaying reuses the raw payload
+        assert FramedSerializer.serialize(parsed) == data
+        loads.assert_not_called()
+        assert parsed.data['utterance'] == 'hello'
+        loads.assert_called_once()
+
+    def test_lazy_message_to_json(self):
+        msg = create_message()
+        parsed = deserialize(FramedSerializer.serialize(msg))
+        # Conversion to json doesn't decode the data
+        assert parsed.serialize() == msg.serialize()
+        assert parsed.raw_data is not None
+
+    def test_lazy_message_modified_data(self):
+        lazy = LazyMessage('test', '{"a": 1}')
+        lazy.data['b'] = 2
+        assert lazy.raw_data is None
+        assert Message.deserialize(lazy.serialize()).data == {'a': 1, 'b': 2}
+        lazy.data = None
+        assert lazy.data == {}
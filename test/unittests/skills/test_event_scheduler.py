@@ -4,6 +4,7 @@
 
 import unittest
 import time
+from tempfile import TemporaryDirectory
 
 from unittest.mock import MagicMock, patch
 from mycroft.skills.event_scheduler import EventScheduler
@@ -98,3 +99,69 @@ class TestEventScheduler(unittest.TestCase):
         self.assertEquals(emitter.emit.call_args[0][0].msg_type, 'test')
         self.assertEquals(emitter.emit.call_args[0][0].data, {})
         es.shutdown()
+
+    @patch('threading.Thread')
+    @patch('json.load')
+    @patch('json.dump')
+    @patch('builtins.open')
+    def test_wakeup(self, mock_open, mock_dump, mock_load, mock_thread):
+        """
+            Test that the scheduler thread wakes up when an event is due.
+        """
+        mock_load.return_value = ''
+        mock_open.return_value = MagicMock()
+        emitter = MagicMock()
+        es = EventScheduler(emitter)
+
+        es.schedule_event('test', time.time() + 0.2, None)
+        es.schedule_event('test-removed', time.time() + 0.1, None)
+        es.remove_event('test-removed')
+        time.sleep(0.4)
+        emitter.emit.assert_called_once()
+        self.assertEquals(emitter.emit.call_args[0][0].msg_type, 'test')
+        self.assertTrue('test' not in es.events)
+        es.shutdown()
+
+    @patch('threading.Thread')
+    @patch('json.load')
+    @patch('json.dump')
+    @patch('builtins.open')
+    def test_repeat(self, mock_open, mock_dump, mock_load, mock_thread):
+        """
+            Test that repeating events are rescheduled.
+        """
+        mock_load.return_value = ''
+        mock_open.return_value = MagicMock()
+        emitter = MagicMock()
+        es = EventScheduler(emitter)
+
+        es.schedule_event('test-repeat', time.time() + 0.1, 0.2)
+        time.sleep(0.45)
+        self.assertEquals(emitter.emit.call_count, 2)
+        self.assertTrue('test-repeat' in es.events)
+        es.shutdown()
+
+    def test_journal_replay(self):
+        """
+            Test that events survive a crash through the journal.
+        """
+        with TemporaryDirectory() as data_dir:
+            config = {'data_dir': data_dir}
+            with patch('mycroft.skills.event_scheduler.Configuration.get',
+                       return_value=config):
+                es = EventScheduler(MagicMock())
+                es.schedule_event('test', 900000000000, None, {'a': 1})
+                es.schedule_event('test-2', 900000000000, None)
+                es.schedule_event('test-repeat', 900000000000, 60)
+                es.update_event('test', {'a': 2})
+                es.remove_event('test-2')
+                # Stop the thread without storing the schedule
+                es.is_running = False
+                with es.schedule_changed:
+                    es.schedule_changed.notify()
+                es.join()
+
+                es = EventScheduler(MagicMock())
+                self.assertEquals(es.events,
+                                  {'test': [(900000000000, None, {'a': 2})]})
+                es.shutdown()
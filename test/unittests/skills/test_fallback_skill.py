@@ -0,0 +1,137 @@
+# Copyright 2019 Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import time
+import unittest
+from threading import Lock
+from unittest.mock import MagicMock, patch
+
+from mycroft.messagebus.message import Message
+from mycroft.skills.fallback_skill import FallbackSkill
+
+
+def make_fallback(name, result, delay=0, calls=None):
+    def fallback(message):
+        if calls is not None:
+            calls.append(name)
+        time.sleep(delay)
+        return result
+    fallback.__name__ = name
+    return fallback
+
+
+class FallbackDispatchTest(unittest.TestCase):
+    def setUp(self):
+        patcher = patch.multiple(FallbackSkill, fallback_handlers={},
+                                 fallback_timeouts={},
+                                 fallback_speculative={}, fallback_table=(),
+                                 fallback_lock=Lock(), fallback_latencies={})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.bus = MagicMock()
+
+    def dispatch(self, mode='sequential', timeout=None):
+        config = {'skills': {'fallback': {'mode': mode,
+                                          'timeout': timeout}}}
+        with patch('mycroft.skills.fallback_skill.Configuration.get',
+                   return_value=config):
+            handler = FallbackSkill.make_intent_failure_handler(self.bus)
+        handler(Message('intent_failure', {'utterance': 'hello'}))
+        complete = self.bus.emit.call_args_list[-1][0][0]
+        return complete.data.get('fallback_handler')
+
+    def test_priority_order(self):
+        calls = []
+        FallbackSkill._register_fallback(make_fallback('c', True,
+                                                       calls=calls), 50)
+        FallbackSkill._register_fallback(make_fallback('a', False,
+                                                       calls=calls), 10)
+        FallbackSkill._register_fallback(make_fallback('b', True,
+                                                       calls=calls), 10)
+        self.assertEqual([p for p, _, _, _ in FallbackSkill.fallback_table],
+                         [10, 11, 50])
+        self.assertEqual(self.dispatch(), 'b')
+        self.assertEqual(calls, ['a', 'b'])
+
+    def test_no_fallback(self):
+        FallbackSkill._register_fallback(make_fallback('a', False), 10)
+        self.assertIsNone(self.dispatch())
+        types = [c[0][0].msg_type for c in self.bus.emit.call_args_list]
+        self.assertIn('complete_intent_failure', types)
+
+    def test_timeout(self):
+        FallbackSkill._register_fallback(make_fallback('slow', True, 0.5), 10,
+                                         timeout=0.05)
+        FallbackSkill._register_fallback(make_fallback('fast', True), 20)
+        self.assertEqual(self.dispatch(), 'fast')
+
+    def test_default_timeout(self):
+        FallbackSkill._register_fallback(make_fallback('slow', True, 0.5), 10)
+        FallbackSkill._register_fallback(make_fallback('fast', True), 20)
+        self.assertEqual(self.dispatch(timeout=0.05), 'fast')
+
+    def test_parallel(self):
+        calls = []
+        FallbackSkill._register_fallback(
+            make_fallback('slow', False, 0.2, calls), 10, speculative=True)
+        FallbackSkill._register_fallback(
+            make_fallback('fast', True, 0, calls), 20, speculative=True)
+        start = time.time()
+        self.assertEqual(self.dispatch('parallel'), 'fast')
+        # Both handlers ran at the same time
+        self.assertLess(time.time() - start, 0.35)
+        self.assertEqual(sorted(calls), ['fast', 'slow'])
+
+    def test_parallel_priority(self):
+        FallbackSkill._register_fallback(make_fallback('slow', True, 0.1), 10,
+                                         speculative=True)
+        FallbackSkill._register_fallback(make_fallback('fast', True), 20,
+                                         speculative=True)
+        self.assertEqual(self.dispatch('parallel'), 'slow')
+
+    def test_parallel_not_speculative(self):
+        calls = []
+        FallbackSkill._register_fallback(
+            make_fallback('first', True, 0.1, calls), 1, speculative=True)
+        FallbackSkill._register_fallback(
+            make_fallback('unknown', True, 0, calls), 100)
+        self.assertEqual(self.dispatch('parallel'), 'first')
+        time.sleep(0.1)
+        # The consumed utterance never reaches the other handler
+        self.assertEqual(calls, ['first'])
+
+    def test_parallel_speculative_activation(self):
+        skill = FallbackSkill(use_settings=False)
+        skill.make_active = MagicMock()
+        skill.register_fallback(make_fallback('first', True, 0.1), 1)
+        skill.register_fallback(make_fallback('lookup', True), 50,
+                                speculative=True)
+        self.assertEqual(self.dispatch('parallel'), 'first')
+        # Only the winner activates the skill
+        skill.make_active.assert_called_once_with()
+
+    def test_remove_fallback(self):
+        handler = make_fallback('a', True)
+        FallbackSkill._register_fallback(handler, 10)
+        FallbackSkill.remove_fallback(handler)
+        self.assertEqual(FallbackSkill.fallback_table, ())
+        self.assertIsNone(self.dispatch())
+
+    def test_latency_stats(self):
+        FallbackSkill._register_fallback(make_fallback('a', False), 10)
+        self.dispatch()
+        self.dispatch()
+        stats = FallbackSkill.fallback_stats()
+        self.assertEqual(stats['a']['count'], 2)
+        self.assertEqual(stats['a']['buckets']['<=0.01'], 2)
@@ -12,9 +12,16 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
+import sys
+import time
 import unittest
+from threading import Event, Thread
+from unittest.mock import MagicMock, patch
 
-from mycroft.skills.intent_service import ContextManager
+from mycroft.messagebus.message import Message
+from mycroft.skills.intent_service import (AdaptIntent, ContextManager,
+                                           ConverseSession, IntentCache,
+                                           IntentService)
 
 
 class MockEmitter(object):
@@ -67,6 +74,340 @@ class ContextManagerTest(unittest.TestCase):
         self.context_manager.remove_context('TestContext')
         self.assertEqual(len(self.context_manager.frame_stack), 0)
 
+    def inject(self, word, context, origin=''):
+        self.context_manager.inject_context({'confidence': 1.0,
+                                             'data': [(word, context)],
+                                             'match': word, 'key': word,
+                                             'origin': origin})
+
+    def test_latest_keyword(self):
+        self.inject('first', 'A')
+        self.inject('other', 'B')
+        self.inject('second', 'A')
+        context = self.context_manager.get_context()
+        self.assertEqual([e['key'] for e in context], ['second', 'other'])
+
+    def test_depth_decay(self):
+        self.inject('c', 'C', 'skill')
+        self.inject('b', 'B', 'skill')
+        self.inject('a', 'A', 'skill')
+        self.inject('z', 'Z', '')
+        context = self.context_manager.get_context()
+        self.assertEqual([e['confidence'] for e in context],
+                         [1 / 2.0, 1 / 3.0, 1 / 4.0, 1 / 4.0])
+
+    def test_max_frames(self):
+        self.inject('b', 'B')
+        self.inject('a', 'A')
+        context = self.context_manager.get_context(max_frames=1)
+        self.assertEqual([e['key'] for e in context], ['a'])
+
+    def test_missing_entities(self):
+        self.inject('b', 'B')
+        self.inject('a', 'A')
+        context = self.context_manager.get_context(missing_entities=['B'])
+        self.assertEqual([e['key'] for e in context], ['b'])
+        self.assertEqual(context[0]['confidence'], 1 / 3.0)
+
+    def test_expiry(self):
+        with patch('mycroft.skills.intent_service.time.monotonic') as now:
+            now.return_value = 0
+            self.inject('a', 'A')
+            now.return_value = 100
+            self.inject('b', 'B')
+            fingerprint = self.context_manager.fingerprint()
+            now.return_value = 200
+            self.assertEqual([e['key'] for e in
+                              self.context_manager.get_context()], ['b'])
+            self.assertEqual(len(self.context_manager.frame_stack), 1)
+            self.assertNotIn('A', self.context_manager.keywords)
+            self.assertNotEqual(self.context_manager.fingerprint(),
+                                fingerprint)
+
+    def test_remove_keeps_other_context(self):
+        self.inject('b', 'B', 'skill')
+        self.inject('a', 'A', 'skill')
+        self.inject('c', 'C', 'other')
+        self.context_manager.remove_context('A')
+        context = self.context_manager.get_context()
+        self.assertEqual([(e['key'], e['confidence']) for e in context],
+                         [('c', 1 / 2.0), ('b', 1 / 3.0)])
+
+    def test_max_frames_after_remove(self):
+        self.inject('c', 'C')
+        self.inject('b', 'B')
+        self.inject('a', 'A')
+        self.context_manager.remove_context('B')
+        # c is within the last two frames remaining on the stack
+        context = self.context_manager.get_context(max_frames=2)
+        self.assertEqual([e['key'] for e in context], ['a', 'c'])
+        self.inject('d', 'D')
+        context = self.context_manager.get_context(max_frames=2)
+        self.assertEqual([e['key'] for e in context], ['d', 'a'])
+
+
+class ConverseSessionTest(unittest.TestCase):
+    def test_priority_order(self):
+        session = ConverseSession(['a', 'b', 'c'])
+        session.set_result('c', True)
+        session.set_result('b', True)
+        session.set_result('a', False)
+        self.assertEqual(session.wait(1), 'b')
+
+    def test_all_decline(self):
+        session = ConverseSession(['a', 'b'])
+        session.set_result('a', False)
+        session.set_result('b', False)
+        self.assertIsNone(session.wait(1))
+
+    def test_wait_for_higher_priority(self):
+        session = ConverseSession(['a', 'b'])
+        session.set_result('b', True)
+
+        def answer():
+            time.sleep(0.1)
+            session.set_result('a', True)
+        Thread(target=answer).start()
+        self.assertEqual(session.wait(1), 'a')
+
+    def test_timeout_counts_as_decline(self):
+        session = ConverseSession(['a', 'b'])
+        session.set_result('b', True)
+        start = time.monotonic()
+        self.assertEqual(session.wait(0.1), 'b')
+        self.assertLess(time.monotonic() - start, 0.5)
+
+
+class ConverseBus:
+    """Bus answering converse requests from a set of accepting skills."""
+    def __init__(self, accepting, delays=None):
+        self.accepting = accepting
+        self.delays = delays or {}
+        self.service = None
+        self.requests = []
+
+    def on(self, msg_type, handler):
+        pass
+
+    def emit(self, message):
+        if message.msg_type != 'skill.converse.request':
+            return
+        skill_id = message.data['skill_id']
+        self.requests.append(skill_id)
+
+        def answer():
+            time.sleep(self.delays.get(skill_id, 0))
+            self.service.handle_converse_response(message.reply(
+                'skill.converse.response',
+                {'skill_id': skill_id,
+                 'result': skill_id in self.accepting}))
+        Thread(target=answer).start()
+
+
+class ParallelConverseTest(unittest.TestCase):
+    def create_service(self, bus):
+        config = {'skills': {'converse': {'mode': 'parallel',
+                                          'timeout': 2}}}
+        with patch('mycroft.skills.intent_service.Configuration.get',
+                   return_value=config):
+            service = IntentService(bus)
+        bus.service = service
+        for skill_id in ('c', 'b', 'a'):
+            service.add_active_skill(skill_id)
+        return service
+
+    def test_highest_priority_wins(self):
+        bus = ConverseBus(['b', 'c'])
+        service = self.create_service(bus)
+        self.assertTrue(service._converse(['hello'], 'en-us'))
+        self.assertEqual(service.active_skills[0][0], 'b')
+
+    def test_requests_are_concurrent(self):
+        bus = ConverseBus(['c'], delays={'a': 0.3, 'b': 0.3, 'c': 0.3})
+        service = self.create_service(bus)
+        start = time.monotonic()
+        self.assertTrue(service._converse(['hello'], 'en-us'))
+        self.assertLess(time.monotonic() - start, 0.8)
+        self.assertEqual(sorted(bus.requests), ['a', 'b', 'c'])
+
+    def test_no_skill_accepts(self):
+        bus = ConverseBus([])
+        service = self.create_service(bus)
+        self.assertFalse(service._converse(['hello'], 'en-us'))
+
+
+class MatchIntentsTest(unittest.TestCase):
+    def create_service(self, parallel=False):
+        config = {'padatious': {'parallel_match': parallel}}
+        with patch('mycroft.skills.intent_service.Configuration.get',
+                   return_value=config):
+            service = IntentService(MagicMock())
+        for word in ('time', 'what'):
+            service.engine.register_entity(word, 'TimeKeyword')
+        service.engine.register_intent_parser(
+            AdaptIntent('TimeIntent').require('TimeKeyword').build())
+        return service
+
+    def padatious(self, confidences):
+        padatious = MagicMock()
+
+        def calc_intent(utt):
+            if utt not in confidences:
+                return None
+            return MagicMock(conf=confidences[utt], name=utt)
+
+        padatious.calc_intent.side_effect = calc_intent
+        return padatious
+
+    def test_adapt_evaluates_each_text_once(self):
+        service = self.create_service()
+        with patch.object(service.engine, 'determine_intent',
+                          wraps=service.engine.determine_intent) as det:
+            matches = service.match_intents(['What time', 'what time'],
+                                            ['what time', 'what time'])
+        self.assertEqual(det.call_count, 1)
+        self.assertEqual([m.engine for m in matches], ['adapt'] * 4)
+        self.assertEqual(matches[0].intent['utterance'], 'What time')
+        self.assertEqual(matches[0].intent['intent_type'], 'TimeIntent')
+
+    def test_ranked_candidates(self):
+        for parallel in (False, True):
+            service = self.create_service(parallel)
+            padatious = self.padatious({'time': 0.99, 'hello': 0.5})
+            with patch('mycroft.skills.intent_service.PadatiousService.'
+                       'instance', padatious):
+                matches = service.match_intents(['time', 'hello'],
+                                                ['time', 'hello'])
+            self.assertEqual([m.engine for m in matches],
+                             ['adapt', 'adapt', 'padatious', 'padatious'])
+            self.assertEqual([m.utterance for m in matches],
+                             ['time', 'time', 'time', 'hello'])
+            confidences = [m.confidence for m in matches]
+            self.assertEqual(confidences, sorted(confidences, reverse=True))
+
+    def test_no_padatious(self):
+        service = self.create_service()
+        with patch('mycroft.skills.intent_service.PadatiousService.'
+                   'instance', None):
+            matches = service.match_intents(['hello'], ['hello'])
+        self.assertEqual(matches, [])
+
+
+class IntentCacheTest(unittest.TestCase):
+    def test_lru(self):
+        cache = IntentCache(max_size=2)
+        cache.put('a', [1], 0.1)
+        cache.put('b', [2], 0.1)
+        self.assertEqual(cache.get('a'), [1])
+        cache.put('c', [3], 0.1)
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual(cache.get('a'), [1])
+        self.assertEqual(cache.get('c'), [3])
+        self.assertEqual(cache.hits, 3)
+        self.assertEqual(cache.misses, 1)
+        self.assertAlmostEqual(cache.saved_time, 0.3)
+
+    def test_copy(self):
+        cache = IntentCache()
+        cache.put('a', [{'x': 1}], 0.1)
+        cache.get('a')[0]['x'] = 2
+        self.assertEqual(cache.get('a'), [{'x': 1}])
+
+    def test_disabled(self):
+        cache = IntentCache(max_size=0)
+        cache.put('a', [1], 0.1)
+        self.assertIsNone(cache.get('a'))
+        cache = IntentCache()
+        cache.put(None, [1], 0.1)
+        self.assertIsNone(cache.get(None))
+
+    def test_clear_during_lookups(self):
+        cache = IntentCache(max_size=4)
+        errors = []
+        done = Event()
+
+        def lookup():
+            try:
+                for i in range(10000):
+                    key = i % 6
+                    if cache.get(key) is None:
+                        cache.put(key, [key], 0.0)
+            except Exception as e:
+                errors.append(e)
+
+        def invalidate():
+            while not done.is_set():
+                cache.clear()
+
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        self.addCleanup(sys.setswitchinterval, interval)
+        invalidator = Thread(target=invalidate)
+        invalidator.start()
+        lookups = [Thread(target=lookup) for _ in range(4)]
+        for thread in lookups:
+            thread.start()
+        for thread in lookups:
+            thread.join()
+        done.set()
+        invalidator.join()
+
+        self.assertEqual(errors, [])
+        self.assertEqual(cache.hits + cache.misses, 4 * 10000)
+        self.assertLessEqual(len(cache.entries), 4)
+
+
+class CachedUtteranceTest(unittest.TestCase):
+    def setUp(self):
+        config = {'skills': {'intent_cache': {'max_size': 10}}}
+        with patch('mycroft.skills.intent_service.Configuration.get',
+                   return_value=config):
+            self.service = IntentService(MagicMock())
+        self.service.engine.register_entity('time', 'TimeKeyword')
+        self.service.engine.register_intent_parser(
+            AdaptIntent('TimeIntent').require('TimeKeyword').build())
+        for patcher in (patch('mycroft.skills.intent_service.'
+                              'PadatiousService.instance', None),
+                        patch('mycroft.skills.intent_service.report_timing'),
+                        patch.object(self.service, '_converse',
+                                     return_value=False)):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def utterance(self, text='time'):
+        with patch.object(self.service, 'match_intents',
+                          wraps=self.service.match_intents) as match:
+            self.service.handle_utterance(Message('recognizer_loop:utterance',
+                                                  {'utterances': [text]}))
+        reply = self.service.bus.emit.call_args[0][0]
+        return match.called, reply
+
+    def test_cache_hit(self):
+        matched, reply = self.utterance()
+        self.assertTrue(matched)
+        self.assertEqual(reply.msg_type, 'TimeIntent')
+        matched, reply = self.utterance()
+        self.assertFalse(matched)
+        self.assertEqual(reply.msg_type, 'TimeIntent')
+        self.assertEqual(reply.data['utterance'], 'time')
+        self.assertEqual(self.service.intent_cache.hits, 1)
+
+    def test_invalidated_by_registration(self):
+        self.utterance()
+        self.service.handle_detach_intent(
+            Message('detach_intent', {'intent_name': 'TimeIntent'}))
+        matched, reply = self.utterance()
+        self.assertTrue(matched)
+        self.assertEqual(reply.msg_type, 'intent_failure')
+
+    def test_invalidated_by_context(self):
+        self.utterance()
+        self.service.handle_add_context(
+            Message('add_context', {'context': 'TimeKeyword',
+                                    'word': 'time'}))
+        matched, _ = self.utterance()
+        self.assertTrue(matched)
+
 
 if __name__ == '__main__':
     unittest.main()
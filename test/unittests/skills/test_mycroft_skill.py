@@ -26,7 +26,8 @@ import json
 from mycroft.configuration import Configuration
 from mycroft.messagebus.message import Message
 from mycroft.skills.skill_data import (load_regex_from_file, load_regex,
-                                       load_vocabulary, read_vocab_file)
+                                       load_vocabulary, read_vocab_file,
+                                       VocabularyMatcher)
 from mycroft.skills.core import MycroftSkill, resting_screen_handler
 from mycroft.skills.intent_service import open_intent_envelope
 
@@ -541,6 +542,37 @@ class MycroftSkillTest(unittest.TestCase):
         self.assertFalse(s.voc_match("My hovercraft is full of eels",
                                      "turn_off_test"))
 
+    def test_voc_search(self):
+        s = SimpleSkill1()
+        s.root_dir = abspath(dirname(__file__))
+
+        match = s.voc_search("please switch off the lights", "turn_off_test")
+        self.assertEqual(match, ('switch off', 7, 17))
+        self.assertIsNone(s.voc_search("return office", "turn_off_test"))
+        self.assertIsNone(s.voc_search("", "turn_off_test"))
+
+        # The compiled vocabulary is shared between skill instances
+        other = SimpleSkill1()
+        other.root_dir = s.root_dir
+        other.voc_match("turn off", "turn_off_test")
+        self.assertIs(other.voc_match_cache['en-usturn_off_test'],
+                      s.voc_match_cache['en-usturn_off_test'])
+
+
+class VocabularyMatcherTest(unittest.TestCase):
+    def test_longest_word(self):
+        matcher = VocabularyMatcher(['off', 'turn off', 'turn'])
+        self.assertEqual(matcher.search('please turn off it'),
+                         ('turn off', 7, 15))
+
+    def test_literal_words(self):
+        matcher = VocabularyMatcher(['e.t.a'])
+        self.assertEqual(matcher.search('what is the e.t.a').word, 'e.t.a')
+        self.assertIsNone(matcher.search('what is the exta'))
+
+    def test_empty(self):
+        self.assertIsNone(VocabularyMatcher([]).search('anything'))
+
 
 class _TestSkill(MycroftSkill):
     def __init__(self):
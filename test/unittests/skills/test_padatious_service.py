@@ -0,0 +1,117 @@
+# Copyright 2019 Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import tempfile
+import unittest
+from os.path import join
+from shutil import rmtree
+from unittest.mock import MagicMock, patch
+
+from mycroft.messagebus.message import Message
+from mycroft.skills.padatious_service import PadatiousService
+
+
+class MockMatch:
+    def __init__(self, name, conf):
+        self.name = name
+        self.conf = conf
+        self.matches = {}
+
+
+class MockContainer:
+    """Container recording what was loaded and trained."""
+    trained = []  # Names trained by every container
+
+    def __init__(self, cache):
+        self.intents = MagicMock(objects_to_train=[])
+        self.entities = MagicMock(objects_to_train=[])
+        self.names = []
+
+    def load_intent(self, name, file_name):
+        self.names.append(name)
+        self.intents.objects_to_train.append(name)
+
+    def load_entity(self, name, file_name):
+        self.names.append(name)
+
+    def train(self, single_thread=False):
+        MockContainer.trained.append(list(self.names))
+
+    def calc_intents(self, utt):
+        return [MockMatch(name, 0.9 if name.endswith(utt) else 0.5)
+                for name in self.names]
+
+    def calc_intent(self, utt):
+        return max(self.calc_intents(utt), key=lambda i: i.conf,
+                   default=MockMatch('', 0.0))
+
+
+class PadatiousServiceTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.addCleanup(rmtree, self.tmp)
+        self.file_name = join(self.tmp, 'test.intent')
+        with open(self.file_name, 'w') as f:
+            f.write('test\n')
+
+        config = {'padatious': {'intent_cache': self.tmp, 'train_delay': 4}}
+        MockContainer.trained = []
+        with patch('mycroft.skills.padatious_service.Configuration.get',
+                   return_value=config), \
+                patch('padatious.IntentContainer', MockContainer), \
+                patch.object(PadatiousService, 'instance', None):
+            self.service = PadatiousService(MagicMock(), MagicMock())
+        self.service._create_container = lambda: MockContainer(self.tmp)
+        self.service.schedule_training = MagicMock()
+
+    def register(self, name):
+        self.service.register_intent(Message('padatious:register_intent', {
+            'name': name, 'file_name': self.file_name}))
+
+    def test_train_in_new_container(self):
+        self.register('skill:a')
+        self.service.train()
+        first = self.service.container
+        self.assertEqual(MockContainer.trained, [['skill:a']])
+        self.assertTrue(self.service.finished_training_event.is_set())
+
+        self.register('skill:b')
+        self.assertTrue(self.service.schedule_training.called)
+        # Queries keep using the trained container until retrained
+        self.assertIs(self.service.container, first)
+        self.service.train()
+        self.assertIsNot(self.service.container, first)
+        self.assertEqual(MockContainer.trained[-1], ['skill:a', 'skill:b'])
+        self.assertEqual(self.service.train_count, 2)
+
+    def test_skip_unchanged(self):
+        self.register('skill:a')
+        self.service.train()
+        self.service.train()
+        self.assertEqual(len(MockContainer.trained), 1)
+        self.assertEqual(self.service.train_count, 1)
+        self.service.bus.emit.assert_called_once()  # mycroft.ready
+
+    def test_detached_intent_not_matched(self):
+        self.register('skill:a')
+        self.register('other:b')
+        self.service.train()
+        self.assertEqual(self.service.calc_intent('a').name, 'skill:a')
+
+        self.service.handle_detach_skill(Message('detach_skill',
+                                                 {'skill_id': 'skill'}))
+        self.assertTrue(self.service.schedule_training.called)
+        self.assertEqual(self.service.calc_intent('a').name, 'other:b')
+        self.service.train()
+        self.assertEqual(MockContainer.trained[-1], ['other:b'])
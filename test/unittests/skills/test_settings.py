@@ -14,20 +14,19 @@
 #
 import json
 import unittest
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 from os import remove
 from os.path import join, dirname
 
-from mycroft.skills.settings import SkillSettings
-
-
-SkillSettings._poll_skill_settings = MagicMock()
-SkillSettings._init_blank_meta = MagicMock()
+from mycroft.skills.settings import SettingsSync, SkillSettings
 
 
 class SkillSettingsTest(unittest.TestCase):
     def setUp(self):
+        patcher = patch('mycroft.skills.settings.settings_sync')
+        self.settings_sync = patcher.start()
+        self.addCleanup(patcher.stop)
         try:
             remove(join(dirname(__file__), 'settings', 'settings.json'))
         except OSError:
@@ -129,6 +128,108 @@ class SkillSettingsTest(unittest.TestCase):
         s.load_skill_settings_from_file()
         self.assertEqual(len(s), 1)
 
+    def test_sync_registration(self):
+        s = SkillSettings(join(dirname(__file__), 'settings'),
+                          "test-skill-settings")
+        self.settings_sync.register.assert_called_once_with(s)
+        s.run_poll()
+        self.settings_sync.sync_now.assert_called_once_with()
+        s.stop_polling()
+        self.settings_sync.unregister.assert_called_once_with(s)
+
+
+def create_settings(skill_gid, initialized=True):
+    settings = MagicMock()
+    settings.skill_gid = skill_gid
+    settings._complete_intialization = initialized
+    settings._meta_path = 'settingsmeta.json'
+    return settings
+
+
+@patch('mycroft.skills.settings.is_paired', return_value=True)
+@patch('mycroft.skills.settings.DeviceApi')
+class SettingsSyncTest(unittest.TestCase):
+    def setUp(self):
+        self.sync = SettingsSync()
+        self.skills = [create_settings('a'), create_settings('b')]
+        for settings in self.skills:
+            self.sync.skills[id(settings)] = settings
+
+    def test_sync_changed(self, mock_api, _):
+        remote = [{'identifier': 'a', 'value': 1},
+                  {'identifier': 'b', 'value': 2}, None]
+        mock_api.return_value.get_skill_settings.return_value = remote
+        self.sync.sync()
+        self.skills[0]._sync_remote.assert_called_once_with(remote[0])
+        self.skills[1]._sync_remote.assert_called_once_with(remote[1])
+        self.assertEqual(mock_api.return_value.get_skill_settings.call_count,
+                         1)
+
+        # Only skills with changed settings are updated
+        for settings in self.skills:
+            settings.reset_mock()
+        remote = [{'identifier': 'a', 'value': 1},
+                  {'identifier': 'b', 'value': 3}]
+        mock_api.return_value.get_skill_settings.return_value = remote
+        self.sync.sync()
+        self.skills[0]._sync_remote.assert_not_called()
+        self.skills[1]._sync_remote.assert_called_once_with(remote[1])
+
+    def test_sync_missing(self, mock_api, _):
+        mock_api.return_value.get_skill_settings.return_value = []
+        self.sync.sync()
+        self.sync.sync()
+        # Missing settings are uploaded until they show up on the server
+        self.assertEqual(self.skills[0]._sync_remote.call_count, 2)
+        self.skills[0]._sync_remote.assert_called_with(None)
+
+    def test_initialize(self, mock_api, _):
+        new_skill = create_settings('c', initialized=False)
+        self.sync.skills[id(new_skill)] = new_skill
+        mock_api.return_value.get_skill_settings.return_value = []
+        self.sync.sync()
+        new_skill._initialize_remote.assert_called_once_with()
+        self.skills[0]._initialize_remote.assert_not_called()
+
+    def test_not_paired(self, mock_api, mock_paired):
+        mock_paired.return_value = False
+        self.assertFalse(self.sync.sync())
+        mock_api.return_value.get_skill_settings.assert_not_called()
+        self.skills[0]._sync_remote.assert_not_called()
+
+    def test_retry_failed_update(self, mock_api, _):
+        remote = [{'identifier': 'a', 'value': 1},
+                  {'identifier': 'b', 'value': 2}]
+        mock_api.return_value.get_skill_settings.return_value = remote
+        self.skills[0]._sync_remote.return_value = False
+        self.assertFalse(self.sync.sync())
+
+        # The failed update is retried although the entry didn't change
+        self.skills[0]._sync_remote.return_value = True
+        self.assertTrue(self.sync.sync())
+        self.assertEqual(self.skills[0]._sync_remote.call_count, 2)
+        self.skills[1]._sync_remote.assert_called_once_with(remote[1])
+
+    def test_retry_initialize(self, mock_api, _):
+        new_skill = create_settings('c', initialized=False)
+        self.sync.skills[id(new_skill)] = new_skill
+        mock_api.return_value.get_skill_settings.return_value = []
+        self.assertFalse(self.sync.sync())
+
+    def test_push_retry_interval(self, mock_api, _):
+        class Stop(Exception):
+            pass
+
+        self.sync.mode = 'push'
+        self.sync._wakeup = MagicMock()
+        self.sync._wakeup.wait.side_effect = [None, None, Stop]
+        with patch.object(self.sync, 'sync', side_effect=[False, True]):
+            with self.assertRaises(Stop):
+                self.sync._run()
+        timeouts = [c[0][0] for c in self.sync._wakeup.wait.call_args_list]
+        # Wait for a push unless something needs to be retried
+        self.assertEqual(timeouts, [None, SettingsSync.retry_interval, None])
+
 
 if __name__ == '__main__':
     unittest.main()
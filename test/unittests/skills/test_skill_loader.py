@@ -16,7 +16,10 @@
 from time import time
 from unittest.mock import call, MagicMock, patch
 
-from mycroft.skills.skill_loader import _get_last_modified_time, SkillLoader
+from mycroft.skills import MycroftSkill
+from mycroft.skills.skill_loader import (
+    _get_last_modified_time, _overrides_load_data_files, SkillLoader
+)
 from ..base import MycroftUnitTestBase
 
 ONE_MINUTE = 60
@@ -132,6 +135,58 @@ class TestSkillLoader(MycroftUnitTestBase):
         ]
         self.assertListEqual(log_messages, self.log_mock.method_calls)
 
+    def test_skill_load_in_phases(self):
+        self.loader.prepare_load()
+        instance = self.loader.instance
+        self.assertFalse(self.loader.loaded)
+        self.assertFalse(instance.bind.called)
+        self.assertListEqual([], self.message_bus_mock.message_types)
+
+        self.loader.complete_load()
+        self.assertTrue(self.loader.loaded)
+        instance.bind.assert_called_once_with(self.message_bus_mock)
+        self.assertListEqual(
+            ['mycroft.skills.loaded'],
+            self.message_bus_mock.message_types
+        )
+
+    @patch(mock_package + '_overrides_load_data_files', return_value=False)
+    def test_data_files_in_phases(self, _):
+        self.loader.prepare_load()
+        instance = self.loader.instance
+        root_dir = instance.root_dir
+        instance.init_dialog.assert_called_once_with(root_dir)
+        instance.load_vocab_files.assert_not_called()
+
+        self.loader.complete_load()
+        instance.load_vocab_files.assert_called_once_with(root_dir)
+        instance.load_regex_files.assert_called_once_with(root_dir)
+        instance.load_data_files.assert_not_called()
+
+    @patch(mock_package + '_overrides_load_data_files', return_value=True)
+    def test_load_data_files_override(self, _):
+        self.loader.prepare_load()
+        instance = self.loader.instance
+        instance.init_dialog.assert_not_called()
+        instance.load_data_files.assert_not_called()
+
+        self.loader.complete_load()
+        instance.load_data_files.assert_called_once_with()
+        instance.load_vocab_files.assert_not_called()
+
+    def test_overrides_load_data_files(self):
+        class Skill(MycroftSkill):
+            pass
+
+        class CustomSkill(MycroftSkill):
+            def load_data_files(self, root_directory=None):
+                pass
+
+        skill = Skill.__new__(Skill)
+        custom_skill = CustomSkill.__new__(CustomSkill)
+        self.assertFalse(_overrides_load_data_files(skill))
+        self.assertTrue(_overrides_load_data_files(custom_skill))
+
     def test_skill_load_blacklisted(self):
         """Skill should not be loaded if it is blacklisted"""
         self.loader.config['skills']['blacklisted_skills'] = ['test_skill']
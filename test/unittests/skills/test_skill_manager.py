@@ -333,3 +333,73 @@ class TestSkillManager(MycroftUnitTestBase):
         self.skill_manager.skill_updater = updater_mock
         self.skill_manager._update_skills()
         updater_mock.update_skills.assert_called_once_with()
+
+    def _make_skill_dirs(self, *names):
+        skill_dirs = []
+        for name in names:
+            skill_dir = self.temp_dir.joinpath(name)
+            skill_dir.mkdir(parents=True)
+            skill_dir.joinpath('__init__.py').touch()
+            skill_dirs.append(str(skill_dir))
+        return skill_dirs
+
+    def _mock_loaders(self, events):
+        def create_loader(bus, skill_dir):
+            loader = Mock(spec=SkillLoader)
+            loader.skill_directory = skill_dir
+            loader.skill_id = path.basename(skill_dir)
+            loader.complete_load.side_effect = lambda: events.append(
+                (loader.skill_id, len(self.message_bus_mock.message_types))
+            )
+            return loader
+        return patch(self.mock_package + 'SkillLoader',
+                     side_effect=create_loader)
+
+    def test_load_skills_in_parallel(self):
+        skill_dirs = self._make_skill_dirs('skill_a', 'skill_b')
+        self.skill_manager.skill_loaders = {}
+        self.skill_manager.skills_config['load_threads'] = 2
+        events = []
+        with self._mock_loaders(events):
+            self.skill_manager._load_new_skills()
+
+        self.assertEqual(sorted(self.skill_manager.skill_loaders), skill_dirs)
+        for loader in self.skill_manager.skill_loaders.values():
+            loader.prepare_load.assert_called_once_with()
+            loader.complete_load.assert_called_once_with()
+            self.assertFalse(loader.load.called)
+
+    def test_initialized_after_critical_skills(self):
+        self._make_skill_dirs('skill_a', 'skill_b', 'skill_c')
+        self.skill_manager.skill_loaders = {}
+        self.skill_manager.skills_config['load_threads'] = 2
+        self.skill_manager.skills_config['critical_skills'] = ['skill_b']
+        events = []
+        with self._mock_loaders(events):
+            self.skill_manager._load_on_startup()
+
+        # The critical skill is registered first, initialized is sent
+        # before the other skills are registered
+        self.assertEqual(events[0], ('skill_b', 0))
+        self.assertEqual(sorted(events[1:]), [('skill_a', 1), ('skill_c', 1)])
+        self.assertListEqual(['mycroft.skills.initialized'],
+                             self.message_bus_mock.message_types)
+        self.assertTrue(self.skill_manager.is_all_loaded())
+        self.assertEqual(len(self.skill_manager.load_times), 3)
+
+    def test_reload_watched_skills(self):
+        self.skill_dir.mkdir(parents=True)
+        self.skill_dir.joinpath('__init__.py').touch()
+        watcher = Mock()
+        watcher.is_watching = True
+        watcher.pop_modified.return_value = []
+        self.skill_manager.skill_watcher = watcher
+        self.skill_loader_mock.reload_needed.return_value = True
+
+        # Unmodified skills are not checked
+        self.skill_manager._reload_modified_skills()
+        self.assertFalse(self.skill_loader_mock.reload_needed.called)
+
+        watcher.pop_modified.return_value = [str(self.skill_dir)]
+        self.skill_manager._reload_modified_skills()
+        self.skill_loader_mock.reload.assert_called_once_with()
@@ -0,0 +1,67 @@
+# Copyright 2019 Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Unit tests for the SkillWatcher class."""
+from os.path import join
+from unittest import TestCase
+from unittest.mock import patch
+
+from mycroft.skills.skill_watcher import is_ignored_file, SkillWatcher
+
+SKILLS_DIR = '/opt/mycroft/skills'
+
+
+class TestSkillWatcher(TestCase):
+    def setUp(self):
+        time_patch = patch('mycroft.skills.skill_watcher.monotonic')
+        self.addCleanup(time_patch.stop)
+        self.time_mock = time_patch.start()
+        self.time_mock.return_value = 100
+        self.watcher = SkillWatcher(SKILLS_DIR, delay=2)
+
+    def test_ignored_files(self):
+        self.assertTrue(is_ignored_file('__pycache__/foo.cpython-37.pyc'))
+        self.assertTrue(is_ignored_file('settings.json'))
+        self.assertTrue(is_ignored_file('.git/index'))
+        self.assertTrue(is_ignored_file('ui/main.qmlc'))
+        self.assertFalse(is_ignored_file('__init__.py'))
+        self.assertFalse(is_ignored_file('locale/en-us/yes.voc'))
+
+    def test_debounce(self):
+        skill_dir = join(SKILLS_DIR, 'test-skill')
+        self.watcher.file_changed(join(skill_dir, '__init__.py'))
+        self.time_mock.return_value = 101
+        self.watcher.file_changed(join(skill_dir, 'vocab/en-us/a.voc'))
+        self.time_mock.return_value = 102
+        self.assertTrue(self.watcher.is_settling(skill_dir))
+        self.assertListEqual([], self.watcher.pop_modified())
+
+        self.time_mock.return_value = 103
+        self.assertFalse(self.watcher.is_settling(skill_dir))
+        self.assertListEqual([skill_dir], self.watcher.pop_modified())
+        self.assertListEqual([], self.watcher.pop_modified())
+
+    def test_ignored_changes(self):
+        self.watcher.file_changed(join(SKILLS_DIR, 'test-skill/.git/HEAD'))
+        self.watcher.file_changed(join(SKILLS_DIR, 'test-skill'))
+        self.watcher.file_changed('/tmp/test-skill/__init__.py')
+        self.time_mock.return_value = 200
+        self.assertListEqual([], self.watcher.pop_modified())
+
+    def test_no_watchdog(self):
+        with patch.dict('sys.modules', {'watchdog': None,
+                                        'watchdog.events': None,
+                                        'watchdog.observers': None}):
+            self.assertFalse(self.watcher.start())
+        self.assertFalse(self.watcher.is_watching)
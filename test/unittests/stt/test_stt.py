@@ -268,3 +268,74 @@ class TestSTT(unittest.TestCase):
         stt = mycroft.stt.HoundifySTT()
         stt.execute(audio)
         self.assertTrue(stt.recognizer.recognize_houndify.called)
+
+    @patch('mycroft.stt.post')
+    @patch.object(Configuration, 'get')
+    def test_kaldi_stt_streaming(self, mock_get, mock_post):
+        mycroft.stt.Recognizer = MagicMock
+        config = base_config()
+        config.merge(
+            {
+                'stt': {
+                    'module': 'kaldi',
+                    'kaldi': {'uri': 'https://test.com'},
+                },
+                'lang': 'en-US'
+            })
+        mock_get.return_value = config
+
+        uploaded = []
+
+        def post(uri, data):
+            uploaded.extend(data)
+            response = MagicMock()
+            response.json.return_value = {
+                'hypotheses': [{'utterance': 'streamed text'}]
+            }
+            return response
+
+        mock_post.side_effect = post
+        stt = mycroft.stt.KaldiSTT()
+        self.assertTrue(stt.can_stream)
+        stt.stream_start()
+        stt.stream_data(b'\x01\x02')
+        stt.stream_data(b'\x03\x04')
+        audio = MagicMock()
+        self.assertEqual(stt.execute(audio), 'streamed text')
+        # wav header followed by the streamed chunks
+        self.assertEqual(uploaded[0][:4], b'RIFF')
+        self.assertEqual(uploaded[1:], [b'\x01\x02', b'\x03\x04'])
+        self.assertFalse(audio.get_wav_data.called)
+
+    @patch('mycroft.stt.post')
+    @patch.object(Configuration, 'get')
+    def test_kaldi_stt_streaming_fallback(self, mock_get, mock_post):
+        mycroft.stt.Recognizer = MagicMock
+        config = base_config()
+        config.merge(
+            {
+                'stt': {
+                    'module': 'kaldi',
+                    'kaldi': {'uri': 'https://test.com'},
+                },
+                'lang': 'en-US'
+            })
+        mock_get.return_value = config
+
+        response = MagicMock()
+        response.json.return_value = {
+            'hypotheses': [{'utterance': 'text'}]
+        }
+
+        def post(uri, data):
+            if not isinstance(data, bytes):
+                raise ConnectionError('stream failed')
+            return response
+
+        mock_post.side_effect = post
+        stt = mycroft.stt.KaldiSTT()
+        stt.stream_start()
+        stt.stream_data(b'\x01\x02')
+        audio = MagicMock()
+        audio.get_wav_data.return_value = b'wav'
+        self.assertEqual(stt.execute(audio), 'text')
@@ -0,0 +1,105 @@
+import os
+import unittest
+from tempfile import TemporaryDirectory
+from unittest import mock
+
+from mycroft.tts.cache import TTSCache
+
+
+def write_file(path, size):
+    with open(path, 'wb') as f:
+        f.write(b'\0' * size)
+
+
+class TestTTSCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp = TemporaryDirectory()
+        patcher = mock.patch('mycroft.util.get_cache_directory',
+                             return_value=self.tmp.name)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(self.tmp.cleanup)
+
+    def add(self, cache, key, size=10, phonemes=None):
+        path = cache.audio_file(key, 'wav')
+        write_file(path, size)
+        if phonemes:
+            with open(cache.phoneme_file(key), 'w') as f:
+                f.write(phonemes)
+        cache.add(key, path, phonemes)
+        return path
+
+    def test_hit_miss(self):
+        cache = TTSCache('test')
+        self.assertIsNone(cache.get('a'))
+        path = self.add(cache, 'a', phonemes='HH AH0')
+        entry = cache.get('a')
+        self.assertEqual(entry.audio_file, path)
+        self.assertEqual(entry.phonemes, 'HH AH0')
+        stats = cache.stats()
+        self.assertEqual(stats['hits'], 1)
+        self.assertEqual(stats['misses'], 1)
+        self.assertEqual(stats['size'], 10)
+
+    def test_scan_existing_files(self):
+        write_file(os.path.join(self.tmp.name, 'a.wav'), 5)
+        write_file(os.path.join(self.tmp.name, 'b.wav'), 7)
+        write_file(os.path.join(self.tmp.name, 'b.pho'), 1)
+        cache = TTSCache('test')
+        self.assertFalse(cache.get('a').has_phonemes)
+        self.assertTrue(cache.get('b').has_phonemes)
+        self.assertEqual(cache.size, 12)
+
+    def test_scan_skips_directories(self):
+        os.mkdir(os.path.join(self.tmp.name, 'c.wav'))
+        write_file(os.path.join(self.tmp.name, 'a.wav'), 5)
+        cache = TTSCache('test')
+        self.assertIsNone(cache.get('c'))
+        self.assertEqual(len(cache.entries), 1)
+
+    def test_lru_eviction(self):
+        cache = TTSCache('test', max_size=30)
+        a = self.add(cache, 'a', phonemes='A')
+        b = self.add(cache, 'b')
+        self.add(cache, 'c')
+        cache.get('a')  # b is now the least recently used
+        self.add(cache, 'd')
+        self.assertIsNone(cache.get('b'))
+        self.assertFalse(os.path.exists(b))
+        self.assertTrue(os.path.exists(a))
+        self.assertTrue(os.path.exists(cache.phoneme_file('a')))
+        self.assertEqual(cache.size, 30)
+        self.assertEqual(cache.stats()['evictions'], 1)
+
+    def test_lfu_eviction(self):
+        cache = TTSCache('test', max_size=30, policy='lfu')
+        self.add(cache, 'a')
+        self.add(cache, 'b')
+        self.add(cache, 'c')
+        cache.get('a')
+        cache.get('a')
+        cache.get('c')
+        cache.get('b')
+        cache.get('c')
+        self.add(cache, 'd')
+        self.assertIsNone(cache.get('b'))
+        self.assertIsNotNone(cache.get('a'))
+
+    def test_new_entry_is_kept(self):
+        cache = TTSCache('test', max_size=5)
+        path = self.add(cache, 'a', size=10)
+        self.assertIsNotNone(cache.get('a'))
+        self.assertTrue(os.path.exists(path))
+
+    @mock.patch('mycroft.tts.cache.psutil')
+    def test_curate(self, mock_psutil):
+        cache = TTSCache('test', min_free_percent=100, min_free_disk=1)
+        a = self.add(cache, 'a', phonemes='A')
+        self.add(cache, 'b')
+        mb = 1024 * 1024
+        mock_psutil.disk_usage.return_value = mock.Mock(
+            percent=99.0, free=mb - 5, total=100 * mb)
+        cache.curate()
+        self.assertFalse(os.path.exists(a))
+        self.assertFalse(os.path.exists(cache.phoneme_file('a')))
+        self.assertIsNotNone(cache.get('b'))
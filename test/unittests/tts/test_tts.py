@@ -1,4 +1,8 @@
+import os
 import unittest
+from queue import Queue
+from tempfile import TemporaryDirectory
+from unittest import mock
 
 import mycroft.tts
 
@@ -77,3 +81,98 @@ class TestTTS(unittest.TestCase):
 
         self.assertEqual(mycroft.tts.TTS.remove_ssml(sentence),
                          sentence_no_ssml)
+
+
+class TestClearCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp = TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        patcher = mock.patch('mycroft.util.get_cache_directory',
+                             return_value=self.tmp.name)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_clear_cache_clears_index(self):
+        class TestTTS(mycroft.tts.TTS):
+            def execute(self, sentence, ident=None):
+                pass
+
+        tts = TestTTS('en-US', {}, mock.Mock())
+        self.addCleanup(tts.playback.stop)
+        path = tts.cache.audio_file('key', 'wav')
+        with open(path, 'wb') as f:
+            f.write(b'audio')
+        tts.cache.add('key', path)
+
+        tts.clear_cache()
+        self.assertFalse(os.path.exists(path))
+        self.assertIsNone(tts.cache.get('key'))
+
+
+@mock.patch('mycroft.tts.play_mp3')
+@mock.patch('mycroft.tts.play_wav')
+@mock.patch('mycroft.tts.AudioSink')
+class TestPlaybackThread(unittest.TestCase):
+    def create_thread(self, tts_config=None):
+        if tts_config is None:
+            tts_config = {'playback': {'mode': 'stream'}}
+        with mock.patch('mycroft.tts.Configuration.get',
+                        return_value={'tts': tts_config}):
+            thread = mycroft.tts.PlaybackThread(Queue())
+        thread.enclosure = mock.Mock()
+        return thread
+
+    def test_stream_wav(self, mock_sink, mock_play_wav, mock_play_mp3):
+        thread = self.create_thread()
+        mock_sink.assert_called_once_with(None, 1024)
+        thread.play('wav', 'sentence.wav', ['visemes'])
+        mock_sink.return_value.play_wav.assert_called_once_with(
+            'sentence.wav')
+        mock_play_wav.assert_not_called()
+        thread.enclosure.mouth_viseme.assert_called_once_with(
+            mock.ANY, ['visemes'])
+
+    def test_fallback(self, mock_sink, mock_play_wav, mock_play_mp3):
+        thread = self.create_thread()
+        mock_sink.return_value.play_wav.return_value = False
+        thread.play('wav', 'sentence.wav', ['visemes'])
+        mock_play_wav.assert_called_once_with('sentence.wav',
+                                              environment=None)
+        mock_play_wav.return_value.wait.assert_called_once_with()
+        self.assertEqual(thread.enclosure.mouth_viseme.call_count, 1)
+
+        thread.play('mp3', 'sentence.mp3', None)
+        mock_play_mp3.assert_called_once_with('sentence.mp3',
+                                              environment=None)
+
+    def test_device_error(self, mock_sink, mock_play_wav, mock_play_mp3):
+        thread = self.create_thread()
+        sink = mock_sink.return_value
+        sink.play_wav.side_effect = OSError('Device unplugged')
+        with self.assertRaises(OSError):
+            thread.play('wav', 'sentence.wav', None)
+        sink.close.assert_called_once_with()
+        thread.play('wav', 'sentence.wav', None)
+        self.assertEqual(sink.play_wav.call_count, 1)
+        mock_play_wav.assert_called_once_with('sentence.wav',
+                                              environment=None)
+
+    def test_subprocess_mode(self, mock_sink, mock_play_wav, mock_play_mp3):
+        thread = self.create_thread({})
+        self.assertIsNone(thread.sink)
+        thread = self.create_thread({'playback': {'mode': 'subprocess'}})
+        self.assertIsNone(thread.sink)
+        thread = self.create_thread({'pulse_duck': True,
+                                     'playback': {'mode': 'stream'}})
+        self.assertIsNone(thread.sink)
+        thread.play('wav', 'sentence.wav', None)
+        mock_play_wav.assert_called_once_with(
+            'sentence.wav', environment=mycroft.tts._TTS_ENV)
+        mock_sink.assert_not_called()
+
+    def test_clear_stops_sink(self, mock_sink, mock_play_wav, mock_play_mp3):
+        thread = self.create_thread()
+        thread.queue.put(('wav', 'sentence.wav', None, 'ident'))
+        thread.clear()
+        self.assertTrue(thread.queue.empty())
+        mock_sink.return_value.stop.assert_called_once_with()
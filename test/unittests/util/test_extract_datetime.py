@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright 2019 Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import json
+import unittest
+from datetime import datetime, time
+from os.path import dirname, join
+
+from mycroft.util.lang.parse_en import extract_datetime_en
+
+
+def load_corpus():
+    """Load datetime_corpus.json.
+
+    Entries are [text, reference datetime, default time, result] with the
+    result of the previous extract_datetime_en, either null or
+    [extracted datetime, remaining text].
+    """
+    with open(join(dirname(__file__), 'datetime_corpus.json'),
+              encoding='utf-8') as f:
+        corpus = json.load(f)
+    return [(text, datetime.strptime(now, '%Y-%m-%dT%H:%M:%S'),
+             time(*map(int, default_time.split(':')[:2]))
+             if default_time else None,
+             result)
+            for text, now, default_time, result in corpus]
+
+
+class TestExtractDatetimeCorpus(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.corpus = load_corpus()
+
+    def test_extract_datetime_en(self):
+        for text, now, default_time, expected in self.corpus:
+            result = extract_datetime_en(text, now, default_time)
+            if result is not None:
+                result = [result[0].isoformat(), result[1]]
+            self.assertEqual(result, expected,
+                             '{!r} at {}'.format(text, now))
+
+
+if __name__ == "__main__":
+    unittest.main()
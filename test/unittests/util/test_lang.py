@@ -0,0 +1,76 @@
+# Copyright 2019 Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import unittest
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import mycroft.util.parse
+from mycroft.util.lang import LanguageFunctions
+
+
+def normalize_xx(text, remove_articles):
+    return text
+
+
+@patch('mycroft.util.lang.import_module',
+       return_value=SimpleNamespace(normalize_xx=normalize_xx))
+class TestLanguageFunctions(unittest.TestCase):
+    def test_lazy_import(self, mock_import):
+        functions = LanguageFunctions('parse', ['xx'])
+        mock_import.assert_not_called()
+        self.assertIs(functions.get('normalize', 'xx'), normalize_xx)
+        self.assertIs(functions.get('normalize', 'xx'), normalize_xx)
+        mock_import.assert_called_once_with('mycroft.util.lang.parse_xx')
+
+    def test_missing(self, mock_import):
+        functions = LanguageFunctions('parse', ['xx'])
+        self.assertIsNone(functions.get('normalize', 'yy'))
+        mock_import.assert_not_called()
+        self.assertIsNone(functions.get('extract_datetime', 'xx'))
+
+    def test_lookup(self, mock_import):
+        functions = LanguageFunctions('parse', ['xx'])
+        self.assertIs(functions.lookup('normalize_xx'), normalize_xx)
+        self.assertIsNone(functions.lookup('normalize'))
+        self.assertIsNone(functions.lookup('_xx'))
+
+
+@patch('mycroft.util.lang.import_module',
+       return_value=SimpleNamespace(normalize_xx=normalize_xx,
+                                    _normalize_xx=normalize_xx,
+                                    normalize=normalize_xx))
+class TestAllFunctions(unittest.TestCase):
+    def test_all_functions(self, mock_import):
+        functions = LanguageFunctions('parse', ['xx'])
+        self.assertEqual(functions.all_functions(),
+                         {'normalize_xx': normalize_xx})
+        mock_import.assert_called_once_with('mycroft.util.lang.parse_xx')
+
+
+class TestModuleAttributes(unittest.TestCase):
+    def test_language_function(self):
+        from mycroft.util.lang.parse_en import extract_datetime_en
+        self.assertIs(mycroft.util.parse.extract_datetime_en,
+                      extract_datetime_en)
+
+    def test_missing_attribute(self):
+        with self.assertRaises(AttributeError):
+            mycroft.util.parse.extract_datetime_xx
+
+    def test_all_language_functions(self):
+        functions = mycroft.util.parse._functions.all_functions()
+        self.assertIn('extract_datetime_de', functions)
+        for name, function in functions.items():
+            self.assertIs(getattr(mycroft.util.parse, name), function)
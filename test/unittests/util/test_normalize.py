@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright 2019 Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import json
+import unittest
+from os.path import dirname, join
+
+from mycroft.util.lang.parse_common import Normalizer
+from mycroft.util.parse import normalize, _functions
+
+
+class TestNormalizeCorpus(unittest.TestCase):
+    """Normalized strings must match the output of the previous
+    normalizers, stored in normalize_corpus.json as
+    [lang, remove_articles, text, normalized text] entries.
+    """
+    @classmethod
+    def setUpClass(cls):
+        with open(join(dirname(__file__), 'normalize_corpus.json'),
+                  encoding='utf-8') as f:
+            cls.corpus = json.load(f)
+
+    def test_normalize(self):
+        for lang, remove_articles, text, expected in self.corpus:
+            self.assertEqual(normalize(text, lang, remove_articles), expected,
+                             '{}: {!r}'.format(lang, text))
+
+    def test_language_normalizers(self):
+        # Bypass the cache of normalize()
+        for lang, remove_articles, text, expected in self.corpus:
+            normalize_lang = _functions.get('normalize', lang)
+            self.assertEqual(normalize_lang(text, remove_articles),
+                             expected, '{}: {!r}'.format(lang, text))
+
+
+class TestNormalizer(unittest.TestCase):
+    def test_replacements(self):
+        normalizer = Normalizer([{'a': 'b', 'c': 'd'}, {'b': 'e'}])
+        self.assertEqual(normalizer.normalize('a  c b x', False), 'e d e x')
+
+    def test_articles(self):
+        normalizer = Normalizer([{'the': 'x', 'one': '1'}],
+                                articles=['the'])
+        self.assertEqual(normalizer.normalize('the one', True), '1')
+        self.assertEqual(normalizer.normalize('the one', False), 'x 1')
+
+    def test_empty(self):
+        normalizer = Normalizer()
+        self.assertEqual(normalizer.normalize(' \t', True), '')
+        self.assertEqual(normalizer.normalize('a\tb ', True), 'a b')
+
+
+if __name__ == "__main__":
+    unittest.main()
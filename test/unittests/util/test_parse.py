@@ -20,6 +20,7 @@ from datetime import datetime, timedelta
 from mycroft.util.parse import extract_datetime
 from mycroft.util.parse import extract_duration
 from mycroft.util.parse import extract_number, extract_numbers
+from mycroft.util.parse import extract_numbers_many
 from mycroft.util.parse import fuzzy_match
 from mycroft.util.parse import get_gender
 from mycroft.util.parse import match_one
@@ -616,6 +617,26 @@ class TestNormalize(unittest.TestCase):
                                          " half test"),
                          [7.0, 8.0, 9.5])
 
+    def test_extract_numbers_many(self):
+        texts = ["two beers for two bears", "no numbers", "six trillion",
+                 "two beers for two bears", "third one"]
+        expected = [extract_numbers(text) for text in texts]
+        self.assertEqual(extract_numbers_many(texts), expected)
+        self.assertEqual(extract_numbers_many(iter(texts), processes=2),
+                         expected)
+        self.assertEqual(
+            extract_numbers_many(texts, short_scale=False, ordinals=True),
+            [extract_numbers(text, short_scale=False, ordinals=True)
+             for text in texts])
+        self.assertEqual(extract_numbers_many([]), [])
+        self.assertEqual(extract_numbers_many(texts, lang='xx'),
+                         [[]] * len(texts))
+
+    def test_extract_numbers_many_copies(self):
+        first, second = extract_numbers_many(["two", "two"])
+        first.append(3)
+        self.assertEqual(second, [2])
+
     def test_contractions(self):
         self.assertEqual(normalize("ain't"), "is not")
         self.assertEqual(normalize("aren't"), "are not")